@@ -0,0 +1,37 @@
+"""Add content_hash to sources for change detection
+
+Revision ID: d7f3a9125c84
+Revises: 8b2d4c71e5f9
+Create Date: 2026-10-18 13:20:48.117302
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7f3a9125c84"
+down_revision: str | Sequence[str] | None = "8b2d4c71e5f9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "sources",
+        sa.Column("content_hash", sa.String(length=64), nullable=True),
+    )
+    # Заполняем хеш так же, как compute_content_hash (разделитель chr(31)),
+    # чтобы первая повторная загрузка уже ничего не переписывала
+    op.execute(
+        "UPDATE sources SET content_hash = encode("
+        "sha256(convert_to(title || chr(31) || content, 'UTF8')), 'hex')"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("sources", "content_hash")
@@ -1,10 +1,15 @@
+from dataclasses import asdict
+
 from src.application.dto.responses import (
     AnswerResponse,
+    AnswerTimingsResponse,
+    IngestionJobResponse,
     QuestionAnswerResponse,
     QuestionResponse,
+    SourceLoadFailure,
     SourceResponse,
 )
-from src.domain.entities import Answer, Question, Source
+from src.domain.entities import Answer, IngestionJob, Question, Source
 
 
 class ResponseConverter:
@@ -31,22 +36,57 @@ class ResponseConverter:
         )
 
     @staticmethod
-    def answer_to_response(answer: Answer) -> AnswerResponse:
+    def ingestion_job_to_response(job: IngestionJob) -> IngestionJobResponse:
+        """Convert domain IngestionJob to response schema."""
+        return IngestionJobResponse(
+            id=job.id,
+            status=job.status,
+            total=job.total,
+            processed=job.processed,
+            fetched=job.fetched,
+            parsed=job.parsed,
+            saved=job.saved,
+            unchanged=job.unchanged,
+            failed=job.failed,
+            failures=[
+                SourceLoadFailure(url=url, reason=reason)
+                for url, reason in job.errors.items()
+            ],
+            error=job.error,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+        )
+
+    @staticmethod
+    def answer_to_response(
+        answer: Answer, include_timings: bool = False
+    ) -> AnswerResponse:
         """Convert domain Answer to response schema."""
+        timings = (
+            AnswerTimingsResponse(**asdict(answer.timings))
+            if include_timings and answer.timings
+            else None
+        )
         return AnswerResponse(
             id=answer.id,
             question_id=answer.question_id,
             text=answer.text,
             created_at=answer.created_at,
             processing_time_ms=answer.processing_time_ms,
+            time_to_first_token_ms=answer.time_to_first_token_ms,
+            timings=timings,
+            degraded=answer.degraded,
         )
 
     @staticmethod
     def question_answer_to_response(
-        question: Question, answer: Answer
+        question: Question, answer: Answer, include_timings: bool = False
     ) -> QuestionAnswerResponse:
         """Convert domain Question and Answer to response schema."""
         return QuestionAnswerResponse(
             question=ResponseConverter.question_to_response(question),
-            answer=ResponseConverter.answer_to_response(answer),
+            answer=ResponseConverter.answer_to_response(
+                answer, include_timings=include_timings
+            ),
         )
@@ -7,3 +7,7 @@ class QuestionRequest(BaseModel):
     question: str = Field(
         min_length=1, max_length=1000, description="The question to ask"
     )
+    include_timings: bool = Field(
+        default=False,
+        description="Return per-stage latency breakdown with the answer",
+    )
@@ -5,3 +5,10 @@ class LoadSourcesRequest(BaseModel):
     """Request object for loading sources."""
 
     urls: list[str] = Field(min_length=1, description="List of URLs to load")
+    run_in_background: bool = Field(
+        default=False,
+        description=(
+            "Load sources in a background job and return its ID "
+            "instead of waiting for the result"
+        ),
+    )
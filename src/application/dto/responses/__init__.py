@@ -1,14 +1,22 @@
-from .answer import AnswerResponse
+from .answer import AnswerResponse, AnswerTimingsResponse
 from .error import ErrorResponse
 from .question import QuestionResponse
 from .question_answer import QuestionAnswerResponse
-from .source import LoadSourcesResponse, SourceResponse
+from .source import (
+    IngestionJobResponse,
+    LoadSourcesResponse,
+    SourceLoadFailure,
+    SourceResponse,
+)
 
 __all__ = [
     "AnswerResponse",
+    "AnswerTimingsResponse",
     "ErrorResponse",
+    "IngestionJobResponse",
     "LoadSourcesResponse",
     "QuestionAnswerResponse",
     "QuestionResponse",
+    "SourceLoadFailure",
     "SourceResponse",
 ]
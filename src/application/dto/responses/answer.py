@@ -4,6 +4,24 @@ from uuid import UUID
 from pydantic import BaseModel
 
 
+class AnswerTimingsResponse(BaseModel):
+    """Response object for per-stage answer latency (milliseconds)."""
+
+    db_write_question: float | None = None
+    load_sources: float | None = None
+    matching: float | None = None
+    prompt_build: float | None = None
+    llm: float | None = None
+    db_write_answer: float | None = None
+    db_write: float | None = None
+    prompt_tokens: int | None = None
+    context_tokens: int | None = None
+    response_tokens: int | None = None
+    llm_cached: bool = False
+    llm_coalesced: bool = False
+    llm_extractive: bool = False
+
+
 class AnswerResponse(BaseModel):
     """Response object for answer information."""
 
@@ -12,3 +30,6 @@ class AnswerResponse(BaseModel):
     text: str
     created_at: datetime
     processing_time_ms: int
+    time_to_first_token_ms: int | None = None
+    timings: AnswerTimingsResponse | None = None
+    degraded: bool = False
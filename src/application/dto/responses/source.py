@@ -14,9 +14,47 @@ class SourceResponse(BaseModel):
     updated_at: datetime | None = None
 
 
+class SourceLoadFailure(BaseModel):
+    """Response object for a URL that failed to load."""
+
+    url: str
+    reason: str
+
+
 class LoadSourcesResponse(BaseModel):
     """Response object for loaded sources."""
 
+    # Созданные и обновленные источники
     sources: list[SourceResponse]
+    # Успешно загруженные URL, включая неизмененные
     loaded_count: int
     failed_count: int
+    # Скачанные и разобранные страницы, включая неизмененные (304)
+    parsed_count: int = 0
+    # Страницы, не изменившиеся с прошлой загрузки (304)
+    not_modified_count: int = 0
+    created_count: int = 0
+    updated_count: int = 0
+    unchanged_count: int = 0
+    failures: list[SourceLoadFailure] = []
+
+
+class IngestionJobResponse(BaseModel):
+    """Response object for a background ingestion job."""
+
+    id: UUID
+    # pending, running, completed, failed
+    status: str
+    total: int
+    processed: int
+    # Скачанные страницы, включая неизмененные (304)
+    fetched: int
+    parsed: int
+    saved: int
+    unchanged: int
+    failed: int
+    failures: list[SourceLoadFailure] = []
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
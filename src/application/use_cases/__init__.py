@@ -3,11 +3,13 @@ from .create_question import CreateQuestionUseCase
 from .find_relevant_sources import FindRelevantSourcesUseCase
 from .generate_answer import GenerateAnswerUseCase
 from .load_sources import LoadSourcesUseCase
+from .run_ingestion_jobs import IngestionJobRunner
 
 __all__ = [
     "AskQuestionUseCase",
     "CreateQuestionUseCase",
     "FindRelevantSourcesUseCase",
     "GenerateAnswerUseCase",
+    "IngestionJobRunner",
     "LoadSourcesUseCase",
 ]
@@ -1,39 +1,111 @@
+from collections.abc import AsyncIterator
+
 from src.application.dto.converters import ResponseConverter
 from src.application.dto.responses import QuestionAnswerResponse
 from src.application.use_cases.create_question import CreateQuestionUseCase
 from src.application.use_cases.find_relevant_sources import (
     FindRelevantSourcesUseCase,
 )
-from src.application.use_cases.generate_answer import GenerateAnswerUseCase
+from src.application.use_cases.generate_answer import (
+    GenerateAnswerUseCase,
+    with_timings,
+)
+from src.core.timing import StageTimer
+from src.domain.entities import Answer, Question, Source
+from src.domain.repositories import QuestionAnswerRepositoryInterface
 
 
 class AskQuestionUseCase:
-    """Use case for asking a question and getting an answer."""
+    """Use case for asking a question and getting an answer.
+
+    The question and the answer are saved together at the end, in one
+    transaction, instead of a separate write for each of them.
+    """
 
     def __init__(
         self,
         create_question_use_case: CreateQuestionUseCase,
         find_relevant_sources_use_case: FindRelevantSourcesUseCase,
         generate_answer_use_case: GenerateAnswerUseCase,
+        question_answer_repository: QuestionAnswerRepositoryInterface,
     ):
         self.create_question_use_case = create_question_use_case
         self.find_relevant_sources_use_case = find_relevant_sources_use_case
         self.generate_answer_use_case = generate_answer_use_case
+        self.question_answer_repository = question_answer_repository
 
-    async def execute(self, question_text: str) -> QuestionAnswerResponse:
+    async def execute(
+        self, question_text: str, include_timings: bool = False
+    ) -> QuestionAnswerResponse:
         """Execute the use case and return response DTO."""
-        # Create question
-        question = await self.create_question_use_case.execute(question_text)
+        timer = StageTimer()
+
+        # Create question (saved together with the answer)
+        question = self.create_question_use_case.build(question_text)
 
         # Find relevant sources
         relevant_sources = await self.find_relevant_sources_use_case.execute(
-            question_text
+            question_text, timer
         )
 
         # Generate answer using relevant sources
-        answer = await self.generate_answer_use_case.execute(
-            question, relevant_sources
+        answer = await self.generate_answer_use_case.generate(
+            question, relevant_sources, timer
         )
+        question, answer = await self._save(question, answer, timer)
 
         # Convert to response DTO
-        return ResponseConverter.question_answer_to_response(question, answer)
+        return ResponseConverter.question_answer_to_response(
+            question, answer, include_timings=include_timings
+        )
+
+    async def stream(
+        self, question_text: str, include_timings: bool = False
+    ) -> AsyncIterator[str | QuestionAnswerResponse]:
+        """Prepare the question and return a stream of answer events.
+
+        Sources are found before streaming starts, so these errors are
+        still reported as regular responses. The stream yields answer text
+        chunks and finally the response DTO.
+        """
+        timer = StageTimer()
+        question = self.create_question_use_case.build(question_text)
+        relevant_sources = await self.find_relevant_sources_use_case.execute(
+            question_text, timer
+        )
+        return self._stream_answer(
+            question, relevant_sources, timer, include_timings
+        )
+
+    async def _stream_answer(
+        self,
+        question: Question,
+        sources: list[Source],
+        timer: StageTimer,
+        include_timings: bool,
+    ) -> AsyncIterator[str | QuestionAnswerResponse]:
+        """Forward answer chunks, then save and convert the answer."""
+        async for event in self.generate_answer_use_case.generate_stream(
+            question, sources, timer
+        ):
+            if isinstance(event, str):
+                yield event
+                continue
+
+            # Сохраняем ответ только после завершения потока
+            saved_question, answer = await self._save(question, event, timer)
+            yield ResponseConverter.question_answer_to_response(
+                saved_question, answer, include_timings=include_timings
+            )
+
+    async def _save(
+        self, question: Question, answer: Answer, timer: StageTimer
+    ) -> tuple[Question, Answer]:
+        """Save question and answer in a single transaction."""
+        with timer.measure("db_write"):
+            question, answer = await self.question_answer_repository.create(
+                question, answer
+            )
+
+        # Время записи известно только после сохранения
+        return question, with_timings(answer, timer)
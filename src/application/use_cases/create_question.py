@@ -13,10 +13,13 @@ class CreateQuestionUseCase:
 
     async def execute(self, question_text: str) -> Question:
         """Create and save a new question."""
-        question = Question(
+        return await self.question_repository.create(self.build(question_text))
+
+    @staticmethod
+    def build(question_text: str) -> Question:
+        """Create a new question without saving it."""
+        return Question(
             id=uuid.uuid4(),
             text=question_text,
             created_at=datetime.now(UTC),
         )
-
-        return await self.question_repository.create(question)
@@ -1,6 +1,9 @@
+from src.core.timing import StageTimer
 from src.domain.entities import Source
-from src.domain.repositories import SourceRepositoryInterface
-from src.domain.services import SourceMatchingServiceInterface
+from src.domain.services import (
+    SourceCorpusServiceInterface,
+    SourceMatchingServiceInterface,
+)
 
 
 class FindRelevantSourcesUseCase:
@@ -8,18 +11,27 @@ class FindRelevantSourcesUseCase:
 
     def __init__(
         self,
-        source_repository: SourceRepositoryInterface,
+        source_corpus: SourceCorpusServiceInterface,
         source_matching_service: SourceMatchingServiceInterface,
     ):
-        self.source_repository = source_repository
+        self.source_corpus = source_corpus
         self.source_matching_service = source_matching_service
 
-    async def execute(self, question_text: str) -> list[Source]:
+    async def execute(
+        self, question_text: str, timer: StageTimer | None = None
+    ) -> list[Source]:
         """Find relevant sources for a question."""
-        # Get all sources from the database
-        all_sources = await self.source_repository.get_all()
+        timer = timer or StageTimer()
+
+        # Get sources from the in-memory corpus snapshot, unless the
+        # matching service searches the database itself
+        all_sources: list[Source] = []
+        if self.source_matching_service.requires_corpus:
+            with timer.measure("load_sources"):
+                all_sources = await self.source_corpus.get_sources()
 
         # Find relevant sources using matching service
-        return await self.source_matching_service.find_relevant_sources(
-            question_text, all_sources
-        )
+        with timer.measure("matching"):
+            return await self.source_matching_service.find_relevant_sources(
+                question_text, all_sources
+            )
@@ -1,8 +1,17 @@
 import time
 import uuid
+from collections.abc import AsyncIterator
+from dataclasses import asdict, replace
 from datetime import UTC, datetime
 
-from src.domain.entities import Answer, Question, Source
+from src.core.timing import StageTimer
+from src.domain.entities import (
+    Answer,
+    AnswerTimings,
+    LLMCompletion,
+    Question,
+    Source,
+)
 from src.domain.repositories import (
     AnswerRepositoryInterface,
 )
@@ -23,27 +32,107 @@ class GenerateAnswerUseCase:
         self.llm_service = llm_service
 
     async def execute(
-        self, question: Question, sources: list[Source] | None = None
+        self,
+        question: Question,
+        sources: list[Source] | None = None,
+        timer: StageTimer | None = None,
     ) -> Answer:
         """Generate and save answer for a question."""
+        timer = timer or StageTimer()
+        answer = await self.generate(question, sources, timer)
+
+        with timer.measure("db_write_answer"):
+            saved = await self.answer_repository.create(answer)
+
+        # Время записи ответа известно только после сохранения
+        return with_timings(saved, timer)
+
+    async def generate(
+        self,
+        question: Question,
+        sources: list[Source] | None = None,
+        timer: StageTimer | None = None,
+    ) -> Answer:
+        """Generate answer for a question without saving it."""
+        timer = timer or StageTimer()
         start_time = time.time()
 
         # Generate answer with or without sources
         if sources:
-            answer_text = await self.llm_service.generate_answer_with_sources(
+            completion = await self.llm_service.generate_answer_with_sources(
                 question.text, sources
             )
         else:
-            answer_text = await self.llm_service.generate_answer(question.text)
+            completion = await self.llm_service.generate_answer(question.text)
+
+        timer.record("prompt_build", completion.prompt_build_ms)
+        timer.record("llm", completion.llm_ms)
 
         # Create answer
         processing_time = int((time.time() - start_time) * 1000)
-        return await self.answer_repository.create(
-            Answer(
-                id=uuid.uuid4(),
-                question_id=question.id,
-                text=answer_text,
-                created_at=datetime.now(UTC),
-                processing_time_ms=processing_time,
-            )
+        return Answer(
+            id=uuid.uuid4(),
+            question_id=question.id,
+            text=completion.text,
+            created_at=datetime.now(UTC),
+            processing_time_ms=processing_time,
+            timings=build_timings(timer, completion),
+            degraded=completion.degraded,
         )
+
+    async def generate_stream(
+        self,
+        question: Question,
+        sources: list[Source] | None = None,
+        timer: StageTimer | None = None,
+    ) -> AsyncIterator[str | Answer]:
+        """Stream answer chunks, then yield the answer (not saved)."""
+        timer = timer or StageTimer()
+        start_time = time.time()
+        time_to_first_token: int | None = None
+        chunks: list[str] = []
+
+        with timer.measure("llm"):
+            async for chunk in self.llm_service.stream_answer(
+                question.text, sources
+            ):
+                if time_to_first_token is None:
+                    time_to_first_token = int(
+                        (time.time() - start_time) * 1000
+                    )
+                chunks.append(chunk)
+                yield chunk
+
+        processing_time = int((time.time() - start_time) * 1000)
+        yield Answer(
+            id=uuid.uuid4(),
+            question_id=question.id,
+            text="".join(chunks),
+            created_at=datetime.now(UTC),
+            processing_time_ms=processing_time,
+            time_to_first_token_ms=time_to_first_token,
+            timings=build_timings(timer),
+        )
+
+
+def build_timings(
+    timer: StageTimer, completion: LLMCompletion | None = None
+) -> AnswerTimings:
+    """Combine stage durations with LLM usage."""
+    return AnswerTimings(
+        **timer.durations,
+        prompt_tokens=completion.prompt_tokens if completion else None,
+        context_tokens=completion.context_tokens if completion else None,
+        response_tokens=completion.response_tokens if completion else None,
+        llm_cached=completion.cached if completion else False,
+        llm_coalesced=completion.coalesced if completion else False,
+        llm_extractive=completion.extractive if completion else False,
+    )
+
+
+def with_timings(answer: Answer, timer: StageTimer) -> Answer:
+    """Add stages measured after the answer was built to its timings."""
+    if answer.timings is None:
+        return answer
+    timings = {**asdict(answer.timings), **timer.durations}
+    return replace(answer, timings=AnswerTimings(**timings))
@@ -1,85 +1,226 @@
+import asyncio
 import logging
+from contextlib import aclosing
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 
 from src.application.dto.converters import ResponseConverter
-from src.application.dto.responses import LoadSourcesResponse
-from src.domain.entities import Source
+from src.application.dto.responses import (
+    LoadSourcesResponse,
+    SourceLoadFailure,
+    SourceResponse,
+)
+from src.domain.entities import (
+    CacheValidators,
+    Source,
+    compute_content_hash,
+    split_into_passages,
+)
 from src.domain.repositories import SourceRepositoryInterface
-from src.domain.services import ContentParsingServiceInterface
+from src.domain.services import (
+    ContentParsingServiceInterface,
+    SourceCorpusServiceInterface,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _LoadProgress:
+    """Counters accumulated by the pipeline stages."""
+
+    parsed: int = 0
+    not_modified: int = 0
+    parsing_failed: int = 0
+    save_failed: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    sources: list[SourceResponse] = field(default_factory=list)
+    failures: list[SourceLoadFailure] = field(default_factory=list)
+
+
 class LoadSourcesUseCase:
-    """Use case for loading sources from URLs."""
+    """Use case for loading sources from URLs.
+
+    Loading is a pipeline: pages are parsed as they are downloaded,
+    collected into batches of ``write_batch_size`` and upserted by a
+    writer task while the next pages are still being fetched. At most
+    ``queue_size`` batches wait for the writer, so memory stays bounded
+    regardless of the number of URLs. Saved sources are split into
+    overlapping passages, which are stored with them for retrieval.
+    """
 
     def __init__(
         self,
         source_repository: SourceRepositoryInterface,
         content_parsing_service: ContentParsingServiceInterface,
+        source_corpus: SourceCorpusServiceInterface | None = None,
+        *,
+        write_batch_size: int = 100,
+        queue_size: int = 2,
+        passage_size: int = 1000,
+        passage_overlap: int = 200,
     ):
         self.source_repository = source_repository
         self.content_parsing_service = content_parsing_service
-
-    async def execute(self, urls: list[str]) -> LoadSourcesResponse:
-        """Execute the use case and return response DTO."""
+        self.source_corpus = source_corpus
+        self.write_batch_size = write_batch_size
+        self.queue_size = queue_size
+        self.passage_size = passage_size
+        self.passage_overlap = passage_overlap
+
+    async def execute(
+        self, urls: list[str], refresh_corpus: bool = True
+    ) -> LoadSourcesResponse:
+        """Execute the use case and return response DTO.
+
+        Background jobs load URLs in chunks and pass
+        ``refresh_corpus=False`` to rebuild the corpus once at the end.
+        """
+        # Повторяющиеся URL загружаем один раз
+        urls = list(dict.fromkeys(urls))
         logger.info("Starting with %d URLs", len(urls))
         logger.debug("URLs: %s...", urls[:3])  # Show first 3 URLs
 
-        # Parse sources from URLs
-        parsed_sources = await self.content_parsing_service.parse_urls(urls)
-        logger.info("Parsed %d sources", len(parsed_sources))
-
-        # Calculate parsing failures
-        parsing_failed_count = len(urls) - len(parsed_sources)
-
-        # Save sources to repository
-        saved_sources: list[Source] = []
-        save_failed_count = 0
-
-        for source in parsed_sources:
-            try:
-                logger.debug("Upserting source: %s", source.url)
-
-                # Create new source with updated timestamp
-                updated_source = Source(
-                    id=source.id,
-                    url=source.url,
-                    title=source.title,
-                    content=source.content,
-                    created_at=source.created_at,
-                    updated_at=datetime.now(UTC),
-                )
+        # Known pages are requested conditionally
+        validators = await self.source_repository.get_cache_validators(urls)
 
-                saved_source = await self.source_repository.create_or_update(
-                    updated_source
+        progress = _LoadProgress()
+        batches: asyncio.Queue[list[Source] | None] = asyncio.Queue(
+            maxsize=self.queue_size
+        )
+        try:
+            # Parsing and saving run concurrently: if one stage fails,
+            # the other one is cancelled
+            async with asyncio.TaskGroup() as group:
+                group.create_task(self._write_batches(batches, progress))
+                await self._parse_into_batches(
+                    urls, validators, batches, progress
                 )
-                logger.debug("Successfully upserted source %s", source.url)
-                saved_sources.append(saved_source)
+        except ExceptionGroup as e:
+            raise e.exceptions[0] from None
 
-            except Exception as e:
-                logger.error("Error upserting source %s: %s", source.url, e)
-                logger.debug("Exception details:", exc_info=True)
-                save_failed_count += 1
-                continue
+        # Refresh the in-memory corpus so retrieval sees the new sources
+        if (
+            progress.sources
+            and refresh_corpus
+            and self.source_corpus is not None
+        ):
+            await self.source_corpus.refresh_after_write()
 
         # Total failed count = parsing failures + save failures
-        total_failed_count = parsing_failed_count + save_failed_count
+        total_failed_count = progress.parsing_failed + progress.save_failed
 
+        unchanged_count = progress.unchanged + progress.not_modified
+        loaded_count = len(progress.sources) + unchanged_count
         logger.info(
-            "Returning %d sources, failed: %d (parsing: %d, saving: %d)",
-            len(saved_sources),
+            "Loaded %d sources (created: %d, updated: %d, unchanged: %d), "
+            "failed: %d (parsing: %d, saving: %d)",
+            loaded_count,
+            progress.created,
+            progress.updated,
+            unchanged_count,
             total_failed_count,
-            parsing_failed_count,
-            save_failed_count,
+            progress.parsing_failed,
+            progress.save_failed,
         )
 
         # Convert to response DTO
         return LoadSourcesResponse(
-            sources=[
-                ResponseConverter.source_to_response(source)
-                for source in saved_sources
-            ],
-            loaded_count=len(saved_sources),
+            sources=progress.sources,
+            loaded_count=loaded_count,
+            parsed_count=progress.parsed + progress.not_modified,
+            not_modified_count=progress.not_modified,
             failed_count=total_failed_count,
+            created_count=progress.created,
+            updated_count=progress.updated,
+            unchanged_count=unchanged_count,
+            failures=progress.failures,
+        )
+
+    async def _parse_into_batches(
+        self,
+        urls: list[str],
+        validators: dict[str, CacheValidators],
+        batches: asyncio.Queue[list[Source] | None],
+        progress: _LoadProgress,
+    ) -> None:
+        """Stream parse results and hand parsed sources to the writer."""
+        now = datetime.now(UTC)
+        batch: list[Source] = []
+
+        async with aclosing(
+            self.content_parsing_service.iter_parse_urls(urls, validators)
+        ) as results:
+            async for result in results:
+                if result.not_modified:
+                    progress.not_modified += 1
+                    continue
+                if result.source is None:
+                    # Collect parsing failures with their reasons
+                    progress.parsing_failed += 1
+                    progress.failures.append(
+                        SourceLoadFailure(
+                            url=result.url,
+                            reason=result.error or "Unknown error",
+                        )
+                    )
+                    continue
+
+                progress.parsed += 1
+                source = result.source
+                batch.append(
+                    replace(
+                        source,
+                        updated_at=now,
+                        content_hash=source.content_hash
+                        or compute_content_hash(source.title, source.content),
+                    )
+                )
+                if len(batch) >= self.write_batch_size:
+                    # Blocks while the writer is behind - backpressure
+                    await batches.put(batch)
+                    batch = []
+
+        if batch:
+            await batches.put(batch)
+        await batches.put(None)
+
+        logger.info(
+            "Parsed %d sources, not modified: %d",
+            progress.parsed,
+            progress.not_modified,
         )
+
+    async def _write_batches(
+        self,
+        batches: asyncio.Queue[list[Source] | None],
+        progress: _LoadProgress,
+    ) -> None:
+        """Upsert parsed sources batch by batch as they arrive."""
+        while (batch := await batches.get()) is not None:
+            upsert_result = await self.source_repository.bulk_upsert(
+                batch,
+                passages={
+                    source.url: split_into_passages(
+                        source.content,
+                        self.passage_size,
+                        self.passage_overlap,
+                    )
+                    for source in batch
+                },
+            )
+
+            progress.created += len(upsert_result.created)
+            progress.updated += len(upsert_result.updated)
+            progress.unchanged += len(upsert_result.unchanged)
+            progress.save_failed += len(upsert_result.failures)
+            progress.sources.extend(
+                ResponseConverter.source_to_response(source)
+                for source in upsert_result.saved
+            )
+            progress.failures.extend(
+                SourceLoadFailure(url=url, reason=reason)
+                for url, reason in upsert_result.failures.items()
+            )
@@ -0,0 +1,272 @@
+import asyncio
+import logging
+import os
+import socket
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import replace
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+from src.application.use_cases.load_sources import LoadSourcesUseCase
+from src.domain.entities import IngestionJob, IngestionJobStatus
+from src.domain.exceptions import IngestionJobLeaseLostError
+from src.domain.repositories import IngestionJobRepositoryInterface
+from src.domain.services import SourceCorpusServiceInterface
+
+logger = logging.getLogger(__name__)
+
+JobRepositoryFactory = Callable[
+    [], AbstractAsyncContextManager[IngestionJobRepositoryInterface]
+]
+LoadSourcesFactory = Callable[
+    [], AbstractAsyncContextManager[LoadSourcesUseCase]
+]
+
+
+class IngestionJobRunner:
+    """Runs source loading jobs in the background of the process.
+
+    URLs are loaded in chunks; job progress is saved after every chunk,
+    so an interrupted job resumes from the last completed chunk. Every
+    chunk and progress update uses its own short database session, and
+    the corpus snapshot is refreshed once when the job finishes.
+
+    Several processes may share the jobs table. A runner owns the jobs
+    it submitted or claimed and renews their lease while running them;
+    jobs whose lease is older than ``lease_timeout`` (their runner died
+    or hung) are claimed by another runner every ``lease_timeout``
+    seconds. A runner that lost the lease of a job stops running it.
+    """
+
+    def __init__(
+        self,
+        job_repository_factory: JobRepositoryFactory,
+        load_sources_factory: LoadSourcesFactory,
+        source_corpus: SourceCorpusServiceInterface | None = None,
+        *,
+        max_concurrent_jobs: int = 2,
+        batch_size: int = 50,
+        lease_timeout: float = 60.0,
+    ) -> None:
+        self.job_repository_factory = job_repository_factory
+        self.load_sources_factory = load_sources_factory
+        self.source_corpus = source_corpus
+        self.batch_size = batch_size
+        self.lease_timeout = lease_timeout
+        # Уникален для процесса и для каждого его перезапуска
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._semaphore = asyncio.Semaphore(max_concurrent_jobs)
+        self._tasks: dict[UUID, asyncio.Task[None]] = {}
+        self._reclaimer: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start claiming jobs abandoned by other runners."""
+        if self._reclaimer is None:
+            self._reclaimer = asyncio.create_task(self._reclaim_periodically())
+
+    async def submit(self, urls: list[str]) -> IngestionJob:
+        """Persist a new job and start it in the background."""
+        now = datetime.now(UTC)
+        job = IngestionJob(
+            urls=urls, created_at=now, owner=self.owner, heartbeat_at=now
+        )
+        async with self.job_repository_factory() as repository:
+            await repository.create(job)
+
+        logger.info("Submitted ingestion job %s (%d URLs)", job.id, job.total)
+        self._schedule(job)
+        return job
+
+    async def get(self, job_id: UUID) -> IngestionJob | None:
+        """Get job with its current progress."""
+        async with self.job_repository_factory() as repository:
+            return await repository.get_by_id(job_id)
+
+    async def resume_unfinished(self) -> int:
+        """Claim and restart unfinished jobs whose lease has expired."""
+        async with self.job_repository_factory() as repository:
+            claimed = await repository.claim_unfinished(
+                self.owner, self.lease_timeout
+            )
+
+        # Задачи, ожидающие своей очереди здесь же, не продлевают аренду
+        jobs = [job for job in claimed if job.id not in self._tasks]
+        for job in jobs:
+            logger.info(
+                "Resuming ingestion job %s from %d/%d",
+                job.id,
+                job.processed,
+                job.total,
+            )
+            self._schedule(job)
+        return len(jobs)
+
+    async def close(self) -> None:
+        """Cancel running jobs and release them to other runners."""
+        tasks = [*self._tasks.values(), *filter(None, [self._reclaimer])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            async with self.job_repository_factory() as repository:
+                released = await repository.release(self.owner)
+        except Exception as e:
+            # Задачи продолжатся после истечения аренды
+            logger.error("Error releasing ingestion jobs: %s", e)
+            return
+        if released:
+            logger.info("Released %d unfinished ingestion jobs", released)
+
+    async def _reclaim_periodically(self) -> None:
+        """Claim jobs with expired leases every ``lease_timeout``."""
+        while True:
+            await asyncio.sleep(self.lease_timeout)
+            try:
+                await self.resume_unfinished()
+            except Exception as e:
+                logger.error("Error claiming ingestion jobs: %s", e)
+
+    def _schedule(self, job: IngestionJob) -> None:
+        """Start the job task and keep a reference until it completes."""
+        task = asyncio.create_task(self._run(job))
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.id, None))
+
+    async def _run(self, job: IngestionJob) -> None:
+        """Run the job, limiting the number of concurrent jobs."""
+        async with self._semaphore:
+            try:
+                job = await self._save(
+                    replace(
+                        job,
+                        status=IngestionJobStatus.RUNNING,
+                        started_at=job.started_at or datetime.now(UTC),
+                    )
+                )
+                job = await self._process_leased(job)
+            except IngestionJobLeaseLostError:
+                logger.warning(
+                    "Ingestion job %s was claimed by another runner", job.id
+                )
+                return
+            except Exception as e:
+                logger.error("Ingestion job %s failed: %s", job.id, e)
+                await self._finish(job, IngestionJobStatus.FAILED, str(e))
+                return
+
+            await self._finish(job, IngestionJobStatus.COMPLETED)
+
+    async def _process_leased(self, job: IngestionJob) -> IngestionJob:
+        """Process the job while renewing its lease in the background.
+
+        Losing the lease cancels processing: the job now belongs to
+        another runner.
+        """
+        try:
+            async with asyncio.TaskGroup() as group:
+                heartbeat = group.create_task(self._keep_lease(job.id))
+                try:
+                    return await self._process(job)
+                finally:
+                    heartbeat.cancel()
+        except ExceptionGroup as e:
+            raise e.exceptions[0] from None
+
+    async def _keep_lease(self, job_id: UUID) -> None:
+        """Renew the job's lease until cancelled."""
+        # Несколько продлений за срок аренды переживают сбой одного из них
+        interval = self.lease_timeout / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with self.job_repository_factory() as repository:
+                    renewed = await repository.renew_lease(job_id, self.owner)
+            except Exception as e:
+                logger.warning(
+                    "Error renewing ingestion job %s lease: %s", job_id, e
+                )
+                continue
+            if not renewed:
+                raise IngestionJobLeaseLostError(
+                    f"Ingestion job {job_id} is owned by another runner"
+                )
+
+    async def _process(self, job: IngestionJob) -> IngestionJob:
+        """Load remaining URLs chunk by chunk, saving progress."""
+        while job.processed < job.total:
+            chunk = job.urls[job.processed : job.processed + self.batch_size]
+            async with self.load_sources_factory() as use_case:
+                result = await use_case.execute(chunk, refresh_corpus=False)
+
+            job = await self._save(
+                replace(
+                    job,
+                    processed=job.processed + len(chunk),
+                    fetched=job.fetched + result.parsed_count,
+                    parsed=job.parsed
+                    + result.parsed_count
+                    - result.not_modified_count,
+                    saved=job.saved
+                    + result.created_count
+                    + result.updated_count,
+                    unchanged=job.unchanged + result.unchanged_count,
+                    failed=job.failed + result.failed_count,
+                    errors={
+                        **job.errors,
+                        **{
+                            failure.url: failure.reason
+                            for failure in result.failures
+                        },
+                    },
+                )
+            )
+            logger.info(
+                "Ingestion job %s: %d/%d URLs processed",
+                job.id,
+                job.processed,
+                job.total,
+            )
+        return job
+
+    async def _finish(
+        self,
+        job: IngestionJob,
+        status: IngestionJobStatus,
+        error: str | None = None,
+    ) -> None:
+        """Mark the job as finished and refresh the corpus snapshot."""
+        if job.saved and self.source_corpus is not None:
+            await self.source_corpus.refresh_after_write()
+
+        try:
+            await self._save(
+                replace(
+                    job,
+                    status=status,
+                    error=error,
+                    finished_at=datetime.now(UTC),
+                )
+            )
+        except IngestionJobLeaseLostError:
+            logger.warning(
+                "Ingestion job %s was claimed by another runner", job.id
+            )
+            return
+        except Exception as e:
+            # Задача будет повторена при следующем запуске
+            logger.error("Error saving ingestion job %s status: %s", job.id, e)
+        logger.info(
+            "Ingestion job %s %s: saved %d, unchanged %d, failed %d",
+            job.id,
+            status,
+            job.saved,
+            job.unchanged,
+            job.failed,
+        )
+
+    async def _save(self, job: IngestionJob) -> IngestionJob:
+        """Persist job status and progress."""
+        async with self.job_repository_factory() as repository:
+            return await repository.update(job)
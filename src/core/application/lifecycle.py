@@ -1,12 +1,33 @@
 import logging
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import FastAPI
 
+from src.application.use_cases import IngestionJobRunner, LoadSourcesUseCase
 from src.core.config import Settings
+from src.infrastructure.database.connection import AsyncSessionLocal
+from src.infrastructure.repositories import (
+    IngestionJobRepository,
+    SourceRepository,
+    WriteBehindQuestionAnswerRepository,
+)
+from src.infrastructure.services import (
+    CircuitBreaker,
+    HTTPContentParsingService,
+    InMemorySourceCorpusService,
+    SingleFlight,
+    create_answer_cache,
+    create_anthropic_client,
+    create_http_client,
+    create_llm_concurrency_limiter,
+    create_llm_retry_policy,
+    create_parsing_executor,
+    create_source_matching_service,
+    resolve_extraction_backend,
+)
 
 
 def create_lifespan(logger: logging.Logger, settings: Settings) -> Any:
@@ -23,7 +44,28 @@ def create_lifespan(logger: logging.Logger, settings: Settings) -> Any:
             logger.info("🔧 Debug режим: %s", settings.debug)
             logger.info("🌐 API доступно на: %s", settings.api_str)
 
-            # Здесь можно добавить инициализацию БД, кеша и т.д.
+            # Общие для всех запросов сервисы поиска источников
+            app.state.source_matching_service = create_source_matching_service(
+                settings, AsyncSessionLocal
+            )
+            app.state.source_corpus = InMemorySourceCorpusService(
+                session_factory=AsyncSessionLocal,
+                source_matching_service=app.state.source_matching_service,
+                refresh_interval=settings.source_corpus_refresh_interval,
+            )
+            await _warm_up_source_corpus(app, logger)
+
+            # Долгоживущие клиенты и сервис загрузки страниц
+            _init_content_parsing(app, settings)
+            _init_anthropic_client(app, settings, logger)
+            app.state.answer_cache = create_answer_cache(
+                settings, AsyncSessionLocal
+            )
+            app.state.llm_single_flight = (
+                SingleFlight() if settings.llm_coalescing_enabled else None
+            )
+            _init_write_behind(app, settings)
+            await _init_ingestion_jobs(app, settings, logger)
 
             yield
 
@@ -31,10 +73,165 @@ def create_lifespan(logger: logging.Logger, settings: Settings) -> Any:
             logger.error(f"❌ Ошибка при запуске приложения: {e}")
             raise
         finally:
-            # Shutdown
+            # Shutdown: останавливаем фоновые задачи, дописываем очередь,
+            # затем закрываем клиенты
+            await _close_ingestion_jobs(app)
+            await _close_write_behind(app, logger)
+            await _close_clients(app)
+
             uptime = time.time() - app.state.start_time
             logger.info(
                 "⏹️ EORA Q&A сервис остановлен (время работы: %.2f сек)", uptime
             )
 
     return lifespan
+
+
+async def _warm_up_source_corpus(app: FastAPI, logger: logging.Logger) -> None:
+    """Загрузить снимок корпуса источников при старте."""
+    try:
+        await app.state.source_corpus.refresh()
+    except Exception as e:
+        # Снимок будет загружен при первом запросе
+        logger.warning("⚠️ Не удалось загрузить корпус источников: %s", e)
+
+
+def _init_content_parsing(app: FastAPI, settings: Settings) -> None:
+    """Создать пул разбора HTML, HTTP клиент и сервис парсинга."""
+    # Пул для разбора HTML вне event loop
+    app.state.parsing_executor = create_parsing_executor(
+        settings.parser_executor, settings.parser_workers
+    )
+    app.state.http_client = create_http_client(
+        timeout=settings.parser_timeout,
+        max_connections=settings.parser_max_concurrency,
+        max_keepalive_connections=settings.parser_max_keepalive_connections,
+        keepalive_expiry=settings.parser_keepalive_expiry,
+    )
+    app.state.content_parsing_service = HTTPContentParsingService(
+        app.state.http_client,
+        max_concurrency=settings.parser_max_concurrency,
+        per_host_concurrency=settings.parser_per_host_concurrency,
+        per_host_rate_limit=settings.parser_per_host_rate_limit,
+        executor=app.state.parsing_executor,
+        html_backend=resolve_extraction_backend(settings.parser_html_backend),
+    )
+
+
+def _init_anthropic_client(
+    app: FastAPI, settings: Settings, logger: logging.Logger
+) -> None:
+    """Создать общий клиент Anthropic, если задан API ключ."""
+    app.state.anthropic_client = None
+    # Лимит одновременных вызовов общий для всех запросов процесса
+    app.state.llm_limiter = (
+        create_llm_concurrency_limiter(settings)
+        if settings.llm_concurrency_limit_enabled
+        else None
+    )
+    # Статистика задержек для дублирующих запросов тоже общая
+    app.state.llm_retry_policy = create_llm_retry_policy(settings)
+    app.state.llm_circuit_breaker = (
+        CircuitBreaker(
+            settings.llm_circuit_failure_threshold,
+            settings.llm_circuit_reset_timeout,
+        )
+        if settings.llm_circuit_breaker_enabled
+        else None
+    )
+    if not settings.anthropic_api_key:
+        logger.warning("⚠️ ANTHROPIC_API_KEY не задан, LLM недоступна")
+        return
+
+    app.state.anthropic_client = create_anthropic_client(
+        settings.anthropic_api_key, settings
+    )
+
+
+def _init_write_behind(app: FastAPI, settings: Settings) -> None:
+    """Запустить фоновую пакетную запись вопросов и ответов."""
+    app.state.qa_write_behind = None
+    if not settings.qa_write_behind_enabled:
+        return
+
+    write_behind = WriteBehindQuestionAnswerRepository(
+        AsyncSessionLocal,
+        queue_size=settings.qa_write_behind_queue_size,
+        batch_size=settings.qa_write_behind_batch_size,
+        flush_interval=settings.qa_write_behind_flush_interval,
+    )
+    write_behind.start()
+    app.state.qa_write_behind = write_behind
+
+
+async def _init_ingestion_jobs(
+    app: FastAPI, settings: Settings, logger: logging.Logger
+) -> None:
+    """Создать исполнитель фоновых задач загрузки и продолжить прерванные."""
+
+    @asynccontextmanager
+    async def job_repository() -> AsyncIterator[IngestionJobRepository]:
+        async with AsyncSessionLocal() as session:
+            yield IngestionJobRepository(session)
+
+    @asynccontextmanager
+    async def load_sources() -> AsyncIterator[LoadSourcesUseCase]:
+        async with AsyncSessionLocal() as session:
+            yield LoadSourcesUseCase(
+                source_repository=SourceRepository(session),
+                content_parsing_service=app.state.content_parsing_service,
+                write_batch_size=settings.ingestion_write_batch_size,
+                queue_size=settings.ingestion_queue_size,
+                passage_size=settings.passage_size,
+                passage_overlap=settings.passage_overlap,
+            )
+
+    app.state.ingestion_jobs = IngestionJobRunner(
+        job_repository,
+        load_sources,
+        app.state.source_corpus,
+        max_concurrent_jobs=settings.ingestion_max_concurrent_jobs,
+        batch_size=settings.ingestion_job_batch_size,
+        lease_timeout=settings.ingestion_job_lease_timeout,
+    )
+    app.state.ingestion_jobs.start()
+    try:
+        resumed = await app.state.ingestion_jobs.resume_unfinished()
+    except Exception as e:
+        logger.warning("⚠️ Не удалось продолжить задачи загрузки: %s", e)
+        return
+
+    if resumed:
+        logger.info("📥 Продолжено задач загрузки: %d", resumed)
+
+
+async def _close_ingestion_jobs(app: FastAPI) -> None:
+    """Остановить фоновые задачи загрузки (продолжатся при запуске)."""
+    runner = getattr(app.state, "ingestion_jobs", None)
+    if runner is not None:
+        await runner.close()
+
+
+async def _close_write_behind(app: FastAPI, logger: logging.Logger) -> None:
+    """Сохранить все ожидающие в очереди вопросы и ответы."""
+    write_behind = getattr(app.state, "qa_write_behind", None)
+    if write_behind is None:
+        return
+
+    logger.info("💾 Сохранение %d ответов из очереди", write_behind.pending)
+    await write_behind.close()
+
+
+async def _close_clients(app: FastAPI) -> None:
+    """Закрыть долгоживущие клиенты и пулы."""
+    anthropic_client = getattr(app.state, "anthropic_client", None)
+    if anthropic_client is not None:
+        await anthropic_client.close()
+
+    http_client = getattr(app.state, "http_client", None)
+    if http_client is not None:
+        await http_client.aclose()
+
+    executor = getattr(app.state, "parsing_executor", None)
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -2,12 +2,23 @@ from functools import lru_cache
 from typing import Any
 
 from .app import AppSettings
+from .cache import AnswerCacheSettings
 from .database import DatabaseSettings
 from .llm import LLMConfig
 from .logging import LoggingSettings
-
-
-class Settings(AppSettings, DatabaseSettings, LoggingSettings, LLMConfig):
+from .parser import ParserSettings
+from .search import SearchSettings
+
+
+class Settings(
+    AppSettings,
+    DatabaseSettings,
+    LoggingSettings,
+    LLMConfig,
+    ParserSettings,
+    SearchSettings,
+    AnswerCacheSettings,
+):
     """Объединенные настройки приложения."""
 
     def __init__(self, **data: Any) -> None:
@@ -17,3 +17,5 @@ class AppSettings(BaseConfig):
     api_host: str = "0.0.0.0"
     api_port: int = 8000
     api_str: str = "/api/v1"
+    # Максимальное время обработки запроса в секундах (дедлайн для LLM)
+    request_timeout: float = 90.0
@@ -0,0 +1,25 @@
+from pydantic import Field
+
+from .base import BaseConfig
+
+
+class AnswerCacheSettings(BaseConfig):
+    """Настройки кеша ответов LLM."""
+
+    answer_cache_enabled: bool = Field(
+        default=True, description="Кешировать ответы LLM"
+    )
+    answer_cache_max_entries: int = Field(
+        default=1024,
+        ge=1,
+        description="Максимальное число ответов в памяти процесса",
+    )
+    answer_cache_ttl: float = Field(
+        default=3600.0,
+        gt=0,
+        description="Время жизни закешированного ответа в секундах",
+    )
+    answer_cache_shared: bool = Field(
+        default=False,
+        description="Использовать общий кеш в PostgreSQL между воркерами",
+    )
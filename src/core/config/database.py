@@ -17,6 +17,28 @@ class DatabaseSettings(BaseConfig):
         default=3000, description="Пересоздавать соединения каждые 50 минут"
     )
 
+    # Отложенная пакетная запись вопросов и ответов
+    qa_write_behind_enabled: bool = Field(
+        default=False,
+        description="Сохранять вопросы и ответы в фоне пакетами",
+    )
+    qa_write_behind_queue_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Размер очереди записи (при заполнении запросы ждут)",
+    )
+    qa_write_behind_batch_size: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Максимальное число пар вопрос-ответ в одном INSERT",
+    )
+    qa_write_behind_flush_interval: float = Field(
+        default=0.5,
+        gt=0,
+        description="Максимальная задержка записи пакета в секундах",
+    )
+
     @property
     def alembic_database_url(self) -> str:
         """URL для Alembic (синхронный)"""
@@ -16,3 +16,164 @@ class LLMConfig(BaseConfig):
     temperature: float = Field(
         default=0.1, description="Temperature for response generation"
     )
+
+    llm_input_token_budget: int = Field(
+        default=6000,
+        ge=500,
+        description=(
+            "Token budget for the prompt (template, question and sources)"
+        ),
+    )
+    llm_chars_per_token: float = Field(
+        default=3.0,
+        gt=0,
+        description=(
+            "Average characters per token used to estimate prompt size"
+        ),
+    )
+
+    llm_coalescing_enabled: bool = Field(
+        default=True,
+        description=(
+            "Share one LLM call between concurrent identical questions"
+        ),
+    )
+
+    # Адаптивный лимит одновременных вызовов LLM и очередь ожидания
+    llm_concurrency_limit_enabled: bool = Field(
+        default=True,
+        description=(
+            "Adapt the number of concurrent LLM calls to provider load"
+        ),
+    )
+    llm_concurrency_initial_limit: int = Field(
+        default=10, ge=1, description="Initial concurrent LLM call limit"
+    )
+    llm_concurrency_min_limit: int = Field(
+        default=1, ge=1, description="Lower bound of the adaptive limit"
+    )
+    llm_concurrency_max_limit: int = Field(
+        default=50, ge=1, description="Upper bound of the adaptive limit"
+    )
+    llm_concurrency_backoff_ratio: float = Field(
+        default=0.5,
+        gt=0,
+        lt=1,
+        description=(
+            "Limit multiplier applied on overload responses and slow calls"
+        ),
+    )
+    llm_latency_target: float = Field(
+        default=20.0,
+        gt=0,
+        description=(
+            "LLM call duration in seconds above which the limit decreases"
+        ),
+    )
+    llm_queue_max_size: int = Field(
+        default=100,
+        ge=0,
+        description="Maximum number of LLM calls waiting for a slot",
+    )
+    llm_queue_timeout: float = Field(
+        default=5.0,
+        gt=0,
+        description=(
+            "Maximum wait for a slot in seconds before responding 503"
+        ),
+    )
+
+    # Повторы, таймауты и дублирующие (hedged) запросы к LLM
+    llm_max_attempts: int = Field(
+        default=3, ge=1, description="Maximum attempts per LLM call"
+    )
+    llm_attempt_timeout: float = Field(
+        default=30.0, gt=0, description="Timeout of one LLM attempt"
+    )
+    llm_total_timeout: float = Field(
+        default=60.0,
+        gt=0,
+        description=(
+            "Time for all attempts of an LLM call, limited by the request"
+        ),
+    )
+    llm_backoff_base: float = Field(
+        default=0.5, gt=0, description="Initial retry backoff in seconds"
+    )
+    llm_backoff_max: float = Field(
+        default=8.0, gt=0, description="Maximum retry backoff in seconds"
+    )
+    llm_hedging_enabled: bool = Field(
+        default=False,
+        description="Duplicate LLM calls slower than the latency quantile",
+    )
+    llm_hedge_quantile: float = Field(
+        default=0.95,
+        gt=0,
+        lt=1,
+        description="Latency quantile after which a hedged call is sent",
+    )
+    llm_hedge_min_samples: int = Field(
+        default=20,
+        ge=1,
+        description="Successful calls needed before hedging starts",
+    )
+
+    # Размыкатель цепи: ответ из источников без LLM при ее недоступности
+    llm_circuit_breaker_enabled: bool = Field(
+        default=True,
+        description="Stop calling the LLM after consecutive failures",
+    )
+    llm_circuit_failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive LLM failures that open the circuit",
+    )
+    llm_circuit_reset_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds before a trial call to the LLM is let through",
+    )
+    llm_fallback_snippet_chars: int = Field(
+        default=300,
+        ge=50,
+        description="Snippet length per source in the fallback answer",
+    )
+
+    # Ответы на навигационные вопросы списком источников без вызова LLM
+    extractive_answers_enabled: bool = Field(
+        default=False,
+        description=(
+            "Answer confident navigational questions from sources directly"
+        ),
+    )
+    extractive_min_confidence: float = Field(
+        default=0.8,
+        ge=0,
+        le=1,
+        description=(
+            "Share of question keywords the best source must contain"
+        ),
+    )
+    extractive_snippet_chars: int = Field(
+        default=300,
+        ge=50,
+        description="Snippet length per source in extractive answers",
+    )
+
+    # Настройки клиента Anthropic
+    anthropic_api_key: str | None = Field(
+        default=None, description="API key for Anthropic"
+    )
+    llm_timeout: float = Field(
+        default=60.0, description="Timeout for LLM API requests in seconds"
+    )
+    llm_max_connections: int = Field(
+        default=100, ge=1, description="Maximum connections to LLM API"
+    )
+    llm_max_keepalive_connections: int = Field(
+        default=20, ge=0, description="Maximum idle keep-alive connections"
+    )
+    llm_keepalive_expiry: float = Field(
+        default=30.0, description="Idle keep-alive connection lifetime"
+    )
@@ -0,0 +1,90 @@
+from typing import Literal
+
+from pydantic import Field
+
+from .base import BaseConfig
+
+
+class ParserSettings(BaseConfig):
+    """Настройки загрузки и парсинга страниц."""
+
+    parser_timeout: float = Field(
+        default=30.0, description="Таймаут HTTP запроса в секундах"
+    )
+    parser_max_concurrency: int = Field(
+        default=20,
+        ge=1,
+        description="Максимальное число одновременно загружаемых URL",
+    )
+    parser_max_keepalive_connections: int = Field(
+        default=20,
+        ge=0,
+        description="Максимальное число простаивающих keep-alive соединений",
+    )
+    parser_keepalive_expiry: float = Field(
+        default=30.0,
+        description="Время жизни простаивающего соединения в секундах",
+    )
+    parser_per_host_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Максимальное число одновременных запросов к одному хосту",
+    )
+    parser_per_host_rate_limit: float = Field(
+        default=0.0,
+        ge=0,
+        description=(
+            "Максимальное число запросов в секунду к одному хосту "
+            "(0 - без ограничения)"
+        ),
+    )
+    parser_executor: Literal["thread", "process"] = Field(
+        default="process",
+        description="Пул для разбора HTML вне event loop (thread, process)",
+    )
+    parser_workers: int | None = Field(
+        default=None,
+        ge=1,
+        description="Число воркеров пула разбора HTML (по умолчанию - CPU)",
+    )
+    parser_html_backend: Literal["html.parser", "lxml"] = Field(
+        default="html.parser",
+        description="Бэкенд извлечения текста из HTML (html.parser, lxml)",
+    )
+    ingestion_max_concurrent_jobs: int = Field(
+        default=2,
+        ge=1,
+        description="Максимальное число одновременных фоновых задач загрузки",
+    )
+    ingestion_job_batch_size: int = Field(
+        default=50,
+        ge=1,
+        description=(
+            "Число URL в одной порции фоновой задачи загрузки "
+            "(прогресс сохраняется после каждой порции)"
+        ),
+    )
+    ingestion_job_lease_timeout: float = Field(
+        default=60.0,
+        gt=0,
+        description=(
+            "Секунды без продления аренды, после которых задачу загрузки "
+            "может продолжить другой процесс"
+        ),
+    )
+    ingestion_write_batch_size: int = Field(
+        default=100,
+        ge=1,
+        description=(
+            "Число разобранных страниц, сохраняемых одной пачкой "
+            "во время загрузки"
+        ),
+    )
+    ingestion_queue_size: int = Field(
+        default=2,
+        ge=1,
+        description=(
+            "Максимальное число пачек страниц, ожидающих сохранения "
+            "(ограничивает потребление памяти)"
+        ),
+    )
@@ -0,0 +1,70 @@
+from typing import Literal, Self
+
+from pydantic import Field, model_validator
+
+from .base import BaseConfig
+
+
+class SearchSettings(BaseConfig):
+    """Настройки поиска релевантных источников."""
+
+    source_matching_backend: Literal["simple", "bm25", "postgres"] = Field(
+        default="simple",
+        description=(
+            "Алгоритм ранжирования источников (simple, bm25, "
+            "postgres - полнотекстовый поиск в базе)"
+        ),
+    )
+    max_relevant_sources: int = Field(
+        default=5,
+        ge=1,
+        description="Максимальное число источников, передаваемых в LLM",
+    )
+    passage_size: int = Field(
+        default=1000,
+        ge=100,
+        description="Максимальная длина фрагмента источника в символах",
+    )
+    passage_overlap: int = Field(
+        default=200,
+        ge=0,
+        description="Перекрытие соседних фрагментов в символах",
+    )
+    max_passages_per_source: int = Field(
+        default=2,
+        ge=1,
+        description="Максимальное число фрагментов источника в промпте",
+    )
+    bm25_k1: float = Field(
+        default=1.2, description="Параметр насыщения частоты терма BM25"
+    )
+    bm25_b: float = Field(
+        default=0.75, description="Параметр нормализации длины поля BM25"
+    )
+    bm25_title_weight: float = Field(
+        default=3.0, description="Вес поля заголовка в BM25F"
+    )
+    bm25_content_weight: float = Field(
+        default=1.0, description="Вес поля содержимого в BM25F"
+    )
+    source_corpus_refresh_interval: float = Field(
+        default=60.0,
+        ge=0,
+        description=(
+            "Интервал проверки актуальности снимка корпуса в секундах "
+            "(0 - только при загрузке источников)"
+        ),
+    )
+
+    @model_validator(mode="after")
+    def check_passage_overlap(self) -> Self:
+        """Проверить, что перекрытие меньше половины фрагмента.
+
+        Граница фрагмента ищется во второй половине окна, поэтому при
+        большем перекрытии следующий фрагмент почти повторяет текущий.
+        """
+        if self.passage_overlap >= self.passage_size // 2:
+            raise ValueError(
+                "passage_overlap должно быть меньше половины passage_size"
+            )
+        return self
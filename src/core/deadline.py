@@ -0,0 +1,26 @@
+"""Deadline of the current request shared with downstream calls."""
+
+import time
+from contextvars import ContextVar, Token
+
+_request_deadline: ContextVar[float | None] = ContextVar(
+    "request_deadline", default=None
+)
+
+
+def set_request_deadline(timeout: float) -> Token[float | None]:
+    """Set the deadline ``timeout`` seconds from now for this context."""
+    return _request_deadline.set(time.monotonic() + timeout)
+
+
+def reset_request_deadline(token: Token[float | None]) -> None:
+    """Restore the deadline that was set before ``token``."""
+    _request_deadline.reset(token)
+
+
+def remaining_time() -> float | None:
+    """Seconds left until the request deadline, None without one."""
+    deadline = _request_deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
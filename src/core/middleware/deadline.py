@@ -0,0 +1,31 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.core.config import get_settings
+from src.core.deadline import reset_request_deadline, set_request_deadline
+
+# Заголовок, которым клиент может сократить время ожидания ответа
+REQUEST_TIMEOUT_HEADER = "X-Request-Timeout"
+
+
+async def deadline_middleware(
+    request: Any, call_next: Callable[[Any], Awaitable[Any]]
+) -> Any:
+    """Middleware, задающий дедлайн обработки запроса."""
+    timeout = get_settings().request_timeout
+
+    # Клиент может ждать меньше, но не дольше настройки сервера
+    header = request.headers.get(REQUEST_TIMEOUT_HEADER)
+    if header:
+        try:
+            requested = float(header)
+        except ValueError:
+            requested = timeout
+        if requested > 0:
+            timeout = min(timeout, requested)
+
+    token = set_request_deadline(timeout)
+    try:
+        return await call_next(request)
+    finally:
+        reset_request_deadline(token)
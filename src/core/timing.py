@@ -0,0 +1,31 @@
+"""Lightweight helpers for measuring stage latencies."""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+def elapsed_ms(start: float) -> float:
+    """Milliseconds elapsed since a ``time.perf_counter()`` mark."""
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+class StageTimer:
+    """Collects durations of named stages in milliseconds."""
+
+    def __init__(self) -> None:
+        self.durations: dict[str, float] = {}
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Measure the duration of the enclosed block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[stage] = elapsed_ms(start)
+
+    def record(self, stage: str, duration_ms: float | None) -> None:
+        """Record a duration measured elsewhere."""
+        if duration_ms is not None:
+            self.durations[stage] = duration_ms
@@ -1,11 +1,27 @@
 from .answer import Answer
+from .answer_timings import AnswerTimings
+from .ingestion_job import IngestionJob, IngestionJobStatus
+from .llm_completion import LLMCompletion
+from .parse_result import CacheValidators, ParseResult
+from .passage import PASSAGE_SEPARATOR, split_into_passages
 from .question import Question
 from .question_answer import QuestionAnswer
-from .source import Source
+from .source import Source, compute_content_hash
+from .upsert_result import SourceUpsertResult
 
 __all__ = [
+    "PASSAGE_SEPARATOR",
     "Answer",
+    "AnswerTimings",
+    "CacheValidators",
+    "IngestionJob",
+    "IngestionJobStatus",
+    "LLMCompletion",
+    "ParseResult",
     "Question",
     "QuestionAnswer",
     "Source",
+    "SourceUpsertResult",
+    "compute_content_hash",
+    "split_into_passages",
 ]
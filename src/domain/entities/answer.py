@@ -2,6 +2,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import UUID, uuid4
 
+from .answer_timings import AnswerTimings
+
 
 @dataclass(frozen=True)
 class Answer:
@@ -11,4 +13,8 @@ class Answer:
     created_at: datetime
     processing_time_ms: int
     question_id: UUID
+    time_to_first_token_ms: int | None = None
+    timings: AnswerTimings | None = None
+    # Ответ составлен из найденных источников без LLM
+    degraded: bool = False
     id: UUID = field(default_factory=uuid4)
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AnswerTimings:
+    """Latency breakdown of answering a question.
+
+    Durations are in milliseconds, ``None`` means the stage did not run.
+    ``db_write`` is the combined question and answer write of the
+    unit-of-work path. ``context_tokens`` is the estimated size of the
+    sources packed into the prompt.
+    """
+
+    db_write_question: float | None = None
+    load_sources: float | None = None
+    matching: float | None = None
+    prompt_build: float | None = None
+    llm: float | None = None
+    db_write_answer: float | None = None
+    db_write: float | None = None
+    prompt_tokens: int | None = None
+    context_tokens: int | None = None
+    response_tokens: int | None = None
+    llm_cached: bool = False
+    llm_coalesced: bool = False
+    llm_extractive: bool = False
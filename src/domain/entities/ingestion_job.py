@@ -0,0 +1,54 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import StrEnum
+from uuid import UUID, uuid4
+
+
+class IngestionJobStatus(StrEnum):
+    """Lifecycle states of a background ingestion job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class IngestionJob:
+    """Represents a background job loading sources from URLs."""
+
+    urls: list[str]
+    created_at: datetime
+    status: IngestionJobStatus = IngestionJobStatus.PENDING
+    # Число обработанных URL - с этого места задача продолжается
+    processed: int = 0
+    # Скачанные страницы, включая неизмененные (304)
+    fetched: int = 0
+    # Разобранные страницы, без неизмененных
+    parsed: int = 0
+    saved: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    # URL -> причина ошибки
+    errors: dict[str, str] = field(default_factory=dict)
+    error: str | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    # Исполнитель, захвативший задачу, и время его последнего сигнала:
+    # задачу с истекшей арендой может продолжить другой исполнитель
+    owner: str | None = None
+    heartbeat_at: datetime | None = None
+    id: UUID = field(default_factory=uuid4)
+
+    @property
+    def total(self) -> int:
+        """Number of URLs in the job."""
+        return len(self.urls)
+
+    @property
+    def is_finished(self) -> bool:
+        """Check whether the job reached a final state."""
+        return self.status in {
+            IngestionJobStatus.COMPLETED,
+            IngestionJobStatus.FAILED,
+        }
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LLMCompletion:
+    """Generated answer text with usage and latency of the LLM call."""
+
+    text: str
+    prompt_tokens: int | None = None
+    # Оценка токенов источников, вошедших в промпт
+    context_tokens: int | None = None
+    response_tokens: int | None = None
+    prompt_build_ms: float | None = None
+    llm_ms: float | None = None
+    cached: bool = False
+    # Ответ получен из идентичного запроса, выполнявшегося одновременно
+    coalesced: bool = False
+    # Ответ составлен из источников без LLM (LLM недоступна)
+    degraded: bool = False
+    # Ответ составлен из источников без вызова LLM (навигационный вопрос)
+    extractive: bool = False
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+
+from .source import Source
+
+
+@dataclass(frozen=True)
+class CacheValidators:
+    """HTTP validators of a stored page used for conditional requests."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def __bool__(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+@dataclass(frozen=True)
+class ParseResult:
+    """Represents the outcome of parsing a single URL."""
+
+    url: str
+    source: Source | None = None
+    error: str | None = None
+    # Сервер ответил 304: страница не изменилась и не загружалась
+    not_modified: bool = False
+
+    @property
+    def is_success(self) -> bool:
+        """Check whether the URL was parsed successfully."""
+        return self.source is not None or self.not_modified
@@ -0,0 +1,54 @@
+import re
+
+# Разделитель отобранных фрагментов в тексте источника для промпта
+PASSAGE_SEPARATOR = "\n...\n"
+
+# Предпочтительные границы фрагмента: конец абзаца, предложения, слова
+_BREAK_PATTERNS = (
+    re.compile(r"\n"),
+    re.compile(r"[.!?…](?=\s)"),
+    re.compile(r"\s"),
+)
+
+
+def split_into_passages(text: str, size: int, overlap: int) -> list[str]:
+    """Split text into overlapping passages of at most ``size`` chars.
+
+    Passages end at a paragraph, sentence or word boundary found in the
+    second half of the window, and the next passage starts ``overlap``
+    characters earlier (moved forward to a word start), so a fact cut by
+    a boundary is fully present in one of the neighbours. Short texts,
+    including empty ones, give a single passage.
+    """
+    text = text.strip()
+    if len(text) <= size:
+        return [text]
+
+    passages: list[str] = []
+    start = 0
+    while start < len(text):
+        end = min(start + size, len(text))
+        if end < len(text):
+            end = _find_break(text, start + size // 2, end)
+        passages.append(text[start:end].strip())
+        if end >= len(text):
+            break
+
+        # Начинаем следующий фрагмент с перекрытием, с начала слова
+        next_start = max(end - overlap, start + 1)
+        if next_start < end and not text[next_start - 1].isspace():
+            space = text.find(" ", next_start, end)
+            next_start = space + 1 if space != -1 else next_start
+        start = next_start
+
+    return [passage for passage in passages if passage]
+
+
+def _find_break(text: str, lower: int, upper: int) -> int:
+    """Find the best passage end within ``[lower, upper]``."""
+    window = text[lower:upper]
+    for pattern in _BREAK_PATTERNS:
+        matches = list(pattern.finditer(window))
+        if matches:
+            return lower + matches[-1].end()
+    return upper
@@ -1,7 +1,17 @@
+import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import UUID, uuid4
 
+# Разделитель полей при хешировании (допустим в тексте PostgreSQL)
+_HASH_FIELD_SEPARATOR = "\x1f"
+
+
+def compute_content_hash(title: str, content: str) -> str:
+    """Compute fingerprint of the source text used to detect changes."""
+    text = f"{title}{_HASH_FIELD_SEPARATOR}{content}"
+    return hashlib.sha256(text.encode()).hexdigest()
+
 
 @dataclass(frozen=True)
 class Source:
@@ -12,4 +22,8 @@ class Source:
     content: str
     created_at: datetime
     updated_at: datetime | None = None
+    content_hash: str | None = None
+    # HTTP валидаторы для условной повторной загрузки
+    etag: str | None = None
+    last_modified: str | None = None
     id: UUID = field(default_factory=uuid4)
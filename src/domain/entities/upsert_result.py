@@ -0,0 +1,20 @@
+from dataclasses import dataclass, field
+
+from .source import Source
+
+
+@dataclass(frozen=True)
+class SourceUpsertResult:
+    """Outcome of saving a batch of sources."""
+
+    created: list[Source] = field(default_factory=list)
+    updated: list[Source] = field(default_factory=list)
+    # URL источников, содержимое которых не изменилось
+    unchanged: list[str] = field(default_factory=list)
+    # URL -> причина ошибки
+    failures: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def saved(self) -> list[Source]:
+        """Sources that were actually written."""
+        return self.created + self.updated
@@ -9,6 +9,9 @@ from .base import (
 )
 from .repository import (
     AnswerRepositoryError,
+    IngestionJobLeaseLostError,
+    IngestionJobRepositoryError,
+    QuestionAnswerRepositoryError,
     QuestionRepositoryError,
     RepositoryError,
     SourceRepositoryError,
@@ -16,6 +19,7 @@ from .repository import (
 from .service import (
     ContentParsingServiceError,
     LLMServiceError,
+    LLMUnavailableError,
     ServiceError,
     SourceMatchingServiceError,
 )
@@ -27,8 +31,12 @@ __all__ = [
     "ContentParsingServiceError",
     "DomainError",
     "ForbiddenError",
+    "IngestionJobLeaseLostError",
+    "IngestionJobRepositoryError",
     "LLMServiceError",
+    "LLMUnavailableError",
     "NotFoundError",
+    "QuestionAnswerRepositoryError",
     "QuestionRepositoryError",
     "RepositoryError",
     "ServiceError",
@@ -24,5 +24,17 @@ class QuestionRepositoryError(RepositoryError):
     """Ошибка репозитория вопросов."""
 
 
+class IngestionJobRepositoryError(RepositoryError):
+    """Ошибка репозитория задач загрузки источников."""
+
+
+class IngestionJobLeaseLostError(IngestionJobRepositoryError):
+    """Задача загрузки захвачена другим исполнителем."""
+
+
+class QuestionAnswerRepositoryError(RepositoryError):
+    """Ошибка совместной записи вопроса и ответа."""
+
+
 class SourceRepositoryError(RepositoryError):
     """Ошибка репозитория источников."""
@@ -28,6 +28,26 @@ class LLMServiceError(ServiceError):
         super().__init__(message, original_error=original_error, **kwargs)
 
 
+class LLMUnavailableError(LLMServiceError):
+    """Exception raised when the LLM is overloaded and the call is shed."""
+
+    def __init__(
+        self,
+        message: str = "LLM is temporarily unavailable",
+        *,
+        retry_after: float | None = None,
+        original_error: Exception | None = None,
+        **kwargs: Any,
+    ) -> None:
+        details = kwargs.pop("details", {})
+        if retry_after is not None:
+            details["retry_after"] = retry_after
+        super().__init__(
+            message, original_error=original_error, details=details, **kwargs
+        )
+        self.retry_after = retry_after
+
+
 class ContentParsingServiceError(ServiceError):
     """Exception raised by content parsing service."""
 
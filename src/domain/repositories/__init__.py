@@ -1,9 +1,13 @@
 from .answer import AnswerRepositoryInterface
+from .ingestion_job import IngestionJobRepositoryInterface
 from .question import QuestionRepositoryInterface
+from .question_answer import QuestionAnswerRepositoryInterface
 from .source import SourceRepositoryInterface
 
 __all__ = [
     "AnswerRepositoryInterface",
+    "IngestionJobRepositoryInterface",
+    "QuestionAnswerRepositoryInterface",
     "QuestionRepositoryInterface",
     "SourceRepositoryInterface",
 ]
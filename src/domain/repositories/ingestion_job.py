@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from src.domain.entities import IngestionJob
+
+
+class IngestionJobRepositoryInterface(ABC):
+    """Abstract repository for background ingestion jobs."""
+
+    @abstractmethod
+    async def get_by_id(self, job_id: UUID) -> IngestionJob | None:
+        """Get job by ID."""
+
+    @abstractmethod
+    async def claim_unfinished(
+        self, owner: str, lease_timeout: float
+    ) -> list[IngestionJob]:
+        """Take over unfinished jobs whose lease has expired.
+
+        A job's lease expires when its owner has not renewed it for
+        ``lease_timeout`` seconds. Claimed jobs get the new ``owner``
+        and a fresh heartbeat; concurrent claims never take the same job.
+        """
+
+    @abstractmethod
+    async def renew_lease(self, job_id: UUID, owner: str) -> bool:
+        """Refresh the heartbeat, returning False if the lease was lost."""
+
+    @abstractmethod
+    async def release(self, owner: str) -> int:
+        """Drop the leases of the owner's unfinished jobs.
+
+        Released jobs can be claimed at once, without waiting for the
+        lease to expire.
+        """
+
+    @abstractmethod
+    async def create(self, job: IngestionJob) -> IngestionJob:
+        """Create new job."""
+
+    @abstractmethod
+    async def update(self, job: IngestionJob) -> IngestionJob:
+        """Save job status and progress, renewing the job's lease.
+
+        Raises ``IngestionJobLeaseLostError`` when the job is owned by
+        another runner.
+        """
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities import Answer, Question
+
+
+class QuestionAnswerRepositoryInterface(ABC):
+    """Abstract unit of work persisting a question with its answer."""
+
+    @abstractmethod
+    async def create(
+        self, question: Question, answer: Answer
+    ) -> tuple[Question, Answer]:
+        """Save question and answer in a single transaction."""
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
-from src.domain.entities import Source
+from src.domain.entities import CacheValidators, Source, SourceUpsertResult
 
 
 class SourceRepositoryInterface(ABC):
@@ -19,6 +20,25 @@ class SourceRepositoryInterface(ABC):
     async def get_all(self) -> list[Source]:
         """Get all sources."""
 
+    @abstractmethod
+    async def search_passages(
+        self, query: str, limit: int, passages_per_source: int
+    ) -> list[Source]:
+        """Get top sources for a full-text query, best first.
+
+        ``content`` of each returned source holds only its best passages.
+        """
+
+    @abstractmethod
+    async def get_fingerprint(self) -> tuple[int, datetime | None]:
+        """Get sources count and the latest modification time."""
+
+    @abstractmethod
+    async def get_cache_validators(
+        self, urls: list[str]
+    ) -> dict[str, CacheValidators]:
+        """Get stored HTTP validators for the given URLs."""
+
     @abstractmethod
     async def create(self, source: Source) -> Source:
         """Create new source."""
@@ -27,6 +47,18 @@ class SourceRepositoryInterface(ABC):
     async def create_or_update(self, source: Source) -> Source:
         """Create new source or update existing one."""
 
+    @abstractmethod
+    async def bulk_upsert(
+        self,
+        sources: list[Source],
+        passages: dict[str, list[str]] | None = None,
+    ) -> SourceUpsertResult:
+        """Create or update many sources, reporting per-URL failures.
+
+        ``passages`` (URL -> passages) replace the stored passages of
+        created and updated sources.
+        """
+
     @abstractmethod
     async def update(self, source: Source) -> Source:
         """Update existing source."""
@@ -1,9 +1,13 @@
+from .answer_cache import AnswerCacheInterface
 from .content_parsing import ContentParsingServiceInterface
 from .llm import LLMServiceInterface
+from .source_corpus import SourceCorpusServiceInterface
 from .source_matching import SourceMatchingServiceInterface
 
 __all__ = [
+    "AnswerCacheInterface",
     "ContentParsingServiceInterface",
     "LLMServiceInterface",
+    "SourceCorpusServiceInterface",
     "SourceMatchingServiceInterface",
 ]
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+
+class AnswerCacheInterface(ABC):
+    """Abstract key-value cache for generated answers."""
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None:
+        """Get cached answer by key."""
+
+    @abstractmethod
+    async def set(self, key: str, answer: str) -> None:
+        """Store answer under the key."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all cached answers."""
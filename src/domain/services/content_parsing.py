@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator
 
-from src.domain.entities import Source
+from src.domain.entities import CacheValidators, ParseResult, Source
 
 
 class ContentParsingServiceInterface(ABC):
@@ -13,3 +14,29 @@ class ContentParsingServiceInterface(ABC):
     @abstractmethod
     async def parse_urls(self, urls: list[str]) -> list[Source]:
         """Parse content from multiple URLs."""
+
+    @abstractmethod
+    async def parse_urls_detailed(
+        self,
+        urls: list[str],
+        validators: dict[str, CacheValidators] | None = None,
+    ) -> list[ParseResult]:
+        """Parse multiple URLs and report a result per URL in input order.
+
+        URLs with known ``validators`` are requested conditionally and
+        reported as ``not_modified`` when the page has not changed.
+        """
+
+    async def iter_parse_urls(
+        self,
+        urls: list[str],
+        validators: dict[str, CacheValidators] | None = None,
+    ) -> AsyncGenerator[ParseResult, None]:
+        """Parse multiple URLs, yielding results as soon as they are ready.
+
+        Results come in completion order. The default implementation
+        waits for ``parse_urls_detailed``; streaming implementations keep
+        only a bounded number of parsed pages in memory.
+        """
+        for result in await self.parse_urls_detailed(urls, validators):
+            yield result
@@ -1,17 +1,34 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
-from src.domain.entities import Source
+from src.domain.entities import LLMCompletion, Source
 
 
 class LLMServiceInterface(ABC):
     """Abstract service for LLM interactions."""
 
     @abstractmethod
-    async def generate_answer(self, question: str) -> str:
+    async def generate_answer(self, question: str) -> LLMCompletion:
         """Generate answer based on question."""
 
     @abstractmethod
     async def generate_answer_with_sources(
         self, question: str, sources: list[Source]
-    ) -> str:
+    ) -> LLMCompletion:
         """Generate answer based on question and relevant sources."""
+
+    async def stream_answer(
+        self, question: str, sources: list[Source] | None = None
+    ) -> AsyncIterator[str]:
+        """Stream answer text as it is generated.
+
+        Implementations without native streaming yield the whole answer
+        as a single chunk.
+        """
+        if sources:
+            completion = await self.generate_answer_with_sources(
+                question, sources
+            )
+        else:
+            completion = await self.generate_answer(question)
+        yield completion.text
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities import Source
+
+
+class SourceCorpusServiceInterface(ABC):
+    """Abstract service providing the current corpus of sources."""
+
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """Version of the currently loaded corpus snapshot."""
+
+    @abstractmethod
+    async def get_sources(self) -> list[Source]:
+        """Get sources of the current corpus snapshot."""
+
+    @abstractmethod
+    async def refresh(self) -> None:
+        """Reload the corpus snapshot from the storage."""
+
+    @abstractmethod
+    async def refresh_after_write(self) -> None:
+        """Reload the snapshot after sources were saved, without raising.
+
+        The sources are already stored, so a failed reload must not fail
+        the write: the snapshot catches up on a later revalidation.
+        """
@@ -6,8 +6,30 @@ from src.domain.entities import Source
 class SourceMatchingServiceInterface(ABC):
     """Abstract service for matching sources to questions."""
 
+    # Нужен ли сервису корпус источников в памяти приложения
+    requires_corpus: bool = True
+
     @abstractmethod
     async def find_relevant_sources(
         self, question: str, sources: list[Source]
     ) -> list[Source]:
-        """Find sources relevant to the question."""
+        """Find sources relevant to the question.
+
+        Services with ``requires_corpus = False`` search the storage
+        themselves and ignore ``sources``.
+        """
+
+    def confidence(
+        self,
+        question: str,  # noqa: ARG002
+        sources: list[Source],  # noqa: ARG002
+    ) -> float:
+        """Estimate from 0 to 1 how well found sources answer the question.
+
+        ``sources`` are the results of ``find_relevant_sources``. Services
+        that cannot estimate it are never confident.
+        """
+        return 0.0
+
+    def prepare(self, sources: list[Source]) -> None:  # noqa: B027
+        """Precompute derived search structures for a corpus."""
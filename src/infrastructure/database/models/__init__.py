@@ -1,13 +1,20 @@
 """Database models package."""
 
+from .answer_cache import AnswerCacheModel
 from .base import Base, BaseModel
+from .ingestion_job import IngestionJobModel
 from .question_answer import AnswerModel, QuestionModel
 from .source import SourceModel
+from .source_chunk import FULL_TEXT_CONFIG, SourceChunkModel
 
 __all__ = [
+    "FULL_TEXT_CONFIG",
+    "AnswerCacheModel",
     "AnswerModel",
     "Base",
     "BaseModel",
+    "IngestionJobModel",
     "QuestionModel",
+    "SourceChunkModel",
     "SourceModel",
 ]
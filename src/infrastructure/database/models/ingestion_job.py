@@ -0,0 +1,37 @@
+"""Database configuration and models."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+class IngestionJobModel(BaseModel):
+    """Database model for background ingestion jobs."""
+
+    __tablename__ = "ingestion_jobs"
+
+    urls: Mapped[list[str]] = mapped_column(JSONB, nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False, index=True)
+    processed: Mapped[int] = mapped_column(Integer, nullable=False)
+    fetched: Mapped[int] = mapped_column(Integer, nullable=False)
+    parsed: Mapped[int] = mapped_column(Integer, nullable=False)
+    saved: Mapped[int] = mapped_column(Integer, nullable=False)
+    unchanged: Mapped[int] = mapped_column(Integer, nullable=False)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False)
+    errors: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    error: Mapped[str | None] = mapped_column(Text)
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True)
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True)
+    )
+    owner: Mapped[str | None] = mapped_column(String(128))
+    heartbeat_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True)
+    )
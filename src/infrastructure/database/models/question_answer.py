@@ -1,9 +1,10 @@
 """Database configuration and models."""
 
 import uuid
+from typing import Any
 
-from sqlalchemy import ForeignKey, Integer, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, ForeignKey, Integer, Text, false
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel
@@ -19,6 +20,13 @@ class AnswerModel(BaseModel):
     )
     text: Mapped[str] = mapped_column(Text, nullable=False)
     processing_time_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+    time_to_first_token_ms: Mapped[int | None] = mapped_column(Integer)
+    # Разбивка времени обработки по этапам (мс) и расход токенов
+    timings: Mapped[dict[str, Any] | None] = mapped_column(JSONB)
+    # Ответ составлен из источников без LLM
+    degraded: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default=false()
+    )
 
     # Отношения
     question: Mapped["QuestionModel"] = relationship(back_populates="answers")
@@ -23,6 +23,11 @@ class SourceModel(BaseModel):
     )
     title: Mapped[str] = mapped_column(String, nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
+    # sha256 заголовка и содержимого для обнаружения изменений
+    content_hash: Mapped[str | None] = mapped_column(String(64))
+    # Заголовки ETag и Last-Modified последней загрузки
+    etag: Mapped[str | None] = mapped_column(String)
+    last_modified: Mapped[str | None] = mapped_column(String)
     updated_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), onupdate=func.now()
     )
@@ -0,0 +1,57 @@
+"""Database configuration and models."""
+
+import uuid
+
+from sqlalchemy import (
+    Computed,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+# Конфигурация полнотекстового поиска PostgreSQL
+FULL_TEXT_CONFIG = "russian"
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{FULL_TEXT_CONFIG}', title), 'A') || "
+    f"setweight(to_tsvector('{FULL_TEXT_CONFIG}', text), 'B')"
+)
+
+
+class SourceChunkModel(BaseModel):
+    """Database model for overlapping passages of a source."""
+
+    __tablename__ = "source_chunks"
+    __table_args__ = (
+        UniqueConstraint("source_id", "position"),
+        Index(
+            "ix_source_chunks_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+    )
+
+    source_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("sources.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    # Порядковый номер фрагмента в тексте источника
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Копия заголовка источника для взвешивания в поисковом векторе
+    title: Mapped[str] = mapped_column(String, nullable=False)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    # Заголовок (вес A) и текст фрагмента (вес B) для полнотекстового
+    # поиска; вычисляется базой и не загружается вместе с фрагментом
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        deferred=True,
+    )
@@ -1,9 +1,15 @@
 from .answer import AnswerRepository
+from .ingestion_job import IngestionJobRepository
 from .question import QuestionRepository
+from .question_answer import QuestionAnswerRepository
 from .source import SourceRepository
+from .write_behind import WriteBehindQuestionAnswerRepository
 
 __all__ = [
     "AnswerRepository",
+    "IngestionJobRepository",
+    "QuestionAnswerRepository",
     "QuestionRepository",
     "SourceRepository",
+    "WriteBehindQuestionAnswerRepository",
 ]
@@ -6,7 +6,7 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.entities import Answer
+from src.domain.entities import Answer, AnswerTimings
 from src.domain.exceptions.repository import AnswerRepositoryError
 from src.domain.repositories import (
     AnswerRepositoryInterface,
@@ -90,7 +90,7 @@ class AnswerRepository(AnswerRepositoryInterface):
             model = self._domain_to_model(answer)
             self.session.add(model)
             await self.session.commit()
-            await self.session.refresh(model)
+            # Идентификатор и время создания заданы на клиенте
             return self._model_to_domain(model)
         except AnswerRepositoryError:
             # Пробросить доменные исключения без изменений
@@ -133,6 +133,8 @@ class AnswerRepository(AnswerRepositoryInterface):
             column.name: getattr(model, column.name)
             for column in model.__table__.columns
         }
+        if answer_data["timings"] is not None:
+            answer_data["timings"] = AnswerTimings(**answer_data["timings"])
         return Answer(**answer_data)
 
     @staticmethod
@@ -0,0 +1,210 @@
+"""Repository implementations."""
+
+import logging
+from dataclasses import asdict
+from datetime import timedelta
+from uuid import UUID
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities import IngestionJob, IngestionJobStatus
+from src.domain.exceptions.repository import (
+    IngestionJobLeaseLostError,
+    IngestionJobRepositoryError,
+)
+from src.domain.repositories import IngestionJobRepositoryInterface
+from src.infrastructure.database.models import IngestionJobModel
+
+logger = logging.getLogger(__name__)
+
+_UNFINISHED_STATUSES = (
+    IngestionJobStatus.PENDING,
+    IngestionJobStatus.RUNNING,
+)
+
+
+class IngestionJobRepository(IngestionJobRepositoryInterface):
+    """SQLAlchemy implementation of IngestionJobRepository."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_by_id(self, job_id: UUID) -> IngestionJob | None:
+        """Get job by ID."""
+        try:
+            result = await self.session.execute(
+                select(IngestionJobModel).where(IngestionJobModel.id == job_id)
+            )
+            model = result.scalar_one_or_none()
+            return self._model_to_domain(model) if model else None
+        except SQLAlchemyError as e:
+            logger.error(
+                "Database error while getting ingestion job %s: %s",
+                job_id,
+                str(e),
+            )
+            raise IngestionJobRepositoryError(
+                f"Failed to get ingestion job by ID: {job_id}",
+                original_error=e,
+            ) from e
+
+    async def claim_unfinished(
+        self, owner: str, lease_timeout: float
+    ) -> list[IngestionJob]:
+        """Take over unfinished jobs whose lease has expired."""
+        # Время берется из базы, чтобы не зависеть от часов исполнителей;
+        # SKIP LOCKED не дает двум исполнителям захватить одну задачу
+        expired_jobs = (
+            select(IngestionJobModel.id)
+            .where(
+                IngestionJobModel.status.in_(_UNFINISHED_STATUSES),
+                or_(
+                    IngestionJobModel.heartbeat_at.is_(None),
+                    IngestionJobModel.heartbeat_at
+                    < func.now() - timedelta(seconds=lease_timeout),
+                ),
+            )
+            .with_for_update(skip_locked=True)
+        )
+        try:
+            result = await self.session.execute(
+                update(IngestionJobModel)
+                .where(IngestionJobModel.id.in_(expired_jobs))
+                .values(owner=owner, heartbeat_at=func.now())
+                .returning(IngestionJobModel)
+                .execution_options(synchronize_session=False)
+            )
+            jobs = [self._model_to_domain(model) for model in result.scalars()]
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error(
+                "Database error while claiming ingestion jobs: %s", str(e)
+            )
+            raise IngestionJobRepositoryError(
+                "Failed to claim unfinished ingestion jobs",
+                original_error=e,
+            ) from e
+
+        return sorted(jobs, key=lambda job: job.created_at)
+
+    async def renew_lease(self, job_id: UUID, owner: str) -> bool:
+        """Refresh the heartbeat, returning False if the lease was lost."""
+        try:
+            result = await self.session.execute(
+                update(IngestionJobModel)
+                .where(
+                    IngestionJobModel.id == job_id,
+                    IngestionJobModel.owner == owner,
+                )
+                .values(heartbeat_at=func.now())
+                .returning(IngestionJobModel.id)
+            )
+            renewed = result.scalar_one_or_none() is not None
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error(
+                "Database error while renewing ingestion job %s lease: %s",
+                job_id,
+                str(e),
+            )
+            raise IngestionJobRepositoryError(
+                f"Failed to renew ingestion job lease: {job_id}",
+                original_error=e,
+            ) from e
+
+        return renewed
+
+    async def release(self, owner: str) -> int:
+        """Drop the leases of the owner's unfinished jobs."""
+        try:
+            result = await self.session.execute(
+                update(IngestionJobModel)
+                .where(
+                    IngestionJobModel.owner == owner,
+                    IngestionJobModel.status.in_(_UNFINISHED_STATUSES),
+                )
+                .values(owner=None, heartbeat_at=None)
+                .returning(IngestionJobModel.id)
+            )
+            released = len(result.scalars().all())
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error(
+                "Database error while releasing ingestion jobs: %s", str(e)
+            )
+            raise IngestionJobRepositoryError(
+                "Failed to release ingestion jobs",
+                original_error=e,
+            ) from e
+
+        return released
+
+    async def create(self, job: IngestionJob) -> IngestionJob:
+        """Create new job."""
+        try:
+            self.session.add(IngestionJobModel(**asdict(job)))
+            await self.session.commit()
+            return job
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error(
+                "Database error while creating ingestion job %s: %s",
+                job.id,
+                str(e),
+            )
+            raise IngestionJobRepositoryError(
+                f"Failed to create ingestion job: {job.id}",
+                original_error=e,
+            ) from e
+
+    async def update(self, job: IngestionJob) -> IngestionJob:
+        """Save job status and progress, renewing the job's lease."""
+        values = asdict(job)
+        # Список URL, время создания и владелец задачи не меняются
+        for column in ("id", "urls", "created_at", "owner", "heartbeat_at"):
+            values.pop(column)
+
+        try:
+            result = await self.session.execute(
+                update(IngestionJobModel)
+                .where(
+                    IngestionJobModel.id == job.id,
+                    IngestionJobModel.owner.is_not_distinct_from(job.owner),
+                )
+                .values(**values, heartbeat_at=func.now())
+                .returning(IngestionJobModel.id)
+            )
+            updated = result.scalar_one_or_none() is not None
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error(
+                "Database error while updating ingestion job %s: %s",
+                job.id,
+                str(e),
+            )
+            raise IngestionJobRepositoryError(
+                f"Failed to update ingestion job: {job.id}",
+                original_error=e,
+            ) from e
+
+        if not updated:
+            raise IngestionJobLeaseLostError(
+                f"Ingestion job {job.id} is owned by another runner"
+            )
+        return job
+
+    @staticmethod
+    def _model_to_domain(model: IngestionJobModel) -> IngestionJob:
+        """Convert database model to domain model."""
+        job_data = {
+            column.name: getattr(model, column.name)
+            for column in model.__table__.columns
+        }
+        job_data["status"] = IngestionJobStatus(job_data["status"])
+        return IngestionJob(**job_data)
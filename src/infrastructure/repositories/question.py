@@ -62,7 +62,7 @@ class QuestionRepository(QuestionRepositoryInterface):
             model = self._domain_to_model(question)
             self.session.add(model)
             await self.session.commit()
-            await self.session.refresh(model)
+            # Идентификатор и время создания заданы на клиенте
             return self._model_to_domain(model)
         except IntegrityError as e:
             logger.error(
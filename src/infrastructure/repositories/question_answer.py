@@ -0,0 +1,97 @@
+"""Repository implementations."""
+
+import logging
+from dataclasses import asdict
+
+from sqlalchemy import literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import Insert
+
+from src.domain.entities import Answer, Question
+from src.domain.exceptions.repository import QuestionAnswerRepositoryError
+from src.domain.repositories import QuestionAnswerRepositoryInterface
+from src.infrastructure.database.models import AnswerModel, QuestionModel
+
+logger = logging.getLogger(__name__)
+
+
+class QuestionAnswerRepository(QuestionAnswerRepositoryInterface):
+    """Writes a question and its answer in one statement and transaction.
+
+    Ids and timestamps are generated client-side, so nothing is read back:
+    the whole ask costs a single round-trip and a single commit.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(
+        self, question: Question, answer: Answer
+    ) -> tuple[Question, Answer]:
+        """Save question and answer in a single transaction."""
+        try:
+            await self.session.execute(
+                self._build_insert_statement(question, answer)
+            )
+            await self.session.commit()
+            return question, answer
+        except IntegrityError as e:
+            await self.session.rollback()
+            logger.error(
+                "Integrity error while creating question %s with answer: %s",
+                question.id,
+                str(e),
+            )
+            raise QuestionAnswerRepositoryError(
+                f"Question {question.id} or answer {answer.id} "
+                "already exists or violates constraints",
+                original_error=e,
+            ) from e
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error(
+                "Database error while creating question %s with answer: %s",
+                question.id,
+                str(e),
+            )
+            raise QuestionAnswerRepositoryError(
+                f"Failed to create question with answer: {question.id}",
+                original_error=e,
+            ) from e
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(
+                "Unexpected error while creating question %s with answer: %s",
+                question.id,
+                str(e),
+            )
+            raise QuestionAnswerRepositoryError(
+                "Unexpected error while creating question with answer: "
+                f"{question.id}",
+                original_error=e,
+            ) from e
+
+    @staticmethod
+    def _build_insert_statement(question: Question, answer: Answer) -> Insert:
+        """Build ``WITH q AS (INSERT ... RETURNING id) INSERT ...``."""
+        new_question = (
+            insert(QuestionModel)
+            .values(**asdict(question))
+            .returning(QuestionModel.id)
+            .cte("new_question")
+        )
+
+        answer_data = asdict(answer)
+        answer_data.pop("question_id")
+        columns = AnswerModel.__table__.columns
+        answer_values = [
+            literal(value, type_=columns[name].type).label(name)
+            for name, value in answer_data.items()
+        ]
+
+        return insert(AnswerModel).from_select(
+            ["question_id", *answer_data],
+            select(new_question.c.id, *answer_values),
+        )
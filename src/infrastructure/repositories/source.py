@@ -2,23 +2,91 @@
 
 import logging
 from dataclasses import asdict
-from uuid import UUID
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import case, delete, func, literal_column, or_, select, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.entities import Source
+from src.domain.entities import (
+    PASSAGE_SEPARATOR,
+    CacheValidators,
+    Source,
+    SourceUpsertResult,
+)
 from src.domain.exceptions.repository import SourceRepositoryError
 from src.domain.repositories import SourceRepositoryInterface
-from src.infrastructure.database.models import SourceModel
+from src.infrastructure.database.models import (
+    FULL_TEXT_CONFIG,
+    SourceChunkModel,
+    SourceModel,
+)
 
 logger = logging.getLogger(__name__)
 
+# Лучшие фрагменты лучших источников: ранжирование, группировка и
+# склейка фрагментов выполняются в базе
+_SEARCH_PASSAGES_QUERY = text(
+    f"""
+    WITH query AS (
+        SELECT to_tsquery('{FULL_TEXT_CONFIG}', :query) AS value
+    ),
+    ranked AS (
+        SELECT
+            chunk.source_id,
+            chunk.position,
+            chunk.text,
+            ts_rank_cd(chunk.search_vector, query.value) AS rank
+        FROM source_chunks AS chunk, query
+        WHERE chunk.search_vector @@ query.value
+    ),
+    numbered AS (
+        SELECT
+            ranked.*,
+            row_number() OVER (
+                PARTITION BY source_id ORDER BY rank DESC, position
+            ) AS number
+        FROM ranked
+    ),
+    best AS (
+        SELECT source_id, max(rank) AS score
+        FROM ranked
+        GROUP BY source_id
+        ORDER BY score DESC, source_id
+        LIMIT :limit
+    )
+    SELECT
+        source.id,
+        source.url,
+        source.title,
+        string_agg(
+            numbered.text, :separator ORDER BY numbered.position
+        ) AS content,
+        source.created_at,
+        source.updated_at,
+        source.content_hash,
+        source.etag,
+        source.last_modified
+    FROM best
+    JOIN sources AS source ON source.id = best.source_id
+    JOIN numbered
+        ON numbered.source_id = best.source_id
+        AND numbered.number <= :passages_per_source
+    GROUP BY source.id, best.score
+    ORDER BY best.score DESC, source.id
+    """
+)
+
 
 class SourceRepository(SourceRepositoryInterface):
     """SQLAlchemy implementation of SourceRepository."""
 
+    # Строк в одном INSERT (лимит параметров PostgreSQL - 32767)
+    UPSERT_CHUNK_SIZE = 500
+    PASSAGE_INSERT_CHUNK_SIZE = 2000
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
@@ -105,6 +173,105 @@ class SourceRepository(SourceRepositoryInterface):
                 original_error=e,
             ) from e
 
+    async def search_passages(
+        self, query: str, limit: int, passages_per_source: int
+    ) -> list[Source]:
+        """Get top sources with their best passages as ``content``.
+
+        ``query`` is a ``to_tsquery`` expression. Passages are ranked with
+        ``ts_rank_cd`` over the weighted ``search_vector`` column, a source
+        ranks by its best passage, and only the top ``limit`` sources with
+        at most ``passages_per_source`` passages each are transferred.
+        """
+        try:
+            result = await self.session.execute(
+                _SEARCH_PASSAGES_QUERY,
+                {
+                    "query": query,
+                    "limit": limit,
+                    "passages_per_source": passages_per_source,
+                    "separator": PASSAGE_SEPARATOR,
+                },
+            )
+            return [Source(**row) for row in result.mappings()]
+        except SQLAlchemyError as e:
+            logger.error(
+                "Database error while searching sources: %s",
+                str(e),
+            )
+            raise SourceRepositoryError(
+                "Failed to search sources",
+                original_error=e,
+            ) from e
+
+    async def get_fingerprint(self) -> tuple[int, datetime | None]:
+        """Get sources count and the latest modification time."""
+        try:
+            result = await self.session.execute(
+                select(
+                    func.count(SourceModel.id),
+                    func.max(
+                        func.coalesce(
+                            SourceModel.updated_at, SourceModel.created_at
+                        )
+                    ),
+                )
+            )
+            count, last_modified = result.one()
+            return int(count), last_modified
+        except SQLAlchemyError as e:
+            logger.error(
+                "Database error while getting sources fingerprint: %s",
+                str(e),
+            )
+            raise SourceRepositoryError(
+                "Failed to get sources fingerprint",
+                original_error=e,
+            ) from e
+        except Exception as e:
+            logger.error(
+                "Unexpected error while getting sources fingerprint: %s",
+                str(e),
+            )
+            raise SourceRepositoryError(
+                "Unexpected error while getting sources fingerprint",
+                original_error=e,
+            ) from e
+
+    async def get_cache_validators(
+        self, urls: list[str]
+    ) -> dict[str, CacheValidators]:
+        """Get stored HTTP validators for the given URLs."""
+        if not urls:
+            return {}
+        try:
+            result = await self.session.execute(
+                select(
+                    SourceModel.url,
+                    SourceModel.etag,
+                    SourceModel.last_modified,
+                ).where(
+                    SourceModel.url.in_(urls),
+                    or_(
+                        SourceModel.etag.is_not(None),
+                        SourceModel.last_modified.is_not(None),
+                    ),
+                )
+            )
+            return {
+                url: CacheValidators(etag=etag, last_modified=last_modified)
+                for url, etag, last_modified in result.all()
+            }
+        except SQLAlchemyError as e:
+            logger.error(
+                "Database error while getting cache validators: %s",
+                str(e),
+            )
+            raise SourceRepositoryError(
+                "Failed to get cache validators",
+                original_error=e,
+            ) from e
+
     async def create(self, source: Source) -> Source:
         """Create new source."""
         try:
@@ -148,8 +315,6 @@ class SourceRepository(SourceRepositoryInterface):
     async def create_or_update(self, source: Source) -> Source:
         """Create new source or update existing one using UPSERT."""
         try:
-            from sqlalchemy.dialects.postgresql import insert
-
             source_data = asdict(source)
             stmt = insert(SourceModel).values(**source_data)
 
@@ -159,6 +324,9 @@ class SourceRepository(SourceRepositoryInterface):
                 set_={
                     "title": stmt.excluded.title,
                     "content": stmt.excluded.content,
+                    "content_hash": stmt.excluded.content_hash,
+                    "etag": stmt.excluded.etag,
+                    "last_modified": stmt.excluded.last_modified,
                     "updated_at": stmt.excluded.updated_at,
                 },
             )
@@ -197,6 +365,174 @@ class SourceRepository(SourceRepositoryInterface):
                 original_error=e,
             ) from e
 
+    async def bulk_upsert(
+        self,
+        sources: list[Source],
+        passages: dict[str, list[str]] | None = None,
+    ) -> SourceUpsertResult:
+        """Create or update many sources with multi-row UPSERTs.
+
+        Each chunk is a single ``INSERT ... ON CONFLICT DO UPDATE ...
+        RETURNING`` statement with its own commit. Rows whose
+        ``content_hash`` and HTTP validators did not change are left
+        untouched, so recrawling a static page writes nothing. When only
+        the validators changed, they are stored but ``updated_at`` is kept
+        and the source is reported as unchanged. If a chunk fails, its rows
+        are retried one by one to report which URLs were rejected.
+
+        ``passages`` (URL -> passages) replace the stored passages of
+        created and updated sources in the same transaction.
+        """
+        passages = passages or {}
+        # Одна команда не может обновить строку дважды - оставляем
+        # последнюю версию каждого URL
+        unique_sources = list(
+            {source.url: source for source in sources}.values()
+        )
+
+        result = SourceUpsertResult()
+        for start in range(0, len(unique_sources), self.UPSERT_CHUNK_SIZE):
+            chunk = unique_sources[start : start + self.UPSERT_CHUNK_SIZE]
+            try:
+                await self._upsert_chunk(chunk, result, passages)
+            except SQLAlchemyError as e:
+                logger.warning(
+                    "Bulk upsert of %d sources failed, retrying one by one: "
+                    "%s",
+                    len(chunk),
+                    str(e),
+                )
+                await self._upsert_one_by_one(chunk, result, passages)
+
+        return result
+
+    async def _upsert_one_by_one(
+        self,
+        sources: list[Source],
+        result: SourceUpsertResult,
+        passages: dict[str, list[str]],
+    ) -> None:
+        """Upsert sources separately, collecting per-URL failures."""
+        for source in sources:
+            try:
+                await self._upsert_chunk([source], result, passages)
+            except SQLAlchemyError as e:
+                logger.error(
+                    "Database error while upserting source %s: %s",
+                    source.url,
+                    str(e),
+                )
+                result.failures[source.url] = (
+                    f"Failed to save source: {type(e).__name__}"
+                )
+
+    async def _upsert_chunk(
+        self,
+        sources: list[Source],
+        result: SourceUpsertResult,
+        passages: dict[str, list[str]],
+    ) -> None:
+        """Upsert sources in one statement, commit and sort outcomes."""
+        insert_stmt = insert(SourceModel).values(
+            [asdict(source) for source in sources]
+        )
+        excluded = insert_stmt.excluded
+        content_changed = SourceModel.content_hash.is_distinct_from(
+            excluded.content_hash
+        )
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["url"],
+            set_={
+                "title": excluded.title,
+                "content": excluded.content,
+                "content_hash": excluded.content_hash,
+                "etag": excluded.etag,
+                "last_modified": excluded.last_modified,
+                "updated_at": case(
+                    (content_changed, excluded.updated_at),
+                    else_=SourceModel.updated_at,
+                ),
+            },
+            # Неизмененные строки не переписываем и не возвращаем
+            where=or_(
+                content_changed,
+                SourceModel.etag.is_distinct_from(excluded.etag),
+                SourceModel.last_modified.is_distinct_from(
+                    excluded.last_modified
+                ),
+            ),
+        ).returning(
+            *SourceModel.__table__.columns,
+            # xmax = 0 только у строк, вставленных этой командой
+            literal_column("xmax = 0").label("inserted"),
+        )
+
+        sources_by_url = {source.url: source for source in sources}
+        created: list[Source] = []
+        updated: list[Source] = []
+        try:
+            rows = (await self.session.execute(stmt)).mappings().all()
+            for row in rows:
+                source_data = dict(row)
+                inserted = source_data.pop("inserted")
+                source = Source(**source_data)
+                if inserted:
+                    created.append(source)
+                # updated_at меняется только при изменении содержимого
+                elif (
+                    source.updated_at == sources_by_url[source.url].updated_at
+                ):
+                    updated.append(source)
+
+            await self._replace_passages(created + updated, passages)
+            await self.session.commit()
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+
+        result.created.extend(created)
+        result.updated.extend(updated)
+        changed_urls = {source.url for source in created + updated}
+        result.unchanged.extend(
+            url for url in sources_by_url if url not in changed_urls
+        )
+
+    async def _replace_passages(
+        self, sources: list[Source], passages: dict[str, list[str]]
+    ) -> None:
+        """Replace stored passages of changed sources (no commit)."""
+        sources = [source for source in sources if source.url in passages]
+        if not sources:
+            return
+
+        await self.session.execute(
+            delete(SourceChunkModel).where(
+                SourceChunkModel.source_id.in_(
+                    [source.id for source in sources]
+                )
+            )
+        )
+
+        now = datetime.now(UTC)
+        rows = [
+            {
+                "id": uuid4(),
+                "source_id": source.id,
+                "position": position,
+                "title": source.title,
+                "text": passage,
+                "created_at": now,
+            }
+            for source in sources
+            for position, passage in enumerate(passages[source.url])
+        ]
+        for start in range(0, len(rows), self.PASSAGE_INSERT_CHUNK_SIZE):
+            await self.session.execute(
+                insert(SourceChunkModel).values(
+                    rows[start : start + self.PASSAGE_INSERT_CHUNK_SIZE]
+                )
+            )
+
     async def update(self, source: Source) -> Source:
         """Update existing source."""
         try:
@@ -208,6 +544,9 @@ class SourceRepository(SourceRepositoryInterface):
             model.url = source.url
             model.title = source.title
             model.content = source.content
+            model.content_hash = source.content_hash
+            model.etag = source.etag
+            model.last_modified = source.last_modified
             model.updated_at = source.updated_at
 
             await self.session.commit()
@@ -0,0 +1,159 @@
+"""Write-behind persistence of questions and answers."""
+
+import asyncio
+import logging
+from dataclasses import asdict
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.entities import Answer, Question
+from src.domain.exceptions.repository import QuestionAnswerRepositoryError
+from src.domain.repositories import QuestionAnswerRepositoryInterface
+from src.infrastructure.database.models import AnswerModel, QuestionModel
+
+logger = logging.getLogger(__name__)
+
+QuestionAnswerPair = tuple[Question, Answer]
+
+
+class WriteBehindQuestionAnswerRepository(QuestionAnswerRepositoryInterface):
+    """Queues question/answer pairs and writes them in batches.
+
+    ``create`` returns as soon as the pair is queued. A background task
+    flushes the queue with multi-row ``INSERT`` statements when a batch
+    is full or ``flush_interval`` has passed. When the queue is full,
+    ``create`` waits for free space, so the database sets the pace under
+    sustained load. ``close`` drains the queue on shutdown.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        queue_size: int = 1000,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+    ) -> None:
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # None - сигнал остановки фоновой задачи
+        self._queue: asyncio.Queue[QuestionAnswerPair | None] = asyncio.Queue(
+            maxsize=queue_size
+        )
+        self._worker: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Number of pairs waiting to be written."""
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start the background flushing task."""
+        if self._worker is None:
+            self._worker = asyncio.create_task(
+                self._run(), name="qa-write-behind"
+            )
+
+    async def close(self) -> None:
+        """Stop accepting pairs and flush everything queued."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._worker is not None:
+            await self._queue.put(None)
+            await self._worker
+        logger.info("Write-behind queue closed")
+
+    async def create(
+        self, question: Question, answer: Answer
+    ) -> tuple[Question, Answer]:
+        """Queue question and answer for saving."""
+        if self._closed or self._worker is None:
+            # Во время остановки пишем напрямую, чтобы не потерять данные
+            await self._write_batch([(question, answer)])
+        else:
+            await self._queue.put((question, answer))
+        return question, answer
+
+    async def _run(self) -> None:
+        """Collect pairs into batches and flush them."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                break
+
+            batch = [first]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[QuestionAnswerPair]) -> None:
+        """Write a batch, isolating failing pairs if the batch fails."""
+        try:
+            await self._write_batch(batch)
+            logger.debug("Flushed %d question/answer pairs", len(batch))
+            return
+        except Exception as e:
+            if len(batch) == 1:
+                self._log_dropped(batch[0], e)
+                return
+            logger.warning(
+                "Batch write of %d pairs failed, retrying one by one: %s",
+                len(batch),
+                e,
+            )
+
+        for pair in batch:
+            try:
+                await self._write_batch([pair])
+            except Exception as e:
+                self._log_dropped(pair, e)
+
+    async def _write_batch(self, batch: list[QuestionAnswerPair]) -> None:
+        """Insert questions and answers with one multi-row INSERT each."""
+        try:
+            async with self.session_factory() as session:
+                await session.execute(
+                    insert(QuestionModel).values(
+                        [asdict(question) for question, _ in batch]
+                    )
+                )
+                await session.execute(
+                    insert(AnswerModel).values(
+                        [asdict(answer) for _, answer in batch]
+                    )
+                )
+                await session.commit()
+        except Exception as e:
+            raise QuestionAnswerRepositoryError(
+                f"Failed to write {len(batch)} question/answer pairs",
+                original_error=e,
+            ) from e
+
+    @staticmethod
+    def _log_dropped(pair: QuestionAnswerPair, error: Exception) -> None:
+        """Log a pair that could not be saved."""
+        question, answer = pair
+        logger.error(
+            "Dropping question %s with answer %s: %s",
+            question.id,
+            answer.id,
+            error,
+        )
@@ -1,11 +1,63 @@
-from .llm import AnthropicLLMService
-from .parser import HTTPContentParsingService
+from .answer_cache import (
+    InMemoryAnswerCache,
+    PostgresAnswerCache,
+    TieredAnswerCache,
+    create_answer_cache,
+)
+from .cached_llm import CachedLLMService
+from .circuit_breaker import CircuitBreaker, CircuitBreakerLLMService
+from .concurrency_limiter import AdaptiveConcurrencyLimiter
+from .extractive_answer import ExtractiveLLMService
+from .html_extraction import resolve_extraction_backend
+from .llm import (
+    AnthropicLLMService,
+    create_anthropic_client,
+    create_llm_concurrency_limiter,
+    create_llm_retry_policy,
+    is_provider_failure,
+)
+from .parser import (
+    HTTPContentParsingService,
+    create_http_client,
+    create_parsing_executor,
+)
 from .prompt_builder import PromptBuilder
-from .source_matching import SimpleSourceMatchingService
+from .retry_policy import RetryPolicy
+from .single_flight import CoalescingLLMService, SingleFlight
+from .source_corpus import InMemorySourceCorpusService
+from .source_matching import (
+    BM25SourceMatchingService,
+    PostgresFullTextSourceMatchingService,
+    SimpleSourceMatchingService,
+    create_source_matching_service,
+)
 
 __all__ = [
+    "AdaptiveConcurrencyLimiter",
     "AnthropicLLMService",
+    "BM25SourceMatchingService",
+    "CachedLLMService",
+    "CircuitBreaker",
+    "CircuitBreakerLLMService",
+    "CoalescingLLMService",
+    "ExtractiveLLMService",
     "HTTPContentParsingService",
+    "InMemoryAnswerCache",
+    "InMemorySourceCorpusService",
+    "PostgresAnswerCache",
+    "PostgresFullTextSourceMatchingService",
     "PromptBuilder",
+    "RetryPolicy",
     "SimpleSourceMatchingService",
+    "SingleFlight",
+    "TieredAnswerCache",
+    "create_answer_cache",
+    "create_anthropic_client",
+    "create_http_client",
+    "create_llm_concurrency_limiter",
+    "create_llm_retry_policy",
+    "create_parsing_executor",
+    "create_source_matching_service",
+    "is_provider_failure",
+    "resolve_extraction_backend",
 ]
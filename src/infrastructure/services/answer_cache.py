@@ -0,0 +1,183 @@
+"""Answer cache backends: in-process LRU and shared PostgreSQL tier."""
+
+import logging
+import time
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config.cache import AnswerCacheSettings
+from src.domain.services import AnswerCacheInterface
+from src.infrastructure.database.models import AnswerCacheModel
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryAnswerCache(AnswerCacheInterface):
+    """Process-local LRU cache with per-entry TTL."""
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 3600.0) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> str | None:
+        """Get cached answer by key."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, answer = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return answer
+
+    async def set(self, key: str, answer: str) -> None:
+        """Store answer under the key, evicting the least recent one."""
+        self._entries[key] = (time.monotonic() + self.ttl, answer)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        """Remove all cached answers."""
+        self._entries.clear()
+
+
+class PostgresAnswerCache(AnswerCacheInterface):
+    """Cache tier shared by all workers, stored in PostgreSQL.
+
+    Cache failures are logged and treated as misses, so an unavailable
+    database never breaks answer generation.
+    """
+
+    # Как часто удалять устаревшие записи (раз в N записей)
+    PURGE_EVERY = 100
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        ttl: float = 3600.0,
+    ) -> None:
+        self.session_factory = session_factory
+        self.ttl = ttl
+        self._writes = 0
+
+    async def get(self, key: str) -> str | None:
+        """Get cached answer by key."""
+        try:
+            async with self.session_factory() as session:
+                result = await session.execute(
+                    select(AnswerCacheModel.answer).where(
+                        AnswerCacheModel.key == key,
+                        AnswerCacheModel.expires_at > datetime.now(UTC),
+                    )
+                )
+                return result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            logger.warning("Failed to read answer cache: %s", e)
+            return None
+
+    async def set(self, key: str, answer: str) -> None:
+        """Store answer under the key."""
+        now = datetime.now(UTC)
+        stmt = insert(AnswerCacheModel).values(
+            key=key,
+            answer=answer,
+            created_at=now,
+            expires_at=now + timedelta(seconds=self.ttl),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["key"],
+            set_={
+                "answer": stmt.excluded.answer,
+                "created_at": stmt.excluded.created_at,
+                "expires_at": stmt.excluded.expires_at,
+            },
+        )
+
+        self._writes += 1
+        try:
+            async with self.session_factory() as session:
+                await session.execute(stmt)
+                if self._writes % self.PURGE_EVERY == 0:
+                    await session.execute(
+                        delete(AnswerCacheModel).where(
+                            AnswerCacheModel.expires_at <= now
+                        )
+                    )
+                await session.commit()
+        except SQLAlchemyError as e:
+            logger.warning("Failed to write answer cache: %s", e)
+
+    async def clear(self) -> None:
+        """Remove all cached answers."""
+        try:
+            async with self.session_factory() as session:
+                await session.execute(delete(AnswerCacheModel))
+                await session.commit()
+        except SQLAlchemyError as e:
+            logger.warning("Failed to clear answer cache: %s", e)
+
+
+class TieredAnswerCache(AnswerCacheInterface):
+    """Chain of caches checked from the fastest to the slowest tier."""
+
+    def __init__(self, tiers: list[AnswerCacheInterface]) -> None:
+        self.tiers = tiers
+
+    async def get(self, key: str) -> str | None:
+        """Get answer from the first tier that has it."""
+        for position, tier in enumerate(self.tiers):
+            answer = await tier.get(key)
+            if answer is not None:
+                # Прогреваем более быстрые уровни
+                for faster_tier in self.tiers[:position]:
+                    await faster_tier.set(key, answer)
+                return answer
+        return None
+
+    async def set(self, key: str, answer: str) -> None:
+        """Store answer in every tier."""
+        for tier in self.tiers:
+            await tier.set(key, answer)
+
+    async def clear(self) -> None:
+        """Clear every tier."""
+        for tier in self.tiers:
+            await tier.clear()
+
+
+def create_answer_cache(
+    settings: AnswerCacheSettings,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AnswerCacheInterface | None:
+    """Create answer cache configured in settings (None if disabled)."""
+    if not settings.answer_cache_enabled:
+        return None
+
+    memory_cache = InMemoryAnswerCache(
+        max_entries=settings.answer_cache_max_entries,
+        ttl=settings.answer_cache_ttl,
+    )
+    if not settings.answer_cache_shared:
+        return memory_cache
+
+    return TieredAnswerCache(
+        [
+            memory_cache,
+            PostgresAnswerCache(
+                session_factory, ttl=settings.answer_cache_ttl
+            ),
+        ]
+    )
@@ -0,0 +1,143 @@
+"""Exact-match caching decorator for LLM services."""
+
+import hashlib
+import json
+import logging
+import time
+import unicodedata
+from collections.abc import AsyncIterator
+
+from src.core.config.llm import LLMConfig
+from src.core.timing import elapsed_ms
+from src.domain.entities import LLMCompletion, Source
+from src.domain.services import AnswerCacheInterface, LLMServiceInterface
+
+logger = logging.getLogger(__name__)
+
+# Увеличивать при изменении шаблона промпта или формата ключа
+CACHE_KEY_VERSION = 2
+
+
+def normalize_question(question: str) -> str:
+    """Normalize question so trivially different spellings share a key."""
+    text = unicodedata.normalize("NFKC", question).casefold()
+    text = " ".join(text.replace("ё", "е").split())
+    return text.rstrip("?!.… ")
+
+
+def _source_fingerprint(source: Source) -> list[str | None]:
+    """Identify the exact source version passed to the prompt."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(source.title.encode())
+    digest.update(b"\0")
+    digest.update(source.content.encode())
+    return [
+        str(source.id),
+        source.updated_at.isoformat() if source.updated_at else None,
+        digest.hexdigest(),
+    ]
+
+
+def build_cache_key(
+    question: str, config: LLMConfig, sources: list[Source] | None
+) -> str:
+    """Build cache key from question, model parameters and sources.
+
+    Sources are identified by id, ``updated_at`` and a digest of their
+    text, so re-ingesting a page with new content yields a new key and
+    stale answers are never served.
+    """
+    payload = {
+        "version": CACHE_KEY_VERSION,
+        "question": normalize_question(question),
+        "model": config.model,
+        "max_tokens": config.max_tokens,
+        "temperature": config.temperature,
+        # Бюджет определяет, какая часть источников попадет в промпт
+        "input_token_budget": config.llm_input_token_budget,
+        "sources": (
+            None
+            if sources is None
+            else [_source_fingerprint(source) for source in sources]
+        ),
+    }
+    serialized = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+class CachedLLMService(LLMServiceInterface):
+    """LLM service returning cached answers for repeated questions."""
+
+    def __init__(
+        self,
+        llm_service: LLMServiceInterface,
+        cache: AnswerCacheInterface,
+        config: LLMConfig,
+    ) -> None:
+        self.llm_service = llm_service
+        self.cache = cache
+        self.config = config
+
+    async def generate_answer(self, question: str) -> LLMCompletion:
+        """Generate answer based on question only."""
+        start = time.perf_counter()
+        key = build_cache_key(question, self.config, None)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            logger.debug("Answer cache hit for question-only prompt")
+            return self._cached_completion(cached, start)
+
+        completion = await self.llm_service.generate_answer(question)
+        if completion.text and not completion.degraded:
+            await self.cache.set(key, completion.text)
+        return completion
+
+    async def generate_answer_with_sources(
+        self, question: str, sources: list[Source]
+    ) -> LLMCompletion:
+        """Generate answer based on question and relevant sources."""
+        start = time.perf_counter()
+        key = build_cache_key(question, self.config, sources)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            logger.debug("Answer cache hit (%d sources)", len(sources))
+            return self._cached_completion(cached, start)
+
+        completion = await self.llm_service.generate_answer_with_sources(
+            question, sources
+        )
+        if completion.text and not completion.degraded:
+            await self.cache.set(key, completion.text)
+        return completion
+
+    async def stream_answer(
+        self, question: str, sources: list[Source] | None = None
+    ) -> AsyncIterator[str]:
+        """Stream answer, replaying a cached one as a single chunk."""
+        key = build_cache_key(question, self.config, sources or None)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            logger.debug("Answer cache hit for streamed answer")
+            yield cached
+            return
+
+        chunks: list[str] = []
+        async for chunk in self.llm_service.stream_answer(question, sources):
+            chunks.append(chunk)
+            yield chunk
+
+        # Кешируем только полностью полученный ответ
+        answer = "".join(chunks)
+        if answer:
+            await self.cache.set(key, answer)
+
+    @staticmethod
+    def _cached_completion(text: str, start: float) -> LLMCompletion:
+        """Build completion for a cache hit (no tokens spent)."""
+        return LLMCompletion(
+            text=text,
+            prompt_tokens=0,
+            response_tokens=0,
+            llm_ms=elapsed_ms(start),
+            cached=True,
+        )
@@ -0,0 +1,226 @@
+"""Circuit breaker around the LLM with a fallback answer from sources."""
+
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from enum import StrEnum
+
+from src.core.timing import elapsed_ms
+from src.domain.entities import LLMCompletion, Source
+from src.domain.exceptions import LLMServiceError, LLMUnavailableError
+from src.domain.services import LLMServiceInterface
+
+from .extractive_answer import build_extractive_answer
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_INTRO = (
+    "Сервис генерации ответов временно недоступен. "
+    "Наиболее подходящие материалы по вашему вопросу:"
+)
+
+
+class CircuitState(StrEnum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops calls to a failing dependency for a while.
+
+    After ``failure_threshold`` consecutive failures the circuit opens
+    and calls are refused for ``reset_timeout`` seconds. Then a single
+    trial call is let through: its success closes the circuit, its
+    failure opens it again.
+    """
+
+    def __init__(
+        self, failure_threshold: int = 5, reset_timeout: float = 30.0
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the circuit."""
+        return self._state
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the open circuit lets a trial call through."""
+        if self._state is not CircuitState.OPEN:
+            return 0.0
+        elapsed = time.monotonic() - self._opened_at
+        return max(self.reset_timeout - elapsed, 0.0)
+
+    def allow(self) -> bool:
+        """Check whether a call may be made now."""
+        if self._state is CircuitState.CLOSED:
+            return True
+        if self._state is CircuitState.OPEN and self.retry_after == 0:
+            # Пропускаем один пробный вызов
+            self._state = CircuitState.HALF_OPEN
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        if self._state is not CircuitState.CLOSED:
+            logger.info("LLM circuit closed")
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit at the threshold."""
+        self._failures += 1
+        if (
+            self._state is CircuitState.HALF_OPEN
+            or self._failures >= self.failure_threshold
+        ):
+            if self._state is not CircuitState.OPEN:
+                logger.warning(
+                    "LLM circuit opened after %d failures for %.0fs",
+                    self._failures,
+                    self.reset_timeout,
+                )
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Forget a call whose outcome says nothing about the dependency.
+
+        A cancelled or locally shed trial call lets the next one try.
+        """
+        if self._state is CircuitState.HALF_OPEN:
+            self._state = CircuitState.OPEN
+
+
+class CircuitBreakerLLMService(LLMServiceInterface):
+    """LLM service failing fast while the LLM is unavailable.
+
+    Only errors accepted by ``is_failure`` (the LLM is down, overloaded
+    or too slow) count towards opening the circuit; other errors, such
+    as invalid input, are raised without touching it. Failed calls with
+    sources, and all calls while the circuit is open, get a degraded
+    answer listing the matched sources with snippets of their best
+    passages, so the user still gets useful links at once. Without
+    sources, and for streams, ``LLMUnavailableError`` is raised instead.
+    """
+
+    def __init__(
+        self,
+        llm_service: LLMServiceInterface,
+        circuit_breaker: CircuitBreaker,
+        snippet_chars: int = 300,
+        *,
+        is_failure: Callable[[Exception], bool] = lambda _: True,
+    ) -> None:
+        self.llm_service = llm_service
+        self.circuit_breaker = circuit_breaker
+        self.snippet_chars = snippet_chars
+        self.is_failure = is_failure
+
+    async def generate_answer(self, question: str) -> LLMCompletion:
+        """Generate answer based on question only."""
+        return await self._guard(
+            lambda: self.llm_service.generate_answer(question), None
+        )
+
+    async def generate_answer_with_sources(
+        self, question: str, sources: list[Source]
+    ) -> LLMCompletion:
+        """Generate answer based on question and relevant sources."""
+        return await self._guard(
+            lambda: self.llm_service.generate_answer_with_sources(
+                question, sources
+            ),
+            sources,
+        )
+
+    async def stream_answer(
+        self, question: str, sources: list[Source] | None = None
+    ) -> AsyncIterator[str]:
+        """Stream answer while the circuit is closed."""
+        if not self.circuit_breaker.allow():
+            raise self._unavailable()
+
+        try:
+            async for chunk in self.llm_service.stream_answer(
+                question, sources
+            ):
+                yield chunk
+        except LLMServiceError as e:
+            self._record_error(e)
+            raise
+        except BaseException:
+            self.circuit_breaker.release()
+            raise
+        self.circuit_breaker.record_success()
+
+    async def _guard(
+        self,
+        call: Callable[[], Awaitable[LLMCompletion]],
+        sources: list[Source] | None,
+    ) -> LLMCompletion:
+        """Call the LLM through the breaker, falling back to sources."""
+        start = time.perf_counter()
+        if not self.circuit_breaker.allow():
+            if not sources:
+                raise self._unavailable()
+            return self._fallback(sources, start)
+
+        try:
+            completion = await call()
+        except LLMServiceError as e:
+            if not self._record_error(e) or not sources:
+                raise
+            logger.warning("LLM call failed, answering from sources: %s", e)
+            return self._fallback(sources, start)
+        except BaseException:
+            self.circuit_breaker.release()
+            raise
+
+        self.circuit_breaker.record_success()
+        return completion
+
+    def _record_error(self, error: LLMServiceError) -> bool:
+        """Update the breaker, telling whether sources may replace the LLM.
+
+        Shed calls and LLM failures are answered from sources; other
+        errors are caused by the request and are raised as is.
+        """
+        if isinstance(error, LLMUnavailableError):
+            # Отказ в очереди лимитера - перегрузка у нас, а не у LLM
+            self.circuit_breaker.release()
+            return True
+        if self.is_failure(error):
+            self.circuit_breaker.record_failure()
+            return True
+        # Ошибка запроса ничего не говорит о состоянии LLM
+        self.circuit_breaker.release()
+        return False
+
+    def _fallback(self, sources: list[Source], start: float) -> LLMCompletion:
+        """Degraded answer built from the matched sources."""
+        return LLMCompletion(
+            text=build_extractive_answer(
+                sources, self.snippet_chars, intro=FALLBACK_INTRO
+            ),
+            prompt_tokens=0,
+            response_tokens=0,
+            llm_ms=elapsed_ms(start),
+            degraded=True,
+        )
+
+    def _unavailable(self) -> LLMUnavailableError:
+        """Error for calls refused by the open circuit."""
+        return LLMUnavailableError(
+            "LLM is temporarily unavailable",
+            retry_after=self.circuit_breaker.retry_after,
+        )
@@ -0,0 +1,181 @@
+"""Adaptive concurrency limit and admission control for LLM calls."""
+
+import asyncio
+import contextlib
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import NoReturn
+
+from src.domain.exceptions import LLMUnavailableError
+
+logger = logging.getLogger(__name__)
+
+# Вес последнего вызова в скользящей средней задержки
+LATENCY_SMOOTHING = 0.2
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on concurrent calls with a bounded wait queue.
+
+    The limit grows by one slot per ``limit`` calls completed within
+    ``latency_target`` seconds (additive increase) and is multiplied by
+    ``backoff_ratio`` when a call is slower than the target or is
+    rejected by the provider as overloaded (multiplicative decrease).
+    One burst of failures decreases the limit once: calls started
+    before the last decrease do not decrease it again.
+
+    Calls over the limit wait in a FIFO queue of at most ``max_queue``
+    callers for up to ``queue_timeout`` seconds. A call is rejected with
+    ``LLMUnavailableError`` at once when the queue is full or the
+    expected wait exceeds the timeout, so overload is shed quickly
+    instead of every request timing out together.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 50,
+        max_queue: int = 100,
+        queue_timeout: float = 5.0,
+        latency_target: float = 20.0,
+        backoff_ratio: float = 0.5,
+        is_overloaded: Callable[[Exception], bool] = lambda _: False,
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.latency_target = latency_target
+        self.backoff_ratio = backoff_ratio
+        self.is_overloaded = is_overloaded
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._latency: float | None = None
+        self._last_decrease = -math.inf
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed to run concurrently."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently running."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of calls waiting for a slot."""
+        return len(self._waiters)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the call.
+
+        The outcome of the call adjusts the limit: latency on success,
+        a decrease on overload errors. Other errors and cancellation
+        release the slot without changing the limit.
+        """
+        await self._admit()
+        start = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            if self.is_overloaded(e):
+                self._decrease(start, "provider overloaded")
+            raise
+        else:
+            self._on_success(start, time.monotonic() - start)
+        finally:
+            self._release()
+
+    async def _admit(self) -> None:
+        """Take a free slot or wait in the queue for one."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self._reject("LLM call queue is full", self.queue_timeout)
+
+        expected_wait = self._expected_wait()
+        if expected_wait > self.queue_timeout:
+            self._reject("LLM call queue wait is too long", expected_wait)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                await waiter
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # Слот уже передан, но вызывающий ушел - освобождаем его
+                self._release()
+            else:
+                waiter.cancel()
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+            if isinstance(e, TimeoutError):
+                self._reject("LLM call queue timeout", self.queue_timeout)
+            raise
+
+    def _expected_wait(self) -> float:
+        """Estimate queue wait from the average call latency."""
+        if self._latency is None:
+            return 0.0
+        # Слот освобождается в среднем раз в latency / limit секунд
+        return (len(self._waiters) + 1) * self._latency / self.limit
+
+    def _reject(self, reason: str, retry_after: float) -> NoReturn:
+        """Shed the call without waiting."""
+        logger.warning(
+            "%s (limit: %d, in flight: %d, queued: %d)",
+            reason,
+            self.limit,
+            self._in_flight,
+            len(self._waiters),
+        )
+        raise LLMUnavailableError(
+            "LLM is overloaded, please retry later",
+            retry_after=math.ceil(retry_after),
+        )
+
+    def _release(self) -> None:
+        """Free the slot and hand free slots to waiting callers."""
+        self._in_flight -= 1
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def _on_success(self, start: float, latency: float) -> None:
+        """Track latency and grow or shrink the limit."""
+        self._latency = (
+            latency
+            if self._latency is None
+            else LATENCY_SMOOTHING * latency
+            + (1 - LATENCY_SMOOTHING) * self._latency
+        )
+        if latency > self.latency_target:
+            self._decrease(start, f"slow call ({latency:.1f}s)")
+            return
+        self._limit = min(self._limit + 1 / self._limit, self.max_limit)
+
+    def _decrease(self, start: float, reason: str) -> None:
+        """Multiplicatively decrease the limit once per burst."""
+        if start < self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        self._limit = max(self._limit * self.backoff_ratio, self.min_limit)
+        logger.info(
+            "LLM concurrency limit decreased to %d: %s", self.limit, reason
+        )
@@ -0,0 +1,112 @@
+"""Token-budgeted packing of sources into the prompt context."""
+
+import logging
+import math
+from dataclasses import dataclass, replace
+
+from src.domain.entities import Source
+
+logger = logging.getLogger(__name__)
+
+# Признак обрезанного текста источника
+TRUNCATION_MARK = "…"
+# Разметка вокруг источника в шаблоне: номер, "URL:", переводы строк
+SOURCE_FRAME_TOKENS = 8
+
+
+@dataclass(frozen=True)
+class PackedContext:
+    """Sources that fit into the token budget."""
+
+    sources: list[Source]
+    # Оценка числа токенов выбранных источников
+    used_tokens: int
+    budget: int
+    truncated: int = 0
+    dropped: int = 0
+
+
+class ContextPacker:
+    """Greedily fills a token budget with sources in relevance order.
+
+    Token counts are estimated from text length (``chars_per_token``),
+    which is cheap and close enough to size prompts predictably. Sources
+    are taken in the order given by the matching service, best first.
+    A source that does not fit is truncated at a word boundary when at
+    least ``min_source_tokens`` remain, and every lower-ranked source is
+    dropped.
+    """
+
+    def __init__(
+        self,
+        token_budget: int,
+        chars_per_token: float = 3.0,
+        min_source_tokens: int = 50,
+    ) -> None:
+        self.token_budget = token_budget
+        self.chars_per_token = chars_per_token
+        self.min_source_tokens = min_source_tokens
+
+    def estimate_tokens(self, text: str) -> int:
+        """Estimate the number of tokens in text."""
+        return math.ceil(len(text) / self.chars_per_token)
+
+    def pack(
+        self, sources: list[Source], reserved_tokens: int = 0
+    ) -> PackedContext:
+        """Select sources fitting the budget minus ``reserved_tokens``.
+
+        ``reserved_tokens`` covers the rest of the prompt: the template
+        and the question.
+        """
+        budget = max(self.token_budget - reserved_tokens, 0)
+        packed: list[Source] = []
+        used_tokens = 0
+        truncated = 0
+
+        for source in sources:
+            # Заголовок и URL входят и в контекст, и в список источников
+            overhead = (
+                2 * self.estimate_tokens(source.title + source.url)
+                + SOURCE_FRAME_TOKENS
+            )
+            cost = overhead + self.estimate_tokens(source.content)
+            if used_tokens + cost <= budget:
+                packed.append(source)
+                used_tokens += cost
+                continue
+
+            # Остаток бюджета заполняем началом источника
+            remaining = budget - used_tokens - overhead
+            if remaining >= self.min_source_tokens:
+                content = self._truncate(source.content, remaining)
+                packed.append(replace(source, content=content))
+                used_tokens += overhead + self.estimate_tokens(content)
+                truncated += 1
+            break
+
+        context = PackedContext(
+            sources=packed,
+            used_tokens=used_tokens,
+            budget=budget,
+            truncated=truncated,
+            dropped=len(sources) - len(packed),
+        )
+        logger.debug(
+            "Packed %d of %d sources into %d/%d tokens (truncated: %d)",
+            len(packed),
+            len(sources),
+            used_tokens,
+            budget,
+            truncated,
+        )
+        return context
+
+    def _truncate(self, text: str, tokens: int) -> str:
+        """Cut text to about ``tokens`` tokens at a word boundary."""
+        limit = max(int(tokens * self.chars_per_token) - 1, 0)
+        cut = text[:limit]
+        space = cut.rfind(" ")
+        if space > limit // 2:
+            cut = cut[:space]
+        return cut.rstrip() + TRUNCATION_MARK
@@ -0,0 +1,161 @@
+"""Answers composed directly from matched sources, without the LLM."""
+
+import logging
+import re
+import time
+from collections.abc import AsyncIterator
+
+from src.core.timing import elapsed_ms
+from src.domain.entities import PASSAGE_SEPARATOR, LLMCompletion, Source
+from src.domain.services import (
+    LLMServiceInterface,
+    SourceMatchingServiceInterface,
+)
+
+from .context_packer import TRUNCATION_MARK
+
+logger = logging.getLogger(__name__)
+
+EXTRACTIVE_INTRO = "Подходящие материалы EORA по вашему запросу:"
+
+# Навигационные вопросы просят показать или перечислить материалы
+NAVIGATIONAL_PATTERN = re.compile(
+    r"^(покажи|покажите|найди|найдите|дай|дайте|пришли|пришлите"
+    r"|перечисли|перечислите|список)\b"
+    r"|\bесть ли\b"
+    r"|\b(делали|делаете|разрабатывали|разрабатываете|внедряли) ли\b"
+    r"|\bкакие\s+(у вас\s+)?(есть\s+)?(кейс|проект|решени|пример|продукт)"
+    r"|\b(покажи\w*|показать|приведи\w*|привести|дай|дайте|пришли\w*"
+    r"|прислать|скинь\w*)\b.*\b(ссылк|пример|кейс)"
+    r"|\bгде\b.*\b(найти|посмотреть|почитать)\b"
+)
+# Вопросы, требующие рассуждения, а не списка материалов
+ANALYTICAL_PATTERN = re.compile(
+    r"\b(почему|зачем|как|сколько|объясни\w*|сравни\w*|расскажи\w*"
+    r"|в чем разница|что лучше)\b"
+    r"|\bчем отлича"
+)
+# Навигационные вопросы короткие
+NAVIGATIONAL_MAX_WORDS = 12
+
+
+def extract_snippet(content: str, max_chars: int) -> str:
+    """Take the best passage of a source, cut at a word boundary.
+
+    Matching services put the best passages first into ``content``.
+    """
+    passage = content.split(PASSAGE_SEPARATOR, 1)[0]
+    text = " ".join(passage.split())
+    if len(text) <= max_chars:
+        return text
+
+    cut = text[: max(max_chars - 1, 0)]
+    space = cut.rfind(" ")
+    if space > len(cut) // 2:
+        cut = cut[:space]
+    return cut.rstrip(" ,;:") + TRUNCATION_MARK
+
+
+def build_extractive_answer(
+    sources: list[Source], snippet_chars: int, intro: str | None = None
+) -> str:
+    """List sources in the answer format the prompt asks the LLM for.
+
+    Every source becomes a "• title: URL: snippet" line.
+    """
+    lines = [
+        f"• {source.title}: {source.url}: "
+        f"{extract_snippet(source.content, snippet_chars)}"
+        for source in sources
+    ]
+    if intro:
+        lines.insert(0, f"{intro}\n")
+    return "\n".join(lines)
+
+
+def is_navigational_query(question: str) -> bool:
+    """Check whether the question asks to find materials, not to reason.
+
+    Short requests like "покажите кейсы с ритейлом" or "есть ли у вас
+    чат-боты" are lookups; questions asking why, how or to compare need
+    the LLM.
+    """
+    text = " ".join(question.lower().split())
+    if not text or len(text.split()) > NAVIGATIONAL_MAX_WORDS:
+        return False
+    if ANALYTICAL_PATTERN.search(text):
+        return False
+    return NAVIGATIONAL_PATTERN.search(text) is not None
+
+
+class ExtractiveLLMService(LLMServiceInterface):
+    """LLM service answering navigational questions without the LLM.
+
+    When the question is a lookup and the matching service is confident
+    in the best source, the answer lists the found sources with snippets
+    of their best passages, in the format the prompt asks the LLM for.
+    Such answers take milliseconds and no tokens; other questions are
+    passed to the wrapped service.
+    """
+
+    def __init__(
+        self,
+        llm_service: LLMServiceInterface,
+        source_matching_service: SourceMatchingServiceInterface,
+        min_confidence: float = 0.8,
+        snippet_chars: int = 300,
+    ) -> None:
+        self.llm_service = llm_service
+        self.source_matching_service = source_matching_service
+        self.min_confidence = min_confidence
+        self.snippet_chars = snippet_chars
+
+    async def generate_answer(self, question: str) -> LLMCompletion:
+        """Generate answer based on question only."""
+        return await self.llm_service.generate_answer(question)
+
+    async def generate_answer_with_sources(
+        self, question: str, sources: list[Source]
+    ) -> LLMCompletion:
+        """Answer from sources directly or generate answer with the LLM."""
+        start = time.perf_counter()
+        if not self._can_answer(question, sources):
+            return await self.llm_service.generate_answer_with_sources(
+                question, sources
+            )
+
+        return LLMCompletion(
+            text=self._build_answer(sources),
+            prompt_tokens=0,
+            response_tokens=0,
+            llm_ms=elapsed_ms(start),
+            extractive=True,
+        )
+
+    async def stream_answer(
+        self, question: str, sources: list[Source] | None = None
+    ) -> AsyncIterator[str]:
+        """Stream answer, sending an extractive one as a single chunk."""
+        if sources and self._can_answer(question, sources):
+            yield self._build_answer(sources)
+            return
+
+        async for chunk in self.llm_service.stream_answer(question, sources):
+            yield chunk
+
+    def _can_answer(self, question: str, sources: list[Source]) -> bool:
+        """Check whether the question can be answered from sources."""
+        if not sources or not is_navigational_query(question):
+            return False
+
+        confidence = self.source_matching_service.confidence(question, sources)
+        logger.debug(
+            "Navigational question, match confidence %.2f", confidence
+        )
+        return confidence >= self.min_confidence
+
+    def _build_answer(self, sources: list[Source]) -> str:
+        """Format found sources as the answer."""
+        return build_extractive_answer(
+            sources, self.snippet_chars, intro=EXTRACTIVE_INTRO
+        )
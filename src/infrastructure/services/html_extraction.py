@@ -0,0 +1,251 @@
+"""HTML extraction backends producing page title and main content."""
+
+import logging
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup, UnicodeDammit
+
+if TYPE_CHECKING:
+    from lxml.html import HtmlElement
+
+logger = logging.getLogger(__name__)
+
+# Правила извлечения общие для всех бэкендов
+REMOVED_TAGS = ("script", "style", "nav", "footer", "header")
+CONTENT_CLASS = "tn-atom"
+# Страница разбивается на фрагменты, ограничение лишь защищает от
+# аномально больших документов
+BODY_CONTENT_LIMIT = 100_000
+
+# Строки внутри этих тегов BeautifulSoup не включает в get_text()
+_SKIPPED_TEXT_TAGS = frozenset({"rt", "rp", "template", "script", "style"})
+_SKIPPED_CONTENT_TAGS = _SKIPPED_TEXT_TAGS | frozenset(REMOVED_TAGS)
+_BODY_TAG_PATTERN = re.compile(rb"<body[\s/>]", re.IGNORECASE)
+_XML_DECLARATION_PATTERN = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+
+@dataclass(frozen=True)
+class ExtractedPage:
+    """Title and main content extracted from an HTML page."""
+
+    title: str
+    content: str
+
+
+class HTMLExtractionBackend(ABC):
+    """Abstract backend extracting title and content from HTML."""
+
+    name: str
+
+    @abstractmethod
+    def extract(self, html: bytes, url: str) -> ExtractedPage:
+        """Extract title and main content from raw HTML."""
+
+
+class BeautifulSoupExtractionBackend(HTMLExtractionBackend):
+    """Pure-Python backend based on BeautifulSoup ``html.parser``."""
+
+    name = "html.parser"
+
+    def extract(self, html: bytes, url: str) -> ExtractedPage:
+        """Extract title and main content from raw HTML."""
+        soup = BeautifulSoup(html, "html.parser")
+        return ExtractedPage(
+            title=self._extract_title(soup, url),
+            content=self._extract_content(soup),
+        )
+
+    @staticmethod
+    def _extract_title(soup: BeautifulSoup, url: str) -> str:
+        """Extract page title, falling back to the URL path."""
+        title_tag = soup.find("title")
+        return (
+            title_tag.get_text().strip() if title_tag else urlparse(url).path
+        )
+
+    @staticmethod
+    def _extract_content(soup: BeautifulSoup) -> str:
+        """Extract main content from HTML."""
+        # Remove unwanted elements
+        for element in soup(list(REMOVED_TAGS)):
+            element.decompose()
+
+        # Try to find main content areas
+        elements = soup.select(f".{CONTENT_CLASS}")
+        if elements:
+            return "\n".join(el.get_text(strip=True) for el in elements)
+
+        # If no specific content found, use body
+        body = soup.find("body")
+        if body:
+            text = body.get_text(strip=True)
+            return text[:BODY_CONTENT_LIMIT] if text else ""
+
+        return ""
+
+
+class LxmlExtractionBackend(HTMLExtractionBackend):
+    """C-accelerated backend based on ``lxml.html``.
+
+    Mirrors the BeautifulSoup rules: text is collected string by string,
+    each string is stripped and joined without separators, comments and
+    ruby/template strings are skipped, and the body fallback is only used
+    when the document really has a ``<body>`` tag. Unwanted elements are
+    skipped instead of dropped, because ``drop_tree`` merges the
+    surrounding text nodes and would change the stripping result.
+    """
+
+    name = "lxml"
+
+    def __init__(self) -> None:
+        # Импортируем лениво: lxml - опциональная зависимость
+        import lxml.html
+
+        self._lxml_html: Any = lxml.html
+
+    def extract(self, html: bytes, url: str) -> ExtractedPage:
+        """Extract title and main content from raw HTML."""
+        fallback_title = urlparse(url).path
+        markup = self._decode(html)
+        if not markup.strip():
+            return ExtractedPage(title=fallback_title, content="")
+
+        document: HtmlElement = self._lxml_html.document_fromstring(markup)
+
+        title_tag = next(document.iter("title"), None)
+        title = (
+            self._extract_title(markup, title_tag)
+            if title_tag is not None
+            else fallback_title
+        )
+
+        return ExtractedPage(
+            title=title,
+            content=self._extract_content(
+                document, has_body=bool(_BODY_TAG_PATTERN.search(html))
+            ),
+        )
+
+    def _extract_title(self, markup: str, title_tag: "HtmlElement") -> str:
+        """Text content of the title, as BeautifulSoup ``get_text()``.
+
+        lxml reads the title as raw text with entities decoded, while
+        html.parser parses markup inside it into elements. A title with
+        markup is taken from a second parse that keeps entities escaped,
+        so ``&lt;b&gt;`` stays text, and is then parsed as a fragment.
+        """
+        text = title_tag.text or ""
+        if "<" not in text:
+            return text.strip()
+
+        # Экранирование "&" не меняет структуру документа, поэтому
+        # первый <title> повторного разбора - тот же самый тег
+        escaped: HtmlElement = self._lxml_html.document_fromstring(
+            markup.replace("&", "&amp;")
+        )
+        raw_title = next(escaped.iter("title")).text or ""
+        fragment: HtmlElement = self._lxml_html.fragment_fromstring(
+            raw_title, create_parent="div"
+        )
+        return "".join(
+            self._iter_strings(fragment, _SKIPPED_TEXT_TAGS)
+        ).strip()
+
+    def _extract_content(self, document: "HtmlElement", has_body: bool) -> str:
+        """Extract main content from the parsed document."""
+        elements = [
+            element
+            for element in document.find_class(CONTENT_CLASS)
+            if not self._is_removed(element)
+        ]
+        if elements:
+            return "\n".join(self._get_text(el) for el in elements)
+
+        body = document.find("body") if has_body else None
+        if body is not None:
+            text = self._get_text(body)
+            return text[:BODY_CONTENT_LIMIT] if text else ""
+
+        return ""
+
+    def _get_text(self, element: "HtmlElement") -> str:
+        """Equivalent of BeautifulSoup ``get_text(strip=True)``."""
+        return "".join(
+            stripped
+            for string in self._iter_strings(element, _SKIPPED_CONTENT_TAGS)
+            if (stripped := string.strip())
+        )
+
+    def _iter_strings(
+        self, element: "HtmlElement", skipped_tags: frozenset[str]
+    ) -> Iterator[str]:
+        """Iterate over text strings of an element in document order."""
+        if element.text:
+            yield element.text
+        for child in element:
+            # Комментарии и инструкции обработки имеют нестроковый tag
+            if isinstance(child.tag, str) and child.tag not in skipped_tags:
+                yield from self._iter_strings(child, skipped_tags)
+            if child.tail:
+                yield child.tail
+
+    @staticmethod
+    def _is_removed(element: "HtmlElement") -> bool:
+        """Check whether the element lies inside an unwanted element."""
+        return element.tag in REMOVED_TAGS or any(
+            ancestor.tag in REMOVED_TAGS
+            for ancestor in element.iterancestors()
+        )
+
+    @staticmethod
+    def _decode(html: bytes) -> str:
+        """Decode bytes the same way BeautifulSoup does."""
+        markup = UnicodeDammit(html, is_html=True).unicode_markup or ""
+        # lxml не принимает str с XML-декларацией кодировки
+        return _XML_DECLARATION_PATTERN.sub("", markup, count=1)
+
+
+_BACKEND_TYPES: dict[str, type[HTMLExtractionBackend]] = {
+    BeautifulSoupExtractionBackend.name: BeautifulSoupExtractionBackend,
+    LxmlExtractionBackend.name: LxmlExtractionBackend,
+}
+_backends: dict[str, HTMLExtractionBackend] = {}
+
+
+def get_extraction_backend(name: str) -> HTMLExtractionBackend:
+    """Get extraction backend by name (cached per process)."""
+    backend = _backends.get(name)
+    if backend is None:
+        backend_type = _BACKEND_TYPES.get(name)
+        if backend_type is None:
+            raise ValueError(f"Unknown HTML extraction backend: {name}")
+        backend = _backends[name] = backend_type()
+    return backend
+
+
+def resolve_extraction_backend(name: str) -> str:
+    """Return a usable backend name, falling back to ``html.parser``."""
+    try:
+        get_extraction_backend(name)
+    except ImportError:
+        logger.warning(
+            "HTML backend %s is not installed, falling back to html.parser",
+            name,
+        )
+        return BeautifulSoupExtractionBackend.name
+    return name
+
+
+def extract_page(
+    html: bytes, url: str, backend: str = BeautifulSoupExtractionBackend.name
+) -> ExtractedPage:
+    """Extract title and main content from raw HTML.
+
+    Pure CPU-bound function, safe to run in a thread or process pool.
+    """
+    return get_extraction_backend(backend).extract(html, url)
@@ -1,29 +1,173 @@
 """Service implementations with safe text extraction."""
 
 import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import replace
 
-from anthropic import AsyncAnthropic
+import httpx
+from anthropic import (
+    APIConnectionError,
+    APIStatusError,
+    AsyncAnthropic,
+    DefaultAsyncHttpxClient,
+)
 from anthropic.types import Message
 
 from src.core.config.llm import LLMConfig
-from src.domain.entities import Source
-from src.domain.exceptions.service import LLMServiceError
+from src.core.timing import elapsed_ms
+from src.domain.entities import LLMCompletion, Source
+from src.domain.exceptions.service import (
+    LLMServiceError,
+    LLMUnavailableError,
+)
 from src.domain.services import LLMServiceInterface
 
+from .concurrency_limiter import AdaptiveConcurrencyLimiter
+from .context_packer import ContextPacker
 from .prompt_builder import PromptBuilder
+from .retry_policy import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
+# Ответы API о превышении лимита запросов и перегрузке
+OVERLOADED_STATUS_CODES = frozenset({429, 503, 529})
+# Ответы API, после которых запрос можно повторить (и все 5xx)
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+
+def create_anthropic_client(api_key: str, config: LLMConfig) -> AsyncAnthropic:
+    """Create long-lived Anthropic client with a tuned connection pool.
+
+    Retries are made by ``RetryPolicy``, so the SDK does not retry.
+    """
+    return AsyncAnthropic(
+        api_key=api_key,
+        timeout=config.llm_timeout,
+        max_retries=0,
+        http_client=DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=config.llm_max_connections,
+                max_keepalive_connections=(
+                    config.llm_max_keepalive_connections
+                ),
+                keepalive_expiry=config.llm_keepalive_expiry,
+            ),
+        ),
+    )
+
+
+def is_overloaded_error(error: Exception) -> bool:
+    """Check whether the API rejected a call because of load."""
+    return (
+        isinstance(error, APIStatusError)
+        and error.status_code in OVERLOADED_STATUS_CODES
+    )
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Check whether a failed API call may succeed when repeated."""
+    if isinstance(error, APIStatusError):
+        return (
+            error.status_code in RETRYABLE_STATUS_CODES
+            or error.status_code >= 500
+        )
+    # APITimeoutError - подкласс APIConnectionError
+    return isinstance(error, APIConnectionError | TimeoutError)
+
+
+def is_provider_failure(error: Exception) -> bool:
+    """Check whether a failed call shows that the LLM is unhealthy.
+
+    Errors of the LLM service are judged by the API error they wrap:
+    invalid input and other client errors say nothing about the LLM.
+    """
+    if isinstance(error, LLMServiceError):
+        return error.original_error is not None and is_provider_failure(
+            error.original_error
+        )
+    return is_retryable_error(error)
+
+
+def retry_after_seconds(error: Exception) -> float | None:
+    """Delay requested by the API in ``retry-after`` headers."""
+    if not isinstance(error, APIStatusError):
+        return None
+
+    headers = error.response.headers
+    for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = headers.get(header)
+        if value is None:
+            continue
+        try:
+            return max(float(value) * scale, 0.0)
+        except ValueError:
+            # Дата HTTP вместо числа секунд - используем свою задержку
+            return None
+    return None
+
+
+def create_llm_retry_policy(config: LLMConfig) -> RetryPolicy:
+    """Create process-wide retry policy for Anthropic API calls."""
+    return RetryPolicy(
+        max_attempts=config.llm_max_attempts,
+        attempt_timeout=config.llm_attempt_timeout,
+        total_timeout=config.llm_total_timeout,
+        backoff_base=config.llm_backoff_base,
+        backoff_max=config.llm_backoff_max,
+        hedging_enabled=config.llm_hedging_enabled,
+        hedge_quantile=config.llm_hedge_quantile,
+        hedge_min_samples=config.llm_hedge_min_samples,
+        is_retryable=is_retryable_error,
+        retry_after=retry_after_seconds,
+    )
+
+
+def create_llm_concurrency_limiter(
+    config: LLMConfig,
+) -> AdaptiveConcurrencyLimiter:
+    """Create process-wide limiter for concurrent Anthropic API calls."""
+    return AdaptiveConcurrencyLimiter(
+        initial_limit=config.llm_concurrency_initial_limit,
+        min_limit=config.llm_concurrency_min_limit,
+        max_limit=config.llm_concurrency_max_limit,
+        max_queue=config.llm_queue_max_size,
+        queue_timeout=config.llm_queue_timeout,
+        latency_target=config.llm_latency_target,
+        backoff_ratio=config.llm_concurrency_backoff_ratio,
+        is_overloaded=is_overloaded_error,
+    )
+
 
 class AnthropicLLMService(LLMServiceInterface):
-    """Anthropic Claude implementation of LLMService."""
+    """Anthropic Claude implementation of LLMService.
+
+    API calls pass through the shared concurrency limiter, when given,
+    so bursts are queued or shed instead of overloading the provider.
+    Completions are made under the retry policy; streams are not
+    retried, because a part of the answer may already be sent.
+    """
 
-    def __init__(self, api_key: str):
-        self.client = AsyncAnthropic(api_key=api_key)
-        self.config = LLMConfig()
-        self.prompt_builder = PromptBuilder()
+    def __init__(
+        self,
+        client: AsyncAnthropic,
+        config: LLMConfig,
+        *,
+        limiter: AdaptiveConcurrencyLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        self.client = client
+        self.config = config
+        self.limiter = limiter
+        self.retry_policy = retry_policy
+        self.prompt_builder = PromptBuilder(
+            ContextPacker(
+                config.llm_input_token_budget, config.llm_chars_per_token
+            )
+        )
 
-    async def generate_answer(self, question: str) -> str:
+    async def generate_answer(self, question: str) -> LLMCompletion:
         """Generate answer based on question only."""
         try:
             if not question or not question.strip():
@@ -31,9 +175,7 @@ class AnthropicLLMService(LLMServiceInterface):
 
             prompt = f"Пожалуйста, ответьте на следующий вопрос: {question}"
 
-            response: Message = await self._call_anthropic_api(prompt)
-
-            return self._extract_text_from_response(response)
+            return await self._complete(prompt)
 
         except LLMServiceError:
             raise
@@ -45,16 +187,17 @@ class AnthropicLLMService(LLMServiceInterface):
 
     async def generate_answer_with_sources(
         self, question: str, sources: list[Source]
-    ) -> str:
+    ) -> LLMCompletion:
         """Generate answer based on question and relevant sources."""
         try:
-            prompt = self.prompt_builder.build_prompt_with_sources(
+            start = time.perf_counter()
+            prompt, context = self.prompt_builder.build_packed_prompt(
                 question, sources
             )
+            prompt_build_ms = elapsed_ms(start)
 
-            response: Message = await self._call_anthropic_api(prompt)
-
-            return self._extract_text_from_response(response)
+            completion = await self._complete(prompt, prompt_build_ms)
+            return replace(completion, context_tokens=context.used_tokens)
 
         except LLMServiceError:
             raise
@@ -64,21 +207,88 @@ class AnthropicLLMService(LLMServiceInterface):
                 "Failed to generate answer with sources", original_error=e
             )
 
+    async def stream_answer(
+        self, question: str, sources: list[Source] | None = None
+    ) -> AsyncIterator[str]:
+        """Stream answer text deltas from the Anthropic streaming API."""
+        if sources:
+            prompt = self.prompt_builder.build_prompt_with_sources(
+                question, sources
+            )
+        else:
+            if not question or not question.strip():
+                raise LLMServiceError("Question cannot be empty")
+            prompt = f"Пожалуйста, ответьте на следующий вопрос: {question}"
+
+        try:
+            # Слот лимитера занят до конца потока
+            async with (
+                self._concurrency_slot(),
+                self.client.messages.stream(
+                    model=self.config.model,
+                    max_tokens=self.config.max_tokens,
+                    temperature=self.config.temperature,
+                    messages=[{"role": "user", "content": prompt}],
+                ) as stream,
+            ):
+                async for text in stream.text_stream:
+                    yield text
+        except LLMUnavailableError:
+            raise
+        except Exception as e:
+            logger.error("Error streaming Anthropic API response: %s", e)
+            raise LLMServiceError(
+                "Failed to stream answer from Anthropic API", original_error=e
+            )
+
+    async def _complete(
+        self, prompt: str, prompt_build_ms: float | None = None
+    ) -> LLMCompletion:
+        """Call the API and collect text, token usage and latency."""
+        start = time.perf_counter()
+        response: Message = await self._call_anthropic_api(prompt)
+        llm_ms = elapsed_ms(start)
+
+        return LLMCompletion(
+            text=self._extract_text_from_response(response),
+            prompt_tokens=response.usage.input_tokens,
+            response_tokens=response.usage.output_tokens,
+            prompt_build_ms=prompt_build_ms,
+            llm_ms=llm_ms,
+        )
+
     async def _call_anthropic_api(self, prompt: str) -> Message:
-        """Centralized API call with error handling."""
+        """Centralized API call with retries and error handling."""
         try:
-            return await self.client.messages.create(
-                model=self.config.model,
-                max_tokens=self.config.max_tokens,
-                temperature=self.config.temperature,
-                messages=[{"role": "user", "content": prompt}],
+            if self.retry_policy is None:
+                return await self._create_message(prompt)
+            return await self.retry_policy.run(
+                lambda: self._create_message(prompt)
             )
+        except LLMUnavailableError:
+            raise
         except Exception as e:
             logger.error("Error calling Anthropic API: %s", e)
             raise LLMServiceError(
                 "Failed to call Anthropic API", original_error=e
             )
 
+    async def _create_message(self, prompt: str) -> Message:
+        """Single API call holding a slot of the concurrency limiter."""
+        async with self._concurrency_slot():
+            return await self.client.messages.create(
+                model=self.config.model,
+                max_tokens=self.config.max_tokens,
+                temperature=self.config.temperature,
+                messages=[{"role": "user", "content": prompt}],
+            )
+
+    def _concurrency_slot(self) -> AbstractAsyncContextManager[None]:
+        """Slot of the shared limiter, or no limit without one."""
+        if self.limiter is None:
+            return nullcontext()
+        return self.limiter.acquire()
+
     def _extract_text_from_response(self, response: Message) -> str:
         """Extract text from Anthropic response."""
         try:
@@ -1,71 +1,243 @@
+import asyncio
 import logging
+import multiprocessing
 import uuid
+from collections.abc import AsyncGenerator, AsyncIterator
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
+from typing import Literal
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
 
-from src.domain.entities import Source
+from src.domain.entities import (
+    CacheValidators,
+    ParseResult,
+    Source,
+    compute_content_hash,
+)
 from src.domain.services.content_parsing import ContentParsingServiceInterface
 
+from .html_extraction import extract_page
+
 logger = logging.getLogger(__name__)
 
 
+def create_parsing_executor(
+    kind: Literal["thread", "process"], max_workers: int | None = None
+) -> Executor:
+    """Create worker pool for CPU-bound HTML extraction."""
+    if kind == "process":
+        # spawn не наследует потоки и состояние event loop родителя
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="html-parser"
+    )
+
+
+def create_http_client(
+    timeout: float,
+    max_connections: int,
+    max_keepalive_connections: int,
+    keepalive_expiry: float,
+) -> httpx.AsyncClient:
+    """Create long-lived HTTP client for page downloads."""
+    return httpx.AsyncClient(
+        timeout=timeout,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        headers={
+            "User-Agent": (
+                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/91.0.4472.124 Safari/537.36"
+            )
+        },
+    )
+
+
+class HostLimiter:
+    """Limits concurrency and request rate for a single host."""
+
+    def __init__(self, max_concurrency: int, rate_limit: float) -> None:
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._interval = 1.0 / rate_limit if rate_limit > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """Wait for a free connection slot and the next rate window."""
+        async with self._semaphore:
+            if self._interval:
+                async with self._lock:
+                    now = asyncio.get_running_loop().time()
+                    delay = self._next_slot - now
+                    self._next_slot = max(now, self._next_slot) + (
+                        self._interval
+                    )
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            yield
+
+
 class HTTPContentParsingService(ContentParsingServiceInterface):
     """HTTP-based implementation of ContentParsingService."""
 
-    def __init__(self) -> None:
-        self.client = httpx.AsyncClient(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={
-                "User-Agent": (
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/91.0.4472.124 Safari/537.36"
-                )
-            },
-        )
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        *,
+        max_concurrency: int = 20,
+        per_host_concurrency: int = 4,
+        per_host_rate_limit: float = 0.0,
+        executor: Executor | None = None,
+        html_backend: str = "html.parser",
+    ) -> None:
+        self.executor = executor
+        self.html_backend = html_backend
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_rate_limit = per_host_rate_limit
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._host_limiters: dict[str, HostLimiter] = {}
+        self.client = client
 
     async def parse_url(self, url: str) -> Source | None:
         """Parse content from URL."""
-        if not url or not url.strip():
-            logger.warning("Empty URL provided")
-            return None
+        result = await self._parse_url_safely(url)
+        return result.source
 
-        try:
-            logger.debug("Parsing URL: %s", url)
+    async def parse_urls(self, urls: list[str]) -> list[Source]:
+        """Parse content from multiple URLs."""
+        results = await self.parse_urls_detailed(urls)
+        return [result.source for result in results if result.source]
 
-            response = await self.client.get(url)
-            response.raise_for_status()
+    async def parse_urls_detailed(
+        self,
+        urls: list[str],
+        validators: dict[str, CacheValidators] | None = None,
+    ) -> list[ParseResult]:
+        """Parse URLs concurrently, keeping results in input order."""
+        if not urls:
+            return []
+        validators = validators or {}
 
-            soup = BeautifulSoup(response.content, "html.parser")
+        logger.info(
+            "Parsing %d URLs (concurrency: %d, per host: %d)",
+            len(urls),
+            self.max_concurrency,
+            self.per_host_concurrency,
+        )
 
-            # Extract title
-            title_tag = soup.find("title")
-            title = (
-                title_tag.get_text().strip()
-                if title_tag
-                else urlparse(url).path
+        results = await asyncio.gather(
+            *(
+                self._parse_url_limited(url, validators.get(url))
+                for url in urls
             )
+        )
+
+        parsed_count = sum(1 for result in results if result.is_success)
+        logger.info(
+            "Successfully parsed %d out of %d URLs "
+            "(not modified: %d, failed: %d)",
+            parsed_count,
+            len(urls),
+            sum(1 for result in results if result.not_modified),
+            len(urls) - parsed_count,
+        )
+        return list(results)
 
-            # Extract main content
-            content = self._extract_content(soup)
+    async def iter_parse_urls(
+        self,
+        urls: list[str],
+        validators: dict[str, CacheValidators] | None = None,
+    ) -> AsyncGenerator[ParseResult, None]:
+        """Parse URLs with a fixed pool of workers, yielding as they finish.
 
-            # Generate ID from URL
-            source_id = uuid.uuid5(uuid.NAMESPACE_URL, url)
+        At most ``max_concurrency`` pages are downloaded at once and at
+        most as many parsed results wait for the consumer: when it falls
+        behind, workers block instead of accumulating pages in memory.
+        """
+        if not urls:
+            return
+        validators = validators or {}
+
+        # Общий итератор - каждый воркер берет следующий URL
+        pending = iter(urls)
+        results: asyncio.Queue[ParseResult | None] = asyncio.Queue(
+            maxsize=self.max_concurrency
+        )
+
+        async def worker() -> None:
+            for url in pending:
+                await results.put(
+                    await self._parse_url_limited(url, validators.get(url))
+                )
+            await results.put(None)
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.max_concurrency, len(urls)))
+        ]
+        try:
+            running = len(workers)
+            while running:
+                result = await results.get()
+                if result is None:
+                    running -= 1
+                    continue
+                yield result
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
-            source = Source(
-                id=source_id,
-                url=url,
-                title=title,
-                content=content,
-                created_at=datetime.now(UTC),
+    async def _parse_url_limited(
+        self, url: str, validators: CacheValidators | None = None
+    ) -> ParseResult:
+        """Parse URL respecting global and per-host limits."""
+        host = urlparse(url).netloc.lower()
+        # Сначала ждем свой хост, затем занимаем общий слот: задачи,
+        # ожидающие занятый хост, не держат слоты других хостов
+        async with self._get_host_limiter(host).acquire(), self._semaphore:
+            return await self._parse_url_safely(url, validators)
+
+    def _get_host_limiter(self, host: str) -> HostLimiter:
+        """Get or create limiter for a host."""
+        limiter = self._host_limiters.get(host)
+        if limiter is None:
+            limiter = HostLimiter(
+                self.per_host_concurrency, self.per_host_rate_limit
             )
+            self._host_limiters[host] = limiter
+        return limiter
+
+    async def _parse_url_safely(
+        self, url: str, validators: CacheValidators | None = None
+    ) -> ParseResult:
+        """Parse URL and convert failures into a reason."""
+        if not url or not url.strip():
+            logger.warning("Empty URL provided")
+            return ParseResult(url=url, error="Empty URL")
 
+        try:
+            logger.debug("Parsing URL: %s", url)
+            result = await self._fetch_and_parse(url, validators)
             logger.debug("Successfully parsed %s", url)
-            return source
+            return result
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code in {404, 403, 410}:
@@ -78,66 +250,73 @@ class HTTPContentParsingService(ContentParsingServiceInterface):
             else:
                 # Unexpected HTTP errors
                 logger.warning("HTTP error for %s: %s", url, e)
-            return None
+            return ParseResult(
+                url=url, error=f"HTTP status {e.response.status_code}"
+            )
 
         except httpx.TimeoutException:
             logger.warning("Timeout while parsing %s", url)
-            return None
+            return ParseResult(url=url, error="Timeout")
 
         except httpx.ConnectError as e:
             logger.warning("Connection error for %s: %s", url, e)
-            return None
+            return ParseResult(url=url, error=f"Connection error: {e}")
 
         except httpx.RequestError as e:
             logger.warning("Request error for %s: %s", url, e)
-            return None
+            return ParseResult(url=url, error=f"Request error: {e}")
 
         except Exception as e:
             logger.error("Unexpected error parsing %s: %s", url, e)
-            return None
+            return ParseResult(url=url, error=f"Unexpected error: {e}")
 
-    async def parse_urls(self, urls: list[str]) -> list[Source]:
-        """Parse content from multiple URLs."""
-        if not urls:
-            return []
-
-        logger.info("Parsing %d URLs", len(urls))
-
-        sources: list[Source] = []
-
-        for url in urls:
-            source = await self.parse_url(url)
-            if source:
-                sources.append(source)
-
-        logger.info(
-            "Successfully parsed %d out of %d URLs (failed: %d)",
-            len(sources),
-            len(urls),
-            len(urls) - len(sources),
+    async def _fetch_and_parse(
+        self, url: str, validators: CacheValidators | None = None
+    ) -> ParseResult:
+        """Download the page and build a source from it."""
+        response = await self.client.get(
+            url, headers=self._conditional_headers(validators)
         )
-        return sources
-
-    def _extract_content(self, soup: BeautifulSoup) -> str:
-        """Extract main content from HTML."""
-        # Remove unwanted elements
-        for element in soup(["script", "style", "nav", "footer", "header"]):
-            element.decompose()
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            # Страница не изменилась - тело не загружается и не разбирается
+            logger.debug("Page not modified: %s", url)
+            return ParseResult(url=url, not_modified=True)
+        response.raise_for_status()
 
-        # Try to find main content areas
-        content_selectors = [
-            ".tn-atom",
-        ]
+        # Parse HTML in the worker pool so the event loop stays responsive
+        page = await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            extract_page,
+            response.content,
+            url,
+            self.html_backend,
+        )
 
-        for selector in content_selectors:
-            elements = soup.select(selector)
-            if elements:
-                return "\n".join(el.get_text(strip=True) for el in elements)
+        # Generate ID from URL
+        source_id = uuid.uuid5(uuid.NAMESPACE_URL, url)
 
-        # If no specific content found, use body
-        body = soup.find("body")
-        if body:
-            text = body.get_text(strip=True)
-            return text[:5000] if text else ""
+        source = Source(
+            id=source_id,
+            url=url,
+            title=page.title,
+            content=page.content,
+            content_hash=compute_content_hash(page.title, page.content),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            created_at=datetime.now(UTC),
+        )
+        return ParseResult(url=url, source=source)
 
-        return ""
+    @staticmethod
+    def _conditional_headers(
+        validators: CacheValidators | None,
+    ) -> dict[str, str]:
+        """Build If-None-Match / If-Modified-Since request headers."""
+        headers: dict[str, str] = {}
+        if validators is None:
+            return headers
+        if validators.etag:
+            headers["If-None-Match"] = validators.etag
+        if validators.last_modified:
+            headers["If-Modified-Since"] = validators.last_modified
+        return headers
@@ -2,19 +2,47 @@
 
 from src.domain.entities import Source
 
+from .context_packer import ContextPacker, PackedContext
+
+# Бюджет по умолчанию - без ограничения на практике
+DEFAULT_INPUT_TOKEN_BUDGET = 100_000
+
 
 class PromptBuilder:
     """Builds prompts for LLM."""
 
+    def __init__(self, context_packer: ContextPacker | None = None) -> None:
+        self.context_packer = context_packer or ContextPacker(
+            DEFAULT_INPUT_TOKEN_BUDGET
+        )
+
     def build_prompt_with_sources(
         self, question: str, sources: list[Source]
     ) -> str:
         """Create optimized prompt."""
-        context = self._prepare_context(sources)
-        return self._build_prompt_template(question, context, sources)
+        prompt, _ = self.build_packed_prompt(question, sources)
+        return prompt
+
+    def build_packed_prompt(
+        self, question: str, sources: list[Source]
+    ) -> tuple[str, PackedContext]:
+        """Create prompt whose sources fit the input token budget."""
+        # Шаблон и вопрос занимают часть бюджета в любом случае
+        reserved_tokens = self.context_packer.estimate_tokens(
+            self._build_prompt_template(question, "", [])
+        )
+        packed = self.context_packer.pack(sources, reserved_tokens)
+
+        context = self._prepare_context(packed.sources)
+        prompt = self._build_prompt_template(question, context, packed.sources)
+        return prompt, packed
 
     def _prepare_context(self, sources: list[Source]) -> str:
-        """Prepare context from sources."""
+        """Prepare context from sources.
+
+        Matching services put only the best passages of a source into
+        ``content``, so the context holds relevant excerpts, not pages.
+        """
         context_parts: list[str] = []
         for i, source in enumerate(sources, 1):
             context_parts.append(
@@ -35,7 +63,7 @@ class PromptBuilder:
 {source_list}
 
 
-ПОЛНАЯ ИНФОРМАЦИЯ:
+ФРАГМЕНТЫ ИСТОЧНИКОВ:
 {context}
 
 ВОПРОС: {question}
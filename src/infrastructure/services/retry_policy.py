@@ -0,0 +1,165 @@
+"""Retry, timeout and hedging policy for calls to external APIs."""
+
+import asyncio
+import contextlib
+import logging
+import math
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+from src.core.deadline import remaining_time
+
+logger = logging.getLogger(__name__)
+
+
+class RetryPolicy:
+    """Runs a call with per-attempt timeouts, retries and hedging.
+
+    Each attempt is limited by ``attempt_timeout`` and all attempts by
+    ``total_timeout`` or the deadline of the current request, whichever
+    comes first. Errors accepted by ``is_retryable`` are retried up to
+    ``max_attempts`` times after a jittered exponential backoff, or
+    after the delay requested by the server (``retry_after``) when it
+    is longer. Other errors are raised at once.
+
+    With hedging enabled, an attempt running longer than the
+    ``hedge_quantile`` of recent successful attempts gets a concurrent
+    duplicate; the first successful one wins and the other is
+    cancelled. Hedging starts after ``hedge_min_samples`` latencies are
+    known.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        attempt_timeout: float = 30.0,
+        total_timeout: float = 60.0,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        hedging_enabled: bool = False,
+        hedge_quantile: float = 0.95,
+        hedge_min_samples: int = 20,
+        latency_window: int = 200,
+        is_retryable: Callable[[Exception], bool] = lambda _: False,
+        retry_after: Callable[[Exception], float | None] = lambda _: None,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.attempt_timeout = attempt_timeout
+        self.total_timeout = total_timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.hedging_enabled = hedging_enabled
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+        self.is_retryable = is_retryable
+        self.retry_after = retry_after
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+
+    async def run[T](self, call: Callable[[], Awaitable[T]]) -> T:
+        """Run ``call`` according to the policy."""
+        deadline = time.monotonic() + self._time_budget()
+        attempt = 1
+        while True:
+            timeout = min(self.attempt_timeout, deadline - time.monotonic())
+            try:
+                return await self._hedged_attempt(call, timeout)
+            except Exception as e:
+                if attempt >= self.max_attempts or not self.is_retryable(e):
+                    raise
+                delay = self._backoff(attempt, e)
+                if time.monotonic() + delay >= deadline:
+                    # Повтор не успеет завершиться до дедлайна
+                    raise
+                logger.warning(
+                    "Attempt %d/%d failed (%s), retrying in %.2fs",
+                    attempt,
+                    self.max_attempts,
+                    type(e).__name__,
+                    delay,
+                )
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _time_budget(self) -> float:
+        """Time for all attempts, limited by the request deadline."""
+        request_remaining = remaining_time()
+        if request_remaining is None:
+            return self.total_timeout
+        return min(self.total_timeout, request_remaining)
+
+    async def _hedged_attempt[T](
+        self, call: Callable[[], Awaitable[T]], timeout: float
+    ) -> T:
+        """Run an attempt, adding a hedge if it is slower than usual."""
+        hedge_delay = self._hedge_delay()
+        if hedge_delay is None or hedge_delay >= timeout:
+            return await self._attempt(call, timeout)
+
+        primary = asyncio.ensure_future(self._attempt(call, timeout))
+        pending: set[asyncio.Future[T]] = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=hedge_delay)
+            if not done:
+                logger.info(
+                    "Attempt is slower than %.2fs, sending hedged request",
+                    hedge_delay,
+                )
+                pending.add(
+                    asyncio.ensure_future(
+                        self._attempt(call, timeout - hedge_delay)
+                    )
+                )
+
+            # Первый успешный ответ; ошибку отдаем, если упали все попытки
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                if not pending:
+                    return await done.pop()
+        finally:
+            for task in pending:
+                task.cancel()
+            for task in pending:
+                with contextlib.suppress(BaseException):
+                    await task
+
+    async def _attempt[T](
+        self, call: Callable[[], Awaitable[T]], timeout: float
+    ) -> T:
+        """Run a single attempt within ``timeout`` seconds."""
+        if timeout <= 0:
+            raise TimeoutError("Deadline exceeded")
+
+        start = time.monotonic()
+        async with asyncio.timeout(timeout):
+            result = await call()
+        self._latencies.append(time.monotonic() - start)
+        return result
+
+    def _hedge_delay(self) -> float | None:
+        """Latency quantile after which a hedged attempt is sent."""
+        if (
+            not self.hedging_enabled
+            or len(self._latencies) < self.hedge_min_samples
+        ):
+            return None
+        latencies = sorted(self._latencies)
+        index = math.ceil(self.hedge_quantile * len(latencies)) - 1
+        return latencies[max(index, 0)]
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        """Full-jitter exponential delay, at least ``retry_after``."""
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        delay = random.uniform(0, ceiling)
+        retry_after = self.retry_after(error)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
@@ -0,0 +1,172 @@
+"""Inverted keyword index over a corpus of sources."""
+
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from src.domain.entities import Source, split_into_passages
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Флаги полей в постинг-листе
+TITLE_FIELD = 1
+CONTENT_FIELD = 2
+
+# Размер LRU-кеша раскрытий ключевых слов: ключи приходят из вопросов
+# пользователей, поэтому кеш ограничен
+EXPANSION_CACHE_SIZE = 4096
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def corpus_signature(sources: Sequence[Source]) -> tuple[object, ...]:
+    """Build a cheap signature identifying a corpus version."""
+    return tuple((source.id, source.updated_at) for source in sources)
+
+
+@dataclass(slots=True)
+class PostingList:
+    """Passages containing a token with per-field term frequencies."""
+
+    positions: array[int] = field(default_factory=lambda: array("I"))
+    title_tf: array[int] = field(default_factory=lambda: array("I"))
+    content_tf: array[int] = field(default_factory=lambda: array("I"))
+
+
+class InvertedIndex:
+    """Token -> posting list index built once for a corpus.
+
+    Every source is split into overlapping passages, and a passage is
+    the indexed document: positions in posting lists refer to
+    ``passages``, and ``passage_sources`` maps them back to ``sources``.
+    A passage carries the title of its source, so title matches still
+    count. Passages of one source are stored consecutively, in document
+    order.
+
+    Posting lists and field lengths are stored in compact ``array``
+    buffers, so term statistics needed for ranking are precomputed at
+    index time. Lookups expand a keyword to every indexed token starting
+    with it, which covers Russian inflections ("ритейл" -> "ритейлом")
+    the way the former substring check did, without scanning texts.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[Source],
+        passage_size: int = 1000,
+        passage_overlap: int = 200,
+    ) -> None:
+        self.sources: tuple[Source, ...] = tuple(sources)
+        # Ссылка на исходный список для быстрой проверки снимка корпуса
+        self._corpus = sources
+        self.signature = corpus_signature(self.sources)
+        self.passages: list[str] = []
+        self.passage_sources: array[int] = array("I")
+        self.title_lengths: array[int] = array("I")
+        self.content_lengths: array[int] = array("I")
+        self._postings: dict[str, PostingList] = {}
+
+        for source_position, source in enumerate(self.sources):
+            title_counts = Counter(tokenize(source.title))
+            for passage in split_into_passages(
+                source.content, passage_size, passage_overlap
+            ):
+                self._add_passage(source_position, title_counts, passage)
+
+        documents = len(self.passages) or 1
+        self.avg_title_length = sum(self.title_lengths) / documents
+        self.avg_content_length = sum(self.content_lengths) / documents
+
+        # Отсортированный словарь для поиска по префиксу
+        self._vocabulary: list[str] = sorted(self._postings)
+        self._expansions: OrderedDict[str, tuple[str, ...]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.passages)
+
+    def matches(self, sources: Sequence[Source]) -> bool:
+        """Check whether the index was built for the given corpus."""
+        return sources is self._corpus or (
+            len(sources) == len(self.sources)
+            and corpus_signature(sources) == self.signature
+        )
+
+    def expand(self, keyword: str) -> tuple[str, ...]:
+        """Return indexed tokens that start with the keyword."""
+        cached = self._expansions.get(keyword)
+        if cached is not None:
+            self._expansions.move_to_end(keyword)
+            return cached
+
+        tokens: list[str] = []
+        index = bisect_left(self._vocabulary, keyword)
+        while index < len(self._vocabulary) and self._vocabulary[
+            index
+        ].startswith(keyword):
+            tokens.append(self._vocabulary[index])
+            index += 1
+
+        expansion = tuple(tokens)
+        self._expansions[keyword] = expansion
+        if len(self._expansions) > EXPANSION_CACHE_SIZE:
+            self._expansions.popitem(last=False)
+        return expansion
+
+    def lookup(self, keyword: str) -> dict[int, int]:
+        """Return merged field flags per passage for a keyword."""
+        merged: dict[int, int] = {}
+        for position, (title_tf, content_tf) in self.term_frequencies(
+            keyword
+        ).items():
+            flags = TITLE_FIELD if title_tf else 0
+            if content_tf:
+                flags |= CONTENT_FIELD
+            merged[position] = flags
+        return merged
+
+    def term_frequencies(self, keyword: str) -> dict[int, tuple[int, int]]:
+        """Return (title_tf, content_tf) per passage for a keyword."""
+        merged: dict[int, tuple[int, int]] = {}
+        for token in self.expand(keyword):
+            postings = self._postings[token]
+            for position, title_tf, content_tf in zip(
+                postings.positions,
+                postings.title_tf,
+                postings.content_tf,
+                strict=True,
+            ):
+                previous = merged.get(position)
+                if previous is not None:
+                    title_tf += previous[0]
+                    content_tf += previous[1]
+                merged[position] = (title_tf, content_tf)
+        return merged
+
+    def _add_passage(
+        self,
+        source_position: int,
+        title_counts: Counter[str],
+        passage: str,
+    ) -> None:
+        """Register every token of a passage in the posting lists."""
+        position = len(self.passages)
+        self.passages.append(passage)
+        self.passage_sources.append(source_position)
+
+        content_counts = Counter(tokenize(passage))
+        self.title_lengths.append(title_counts.total())
+        self.content_lengths.append(content_counts.total())
+
+        for token in title_counts.keys() | content_counts.keys():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = PostingList()
+            postings.positions.append(position)
+            postings.title_tf.append(title_counts[token])
+            postings.content_tf.append(content_counts[token])
@@ -0,0 +1,117 @@
+"""Coalescing of concurrent identical LLM requests."""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import replace
+
+from src.core.config.llm import LLMConfig
+from src.core.timing import elapsed_ms
+from src.domain.entities import LLMCompletion, Source
+from src.domain.services import LLMServiceInterface
+
+from .cached_llm import build_cache_key
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight[T]:
+    """Runs one call per key at a time, sharing its result with waiters.
+
+    The call runs in its own task, so a cancelled caller (for example a
+    client that disconnected) does not cancel the result other callers
+    are waiting for.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[str, asyncio.Task[T]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently running."""
+        return len(self._in_flight)
+
+    async def do(
+        self, key: str, call: Callable[[], Awaitable[T]]
+    ) -> tuple[T, bool]:
+        """Run or join the call for ``key``; return (result, shared)."""
+        task = self._in_flight.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: str, task: asyncio.Task[T]) -> None:
+        """Remove finished call; its error was delivered to the waiters."""
+        self._in_flight.pop(key, None)
+        if not task.cancelled():
+            # Не даем asyncio сообщать о "неполученном" исключении, если
+            # все ожидающие уже отменены
+            task.exception()
+
+
+class CoalescingLLMService(LLMServiceInterface):
+    """LLM service making one call for concurrent identical questions.
+
+    Requests are identified like answer cache entries: normalized
+    question, model parameters and the exact sources. Followers wait for
+    the leader's completion and report it as coalesced with no tokens
+    spent. Streaming is passed through, because followers would lose
+    incremental delivery.
+    """
+
+    def __init__(
+        self,
+        llm_service: LLMServiceInterface,
+        single_flight: SingleFlight[LLMCompletion],
+        config: LLMConfig,
+    ) -> None:
+        self.llm_service = llm_service
+        self.single_flight = single_flight
+        self.config = config
+
+    async def generate_answer(self, question: str) -> LLMCompletion:
+        """Generate answer based on question only."""
+        return await self._coalesce(
+            build_cache_key(question, self.config, None),
+            lambda: self.llm_service.generate_answer(question),
+        )
+
+    async def generate_answer_with_sources(
+        self, question: str, sources: list[Source]
+    ) -> LLMCompletion:
+        """Generate answer based on question and relevant sources."""
+        return await self._coalesce(
+            build_cache_key(question, self.config, sources),
+            lambda: self.llm_service.generate_answer_with_sources(
+                question, sources
+            ),
+        )
+
+    def stream_answer(
+        self, question: str, sources: list[Source] | None = None
+    ) -> AsyncIterator[str]:
+        """Stream answer from the wrapped service."""
+        return self.llm_service.stream_answer(question, sources)
+
+    async def _coalesce(
+        self, key: str, call: Callable[[], Awaitable[LLMCompletion]]
+    ) -> LLMCompletion:
+        """Join an in-flight identical call or start a new one."""
+        start = time.perf_counter()
+        completion, shared = await self.single_flight.do(key, call)
+        if not shared:
+            return completion
+
+        logger.debug("Joined in-flight LLM call for identical question")
+        return replace(
+            completion,
+            prompt_tokens=0,
+            response_tokens=0,
+            llm_ms=elapsed_ms(start),
+            coalesced=True,
+        )
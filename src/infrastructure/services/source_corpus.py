@@ -0,0 +1,134 @@
+"""Process-wide snapshot of the sources corpus."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.entities import Source
+from src.domain.services import (
+    SourceCorpusServiceInterface,
+    SourceMatchingServiceInterface,
+)
+from src.infrastructure.repositories import SourceRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CorpusSnapshot:
+    """Immutable corpus version shared by all requests."""
+
+    version: int
+    sources: list[Source]
+    fingerprint: tuple[int, datetime | None]
+    loaded_at: float = field(default_factory=time.monotonic)
+
+
+class InMemorySourceCorpusService(SourceCorpusServiceInterface):
+    """Keeps the corpus in memory so retrieval does no database reads.
+
+    The snapshot is loaded at startup, replaced after ingestion and, when
+    ``refresh_interval`` is set, revalidated with a cheap fingerprint query
+    so changes made by other workers are picked up.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        source_matching_service: SourceMatchingServiceInterface,
+        refresh_interval: float = 60.0,
+    ) -> None:
+        self.session_factory = session_factory
+        self.source_matching_service = source_matching_service
+        self.refresh_interval = refresh_interval
+        self._snapshot: CorpusSnapshot | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def version(self) -> int:
+        """Version of the currently loaded corpus snapshot."""
+        return self._snapshot.version if self._snapshot else 0
+
+    async def get_sources(self) -> list[Source]:
+        """Get sources of the current corpus snapshot."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            async with self._lock:
+                if self._snapshot is None:
+                    await self._load()
+        elif self._is_stale(snapshot):
+            await self._revalidate(snapshot)
+
+        return self._snapshot.sources if self._snapshot else []
+
+    async def refresh(self) -> None:
+        """Reload the corpus snapshot from the database.
+
+        Skipped when the matching service searches the database itself:
+        the snapshot is then loaded only if someone asks for it.
+        """
+        if not self.source_matching_service.requires_corpus:
+            return
+
+        async with self._lock:
+            await self._load()
+
+    async def refresh_after_write(self) -> None:
+        """Reload the snapshot after sources were saved, without raising."""
+        try:
+            await self.refresh()
+        except Exception as e:
+            # Источники сохранены; снимок будет перепроверен позже
+            logger.error("Error refreshing sources corpus: %s", e)
+
+    def _is_stale(self, snapshot: CorpusSnapshot) -> bool:
+        """Check whether the snapshot should be revalidated."""
+        return (
+            self.refresh_interval > 0
+            and time.monotonic() - snapshot.loaded_at >= self.refresh_interval
+        )
+
+    async def _revalidate(self, snapshot: CorpusSnapshot) -> None:
+        """Reload the snapshot only if the stored corpus has changed."""
+        async with self._lock:
+            # Другой запрос мог уже обновить снимок
+            if self._snapshot is not snapshot:
+                return
+
+            async with self.session_factory() as session:
+                fingerprint = await SourceRepository(session).get_fingerprint()
+
+            if fingerprint == snapshot.fingerprint:
+                self._snapshot = CorpusSnapshot(
+                    version=snapshot.version,
+                    sources=snapshot.sources,
+                    fingerprint=fingerprint,
+                )
+                return
+
+            await self._load()
+
+    async def _load(self) -> None:
+        """Load sources and derived search structures."""
+        async with self.session_factory() as session:
+            repository = SourceRepository(session)
+            fingerprint = await repository.get_fingerprint()
+            sources = await repository.get_all()
+
+        # Строим производный поисковый индекс вне горячего пути
+        self.source_matching_service.prepare(sources)
+
+        self._snapshot = CorpusSnapshot(
+            version=self.version + 1,
+            sources=sources,
+            fingerprint=fingerprint,
+        )
+        logger.info(
+            "Loaded corpus snapshot v%d with %d sources",
+            self._snapshot.version,
+            len(sources),
+        )
@@ -1,13 +1,81 @@
-import re
+import logging
+import math
+from dataclasses import replace
 
-from src.domain.entities import Source
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config.search import SearchSettings
+from src.domain.entities import (
+    PASSAGE_SEPARATOR,
+    Source,
+    split_into_passages,
+)
 from src.domain.services import SourceMatchingServiceInterface
+from src.infrastructure.repositories import SourceRepository
+
+from .search_index import (
+    CONTENT_FIELD,
+    TITLE_FIELD,
+    InvertedIndex,
+    tokenize,
+)
+
+logger = logging.getLogger(__name__)
+
+# Слова навигационных запросов ничего не говорят о теме вопроса
+NAVIGATIONAL_WORDS = frozenset(
+    {
+        "покажи",
+        "покажите",
+        "найди",
+        "найдите",
+        "найти",
+        "дай",
+        "дайте",
+        "пришли",
+        "пришлите",
+        "приведи",
+        "приведите",
+        "скинь",
+        "скиньте",
+        "перечисли",
+        "перечислите",
+        "список",
+        "какие",
+        "делали",
+        "делаете",
+        "разрабатывали",
+        "разрабатываете",
+        "внедряли",
+        "посмотреть",
+        "почитать",
+    }
+)
 
 
 class SimpleSourceMatchingService(SourceMatchingServiceInterface):
-    """Simple but effective implementation of SourceMatchingService."""
+    """Simple but effective implementation of SourceMatchingService.
+
+    Scoring is done per passage. A source ranks by its best passage, and
+    the returned source carries only its best passages as ``content``, so
+    the prompt is built from relevant text instead of whole pages.
+    """
+
+    def __init__(
+        self,
+        max_results: int = 5,
+        passage_size: int = 1000,
+        passage_overlap: int = 200,
+        max_passages_per_source: int = 2,
+    ) -> None:
+        self.max_results = max_results
+        self.passage_size = passage_size
+        self.passage_overlap = passage_overlap
+        self.max_passages_per_source = max_passages_per_source
+
+        # Индекс строится один раз на версию корпуса
+        self._index: InvertedIndex | None = None
 
-    def __init__(self) -> None:
         # Простой набор стоп-слов
         self.stop_words: set[str] = {
             "что",
@@ -81,33 +149,104 @@ class SimpleSourceMatchingService(SourceMatchingServiceInterface):
             return []
 
         if not question.strip():
-            return sources[:3]
+            return self._leading_passages(sources[:3])
 
         # Извлекаем ключевые слова из вопроса
         question_keywords = self._extract_keywords(question)
 
         if not question_keywords:
-            return sources[:3]
+            return self._leading_passages(sources[:3])
 
-        # Оцениваем релевантность каждого источника
-        scored_sources: list[tuple[Source, float]] = []
-        for source in sources:
-            score = self._calculate_score(question_keywords, source)
-            if score > 0:
-                scored_sources.append((source, score))
+        # Оцениваем только фрагменты, имеющие общие токены с вопросом
+        index = self._get_index(sources)
+        scores = self._calculate_scores(question_keywords, index)
 
-        # Сортируем и возвращаем топ-5
-        scored_sources.sort(key=lambda x: x[1], reverse=True)
-        result = [source for source, _ in scored_sources[:5]]
+        # Сортируем и возвращаем топ-N (при равенстве - порядок корпуса)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        result = self._select_passages(index, ranked)
 
         # Если ничего не найдено, возвращаем первые 3
-        return result if result else sources[:3]
+        return result if result else self._leading_passages(sources[:3])
+
+    def confidence(self, question: str, sources: list[Source]) -> float:
+        """Share of question keywords found in the best source.
+
+        Every keyword counts, including those absent from the whole
+        corpus: an off-topic lookup must not look like a confident match.
+        Navigational words ("покажите") are not counted; retrieval still
+        uses them as ordinary keywords.
+        """
+        keywords = self._extract_keywords(question) - NAVIGATIONAL_WORDS
+        if not keywords or not sources:
+            return 0.0
+
+        best = sources[0]
+        tokens = set(tokenize(f"{best.title} {best.content}"))
+        # Совпадение по префиксу, как при поиске по индексу
+        found = sum(
+            1
+            for keyword in keywords
+            if any(token.startswith(keyword) for token in tokens)
+        )
+        return found / len(keywords)
+
+    def prepare(self, sources: list[Source]) -> None:
+        """Build the inverted index for a corpus ahead of queries."""
+        self._get_index(sources)
+
+    def _get_index(self, sources: list[Source]) -> InvertedIndex:
+        """Return the index for the corpus, rebuilding it on change."""
+        if self._index is None or not self._index.matches(sources):
+            logger.debug(
+                "Building inverted index for %d sources", len(sources)
+            )
+            self._index = InvertedIndex(
+                sources, self.passage_size, self.passage_overlap
+            )
+        return self._index
+
+    def _select_passages(
+        self, index: InvertedIndex, ranked: list[tuple[int, float]]
+    ) -> list[Source]:
+        """Group ranked passages into top sources with best passages."""
+        selected: dict[int, list[int]] = {}
+        for passage, _ in ranked:
+            source_position = index.passage_sources[passage]
+            passages = selected.get(source_position)
+            if passages is None:
+                if len(selected) >= self.max_results:
+                    continue
+                passages = selected[source_position] = []
+            if len(passages) < self.max_passages_per_source:
+                passages.append(passage)
+
+        # Фрагменты одного источника - в порядке следования в тексте
+        return [
+            replace(
+                index.sources[source_position],
+                content=PASSAGE_SEPARATOR.join(
+                    index.passages[passage] for passage in sorted(passages)
+                ),
+            )
+            for source_position, passages in selected.items()
+        ]
+
+    def _leading_passages(self, sources: list[Source]) -> list[Source]:
+        """Keep only the first passage of each source."""
+        return [
+            replace(
+                source,
+                content=split_into_passages(
+                    source.content, self.passage_size, self.passage_overlap
+                )[0],
+            )
+            for source in sources
+        ]
 
     def _extract_keywords(self, text: str) -> set[str]:
         """Extract meaningful keywords from text."""
-        # Убираем знаки препинания и приводим к нижнему регистру
-        clean_text = re.sub(r"[^\w\s]", " ", text.lower())
-        words = clean_text.split()
+        # Токенизируем так же, как при построении индекса
+        words = tokenize(text)
 
         # Фильтруем короткие слова и стоп-слова
         return {
@@ -116,23 +255,187 @@ class SimpleSourceMatchingService(SourceMatchingServiceInterface):
             if len(word) > 2 and word not in self.stop_words
         }
 
-    def _calculate_score(self, keywords: set[str], source: Source) -> float:
-        """Calculate relevance score for a source."""
-        # Объединяем заголовок и содержимое
-        title_text = source.title.lower()
-        content_text = source.content.lower()
-
-        score = 0.0
+    def _calculate_scores(
+        self, keywords: set[str], index: InvertedIndex
+    ) -> dict[int, float]:
+        """Calculate relevance scores for sources sharing keywords."""
+        scores: dict[int, float] = {}
 
-        # Проверяем совпадения в заголовке (больший вес)
         for keyword in keywords:
-            if keyword in title_text:
-                score += 3.0
+            for position, flags in index.lookup(keyword).items():
+                score = scores.get(position, 0.0)
+                # Совпадение в заголовке имеет больший вес
+                if flags & TITLE_FIELD:
+                    score += 3.0
+                if flags & CONTENT_FIELD:
+                    score += 1.0
+                scores[position] = score
+
+        # Нормализуем по количеству ключевых слов
+        return {
+            position: score / len(keywords)
+            for position, score in scores.items()
+            if score > 0
+        }
+
+
+class BM25SourceMatchingService(SimpleSourceMatchingService):
+    """BM25F ranking over title and content fields.
+
+    Document frequencies, field lengths and average lengths come from the
+    shared inverted index, so a query only touches matching postings.
+    """
+
+    def __init__(
+        self,
+        max_results: int = 5,
+        *,
+        k1: float = 1.2,
+        b: float = 0.75,
+        title_weight: float = 3.0,
+        content_weight: float = 1.0,
+        passage_size: int = 1000,
+        passage_overlap: int = 200,
+        max_passages_per_source: int = 2,
+    ) -> None:
+        super().__init__(
+            max_results=max_results,
+            passage_size=passage_size,
+            passage_overlap=passage_overlap,
+            max_passages_per_source=max_passages_per_source,
+        )
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+        self.content_weight = content_weight
+
+    def _calculate_scores(
+        self, keywords: set[str], index: InvertedIndex
+    ) -> dict[int, float]:
+        """Calculate BM25F scores for sources sharing keywords."""
+        scores: dict[int, float] = {}
+        documents = len(index)
 
-        # Проверяем совпадения в содержимом
         for keyword in keywords:
-            if keyword in content_text:
-                score += 1.0
+            frequencies = index.term_frequencies(keyword)
+            if not frequencies:
+                continue
 
-        # Нормализуем по количеству ключевых слов
-        return score / len(keywords) if keywords else 0.0
+            document_frequency = len(frequencies)
+            idf = math.log(
+                1.0
+                + (documents - document_frequency + 0.5)
+                / (document_frequency + 0.5)
+            )
+
+            for position, (title_tf, content_tf) in frequencies.items():
+                # Взвешенная частота с нормализацией по длине каждого поля
+                weighted_tf = self.title_weight * self._normalize(
+                    title_tf,
+                    index.title_lengths[position],
+                    index.avg_title_length,
+                ) + self.content_weight * self._normalize(
+                    content_tf,
+                    index.content_lengths[position],
+                    index.avg_content_length,
+                )
+                scores[position] = scores.get(position, 0.0) + idf * (
+                    weighted_tf * (self.k1 + 1) / (weighted_tf + self.k1)
+                )
+
+        return {
+            position: score for position, score in scores.items() if score > 0
+        }
+
+    def _normalize(
+        self, term_frequency: int, length: int, avg_length: float
+    ) -> float:
+        """Normalize field term frequency by the field length."""
+        if not term_frequency:
+            return 0.0
+        if avg_length <= 0:
+            return float(term_frequency)
+        return term_frequency / (1 - self.b + self.b * length / avg_length)
+
+
+class PostgresFullTextSourceMatchingService(SimpleSourceMatchingService):
+    """Full-text search pushed down to PostgreSQL.
+
+    Passages stored at ingestion are ranked in SQL with ``ts_rank_cd``
+    over their generated ``search_vector`` column (source title weighted
+    A, passage text weighted B) and a GIN index. Only the best passages
+    of the top sources reach the application and no corpus is kept in
+    memory. Question keywords are OR-ed: a passage matching any of them
+    is a candidate, and passages matching more rank higher.
+    """
+
+    requires_corpus = False
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        max_results: int = 5,
+        max_passages_per_source: int = 2,
+    ) -> None:
+        super().__init__(
+            max_results=max_results,
+            max_passages_per_source=max_passages_per_source,
+        )
+        self.session_factory = session_factory
+
+    async def find_relevant_sources(
+        self,
+        question: str,
+        sources: list[Source],  # noqa: ARG002
+    ) -> list[Source]:
+        """Find the best sources for the question in the database."""
+        keywords = self._extract_keywords(question)
+        if not keywords:
+            return []
+
+        # Ключевые слова состоят только из \w, операторы tsquery исключены
+        query = " | ".join(sorted(keywords))
+        async with self.session_factory() as session:
+            return await SourceRepository(session).search_passages(
+                query, self.max_results, self.max_passages_per_source
+            )
+
+    def prepare(self, sources: list[Source]) -> None:
+        """Nothing to prepare: the index is maintained by PostgreSQL."""
+
+
+def create_source_matching_service(
+    settings: SearchSettings,
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
+) -> SourceMatchingServiceInterface:
+    """Create the source matching service selected in settings."""
+    if settings.source_matching_backend == "postgres":
+        if session_factory is None:
+            raise ValueError("Postgres search requires a session factory")
+        logger.debug("Creating PostgreSQL full-text source matching service")
+        return PostgresFullTextSourceMatchingService(
+            session_factory,
+            max_results=settings.max_relevant_sources,
+            max_passages_per_source=settings.max_passages_per_source,
+        )
+
+    if settings.source_matching_backend == "bm25":
+        logger.debug("Creating BM25 source matching service")
+        return BM25SourceMatchingService(
+            max_results=settings.max_relevant_sources,
+            k1=settings.bm25_k1,
+            b=settings.bm25_b,
+            title_weight=settings.bm25_title_weight,
+            content_weight=settings.bm25_content_weight,
+            passage_size=settings.passage_size,
+            passage_overlap=settings.passage_overlap,
+            max_passages_per_source=settings.max_passages_per_source,
+        )
+
+    logger.debug("Creating simple source matching service")
+    return SimpleSourceMatchingService(
+        max_results=settings.max_relevant_sources,
+        passage_size=settings.passage_size,
+        passage_overlap=settings.passage_overlap,
+        max_passages_per_source=settings.max_passages_per_source,
+    )
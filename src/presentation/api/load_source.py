@@ -1,11 +1,20 @@
 import logging
+from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response, status
 
+from src.application.dto.converters import ResponseConverter
 from src.application.dto.requests import LoadSourcesRequest
-from src.application.dto.responses import LoadSourcesResponse
-from src.application.use_cases import LoadSourcesUseCase
-from src.presentation.dependencies import get_load_sources_use_case
+from src.application.dto.responses import (
+    IngestionJobResponse,
+    LoadSourcesResponse,
+)
+from src.application.use_cases import IngestionJobRunner, LoadSourcesUseCase
+from src.domain.exceptions import NotFoundError
+from src.presentation.dependencies import (
+    get_ingestion_job_runner,
+    get_load_sources_use_case,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -13,22 +22,53 @@ router = APIRouter()
 
 @router.post(
     "/load",
-    response_model=LoadSourcesResponse,
+    response_model=LoadSourcesResponse | IngestionJobResponse,
 )
 async def load_sources(
     request: LoadSourcesRequest,
+    response: Response,
     use_case: LoadSourcesUseCase = Depends(get_load_sources_use_case),
-) -> LoadSourcesResponse:
-    """Load sources from URLs."""
+    runner: IngestionJobRunner = Depends(get_ingestion_job_runner),
+) -> LoadSourcesResponse | IngestionJobResponse:
+    """Load sources from URLs.
+
+    With ``run_in_background`` the URLs are loaded by a background job:
+    the response is 202 with the job, its progress is available at
+    ``/sources/jobs/{job_id}``.
+    """
 
     logger.info("Starting with %d URLs", len(request.urls))
 
-    response = await use_case.execute(request.urls)
+    if request.run_in_background:
+        job = await runner.submit(request.urls)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return ResponseConverter.ingestion_job_to_response(job)
+
+    result = await use_case.execute(request.urls)
 
     logger.info(
         "Loaded %d sources, failed: %d",
-        response.loaded_count,
-        response.failed_count,
+        result.loaded_count,
+        result.failed_count,
     )
 
-    return response
+    return result
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=IngestionJobResponse,
+)
+async def get_ingestion_job(
+    job_id: UUID,
+    runner: IngestionJobRunner = Depends(get_ingestion_job_runner),
+) -> IngestionJobResponse:
+    """Get background ingestion job status and progress."""
+    job = await runner.get(job_id)
+    if job is None:
+        raise NotFoundError(
+            f"Задача загрузки {job_id} не найдена",
+            resource_type="ingestion_job",
+            resource_id=str(job_id),
+        )
+    return ResponseConverter.ingestion_job_to_response(job)
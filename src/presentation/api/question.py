@@ -1,10 +1,15 @@
+import json
 import logging
+from collections.abc import AsyncIterator
+from typing import Any
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
 from src.application.dto.requests import QuestionRequest
 from src.application.dto.responses import QuestionAnswerResponse
 from src.application.use_cases import AskQuestionUseCase
+from src.domain.exceptions import DomainError
 from src.presentation.dependencies import get_ask_question_use_case
 
 router = APIRouter()
@@ -21,4 +26,62 @@ async def ask_question(
     logger.info("Received question: %s", request.question)
 
     # Use case возвращает готовую DTO для презентации
-    return await use_case.execute(request.question)
+    return await use_case.execute(
+        request.question, include_timings=request.include_timings
+    )
+
+
+@router.post(
+    "/ask/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def ask_question_stream(
+    request: QuestionRequest,
+    use_case: AskQuestionUseCase = Depends(get_ask_question_use_case),
+) -> StreamingResponse:
+    """Ask a question and stream the answer as Server-Sent Events.
+
+    Events: ``token`` with a text chunk, ``done`` with the saved
+    question and answer, ``error`` if generation fails mid-stream.
+    """
+
+    logger.info("Received streaming question: %s", request.question)
+
+    events = await use_case.stream(
+        request.question, include_timings=request.include_timings
+    )
+    return StreamingResponse(
+        _to_sse(events),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Отключаем буферизацию ответа в nginx
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+async def _to_sse(
+    events: AsyncIterator[str | QuestionAnswerResponse],
+) -> AsyncIterator[str]:
+    """Encode answer stream events in the SSE format."""
+    try:
+        async for event in events:
+            if isinstance(event, str):
+                yield _format_sse("token", {"text": event})
+            else:
+                yield _format_sse("done", event.model_dump(mode="json"))
+    except DomainError as e:
+        # Статус ответа уже отправлен, сообщаем об ошибке событием
+        logger.warning("Answer stream failed: %s", e.message)
+        yield _format_sse("error", e.to_dict())
+    except Exception as e:
+        logger.error("Unexpected error in answer stream: %s", e)
+        yield _format_sse("error", {"detail": "Внутренняя ошибка сервера"})
+
+
+def _format_sse(event: str, data: dict[str, Any]) -> str:
+    """Format a single Server-Sent Event."""
+    payload = json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
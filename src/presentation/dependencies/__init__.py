@@ -1,12 +1,16 @@
 from .database import get_db_session
 from .repositories import (
     get_answer_repository,
+    get_question_answer_repository,
     get_question_repository,
     get_source_repository,
 )
 from .services import (
     get_anthropic_service,
     get_content_parsing_service,
+    get_ingestion_job_runner,
+    get_llm_service,
+    get_source_corpus_service,
     get_source_matching_service,
 )
 from .use_cases import (
@@ -24,8 +28,12 @@ __all__ = [
     "get_create_question_use_case",
     "get_db_session",
     "get_generate_answer_use_case",
+    "get_ingestion_job_runner",
+    "get_llm_service",
     "get_load_sources_use_case",
+    "get_question_answer_repository",
     "get_question_repository",
+    "get_source_corpus_service",
     "get_source_matching_service",
     "get_source_repository",
 ]
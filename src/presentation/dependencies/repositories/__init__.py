@@ -1,9 +1,11 @@
 from .answer import get_answer_repository
 from .question import get_question_repository
+from .question_answer import get_question_answer_repository
 from .source import get_source_repository
 
 __all__ = [
     "get_answer_repository",
+    "get_question_answer_repository",
     "get_question_repository",
     "get_source_repository",
 ]
@@ -0,0 +1,21 @@
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.repositories import QuestionAnswerRepositoryInterface
+from src.infrastructure.repositories import (
+    QuestionAnswerRepository,
+)
+from src.presentation.dependencies.database import get_db_session
+
+
+def get_question_answer_repository(
+    request: Request,
+    db_session: AsyncSession = Depends(get_db_session),
+) -> QuestionAnswerRepositoryInterface:
+    """Get question and answer repository (write-behind if enabled)."""
+    write_behind: QuestionAnswerRepositoryInterface | None = (
+        request.app.state.qa_write_behind
+    )
+    if write_behind is not None:
+        return write_behind
+    return QuestionAnswerRepository(db_session)
@@ -1,11 +1,17 @@
 from .services import (
     get_anthropic_service,
     get_content_parsing_service,
+    get_ingestion_job_runner,
+    get_llm_service,
+    get_source_corpus_service,
     get_source_matching_service,
 )
 
 __all__ = [
     "get_anthropic_service",
     "get_content_parsing_service",
+    "get_ingestion_job_runner",
+    "get_llm_service",
+    "get_source_corpus_service",
     "get_source_matching_service",
 ]
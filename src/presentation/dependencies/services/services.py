@@ -1,33 +1,110 @@
 import logging
-import os
 
+from fastapi import Depends, Request
+
+from src.application.use_cases import IngestionJobRunner
+from src.core.config import get_settings
+from src.domain.services import (
+    LLMServiceInterface,
+    SourceCorpusServiceInterface,
+    SourceMatchingServiceInterface,
+)
 from src.infrastructure.services import (
     AnthropicLLMService,
+    CachedLLMService,
+    CircuitBreakerLLMService,
+    CoalescingLLMService,
+    ExtractiveLLMService,
     HTTPContentParsingService,
-    SimpleSourceMatchingService,
+    is_provider_failure,
 )
 
 logger = logging.getLogger(__name__)
 
 
-def get_anthropic_service() -> AnthropicLLMService:
-    """Get Anthropic LLM service."""
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
+def get_anthropic_service(request: Request) -> AnthropicLLMService:
+    """Get Anthropic LLM service backed by the shared client."""
+    client = request.app.state.anthropic_client
+    if client is None:
         logger.error("ANTHROPIC_API_KEY environment variable is required")
         raise ValueError("ANTHROPIC_API_KEY environment variable is required")
 
     logger.debug("Creating Anthropic LLM service")
-    return AnthropicLLMService(api_key)
+    return AnthropicLLMService(
+        client,
+        get_settings(),
+        limiter=request.app.state.llm_limiter,
+        retry_policy=request.app.state.llm_retry_policy,
+    )
+
+
+def get_llm_service(
+    request: Request,
+    llm_service: AnthropicLLMService = Depends(get_anthropic_service),
+) -> LLMServiceInterface:
+    """Get LLM service with fallbacks, cache and coalescing."""
+    settings = get_settings()
+    service: LLMServiceInterface = llm_service
+
+    # Размыкатель внутри кеша: кешированные ответы доступны и без LLM
+    circuit_breaker = request.app.state.llm_circuit_breaker
+    if circuit_breaker is not None:
+        service = CircuitBreakerLLMService(
+            service,
+            circuit_breaker,
+            settings.llm_fallback_snippet_chars,
+            is_failure=is_provider_failure,
+        )
+
+    cache = request.app.state.answer_cache
+    if cache is not None:
+        service = CachedLLMService(service, cache, settings)
+
+    # Одновременные одинаковые вопросы ждут один вызов (и одно чтение кеша)
+    single_flight = request.app.state.llm_single_flight
+    if single_flight is not None:
+        service = CoalescingLLMService(service, single_flight, settings)
+
+    # Навигационные вопросы отвечаем списком источников без вызова LLM
+    if settings.extractive_answers_enabled:
+        service = ExtractiveLLMService(
+            service,
+            request.app.state.source_matching_service,
+            min_confidence=settings.extractive_min_confidence,
+            snippet_chars=settings.extractive_snippet_chars,
+        )
+    return service
+
+
+def get_content_parsing_service(
+    request: Request,
+) -> HTTPContentParsingService:
+    """Get shared content parsing service."""
+    service: HTTPContentParsingService = (
+        request.app.state.content_parsing_service
+    )
+    return service
+
+
+def get_source_matching_service(
+    request: Request,
+) -> SourceMatchingServiceInterface:
+    """Get shared source matching service (keeps its search index)."""
+    service: SourceMatchingServiceInterface = (
+        request.app.state.source_matching_service
+    )
+    return service
 
 
-def get_content_parsing_service() -> HTTPContentParsingService:
-    """Get content parsing service."""
-    logger.debug("Creating HTTP content parsing service")
-    return HTTPContentParsingService()
+def get_source_corpus_service(
+    request: Request,
+) -> SourceCorpusServiceInterface:
+    """Get shared in-memory corpus snapshot service."""
+    corpus: SourceCorpusServiceInterface = request.app.state.source_corpus
+    return corpus
 
 
-def get_source_matching_service() -> SimpleSourceMatchingService:
-    """Get source matching service."""
-    logger.debug("Creating simple source matching service")
-    return SimpleSourceMatchingService()
+def get_ingestion_job_runner(request: Request) -> IngestionJobRunner:
+    """Get shared background ingestion job runner."""
+    runner: IngestionJobRunner = request.app.state.ingestion_jobs
+    return runner
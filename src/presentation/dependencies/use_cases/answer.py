@@ -15,7 +15,7 @@ from src.presentation.dependencies.repositories import (
     get_answer_repository,
 )
 from src.presentation.dependencies.services import (
-    get_anthropic_service,
+    get_llm_service,
 )
 
 logger = logging.getLogger(__name__)
@@ -25,7 +25,7 @@ def get_generate_answer_use_case(
     answer_repository: AnswerRepositoryInterface = Depends(
         get_answer_repository
     ),
-    llm_service: LLMServiceInterface = Depends(get_anthropic_service),
+    llm_service: LLMServiceInterface = Depends(get_llm_service),
 ) -> GenerateAnswerUseCase:
     """Get generate answer use case."""
     logger.debug("Creating GenerateAnswerUseCase")
@@ -10,20 +10,22 @@ from src.application.use_cases import (
 )
 from src.domain.repositories import (
     AnswerRepositoryInterface,
+    QuestionAnswerRepositoryInterface,
     QuestionRepositoryInterface,
-    SourceRepositoryInterface,
 )
 from src.domain.services import (
     LLMServiceInterface,
+    SourceCorpusServiceInterface,
     SourceMatchingServiceInterface,
 )
 from src.presentation.dependencies.repositories import (
     get_answer_repository,
+    get_question_answer_repository,
     get_question_repository,
-    get_source_repository,
 )
 from src.presentation.dependencies.services import (
-    get_anthropic_service,
+    get_llm_service,
+    get_source_corpus_service,
     get_source_matching_service,
 )
 
@@ -41,8 +43,8 @@ def get_create_question_use_case(
 
 
 def get_find_relevant_sources_use_case(
-    source_repository: SourceRepositoryInterface = Depends(
-        get_source_repository
+    source_corpus: SourceCorpusServiceInterface = Depends(
+        get_source_corpus_service
     ),
     source_matching_service: SourceMatchingServiceInterface = Depends(
         get_source_matching_service
@@ -51,7 +53,7 @@ def get_find_relevant_sources_use_case(
     """Get find relevant sources use case."""
     logger.debug("Creating FindRelevantSourcesUseCase")
     return FindRelevantSourcesUseCase(
-        source_repository=source_repository,
+        source_corpus=source_corpus,
         source_matching_service=source_matching_service,
     )
 
@@ -60,7 +62,7 @@ def get_generate_answer_use_case(
     answer_repository: AnswerRepositoryInterface = Depends(
         get_answer_repository
     ),
-    llm_service: LLMServiceInterface = Depends(get_anthropic_service),
+    llm_service: LLMServiceInterface = Depends(get_llm_service),
 ) -> GenerateAnswerUseCase:
     """Get generate answer use case."""
     logger.debug("Creating GenerateAnswerUseCase")
@@ -80,6 +82,9 @@ def get_ask_question_use_case(
     generate_answer_use_case: GenerateAnswerUseCase = Depends(
         get_generate_answer_use_case
     ),
+    question_answer_repository: QuestionAnswerRepositoryInterface = Depends(
+        get_question_answer_repository
+    ),
 ) -> AskQuestionUseCase:
     """Get ask question use case."""
     logger.debug("Creating AskQuestionUseCase")
@@ -87,4 +92,5 @@ def get_ask_question_use_case(
         create_question_use_case=create_question_use_case,
         find_relevant_sources_use_case=find_relevant_sources_use_case,
         generate_answer_use_case=generate_answer_use_case,
+        question_answer_repository=question_answer_repository,
     )
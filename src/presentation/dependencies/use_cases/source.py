@@ -3,10 +3,17 @@ import logging
 from fastapi import Depends
 
 from src.application.use_cases import LoadSourcesUseCase
+from src.core.config import get_settings
 from src.domain.repositories import SourceRepositoryInterface
-from src.domain.services import ContentParsingServiceInterface
+from src.domain.services import (
+    ContentParsingServiceInterface,
+    SourceCorpusServiceInterface,
+)
 from src.presentation.dependencies.repositories import get_source_repository
-from src.presentation.dependencies.services import get_content_parsing_service
+from src.presentation.dependencies.services import (
+    get_content_parsing_service,
+    get_source_corpus_service,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -18,10 +25,19 @@ def get_load_sources_use_case(
     content_parsing_service: ContentParsingServiceInterface = Depends(
         get_content_parsing_service
     ),
+    source_corpus: SourceCorpusServiceInterface = Depends(
+        get_source_corpus_service
+    ),
 ) -> LoadSourcesUseCase:
     """Get load sources use case."""
     logger.debug("Creating LoadSourcesUseCase")
+    settings = get_settings()
     return LoadSourcesUseCase(
         source_repository=source_repository,
         content_parsing_service=content_parsing_service,
+        source_corpus=source_corpus,
+        write_batch_size=settings.ingestion_write_batch_size,
+        queue_size=settings.ingestion_queue_size,
+        passage_size=settings.passage_size,
+        passage_overlap=settings.passage_overlap,
     )
@@ -1,3 +1,4 @@
+import math
 import traceback
 
 from fastapi import Request, status
@@ -10,6 +11,7 @@ from src.domain.exceptions import (
     ConflictError,
     DomainError,
     ForbiddenError,
+    LLMUnavailableError,
     NotFoundError,
     ValidationError,
 )
@@ -32,6 +34,7 @@ def unified_exception_handler(
         )
 
         # Определяем HTTP статус код на основе типа исключения
+        headers: dict[str, str] | None = None
         if isinstance(exc, ValidationError):
             status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
         elif isinstance(exc, NotFoundError):
@@ -40,6 +43,11 @@ def unified_exception_handler(
             status_code = status.HTTP_409_CONFLICT
         elif isinstance(exc, ForbiddenError):
             status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        elif isinstance(exc, LLMUnavailableError):
+            # Запрос отклонен при перегрузке LLM, клиент может повторить
+            status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+            if exc.retry_after is not None:
+                headers = {"Retry-After": str(math.ceil(exc.retry_after))}
         else:
             # Для остальных доменных ошибок используем 400
             status_code = status.HTTP_400_BAD_REQUEST
@@ -47,6 +55,7 @@ def unified_exception_handler(
         return JSONResponse(
             status_code=status_code,
             content=exc.to_dict(),
+            headers=headers,
         )
 
     # Ошибки валидации FastAPI
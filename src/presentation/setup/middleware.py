@@ -1,9 +1,12 @@
 from fastapi import FastAPI
 
+from src.core.middleware.deadline import deadline_middleware
 from src.core.middleware.logging import logging_middleware
 
 
 def setup_middleware(app: FastAPI) -> None:
     """Настройка middleware."""
+    # Дедлайн запроса, ограничивающий ожидание ответа LLM
+    app.middleware("http")(deadline_middleware)
     # Middleware для логирования
     app.middleware("http")(logging_middleware)
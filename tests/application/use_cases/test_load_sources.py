@@ -0,0 +1,60 @@
+"""Loading sources with conditional requests."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from src.application.use_cases.load_sources import LoadSourcesUseCase
+from src.domain.entities import Source
+from src.infrastructure.services.parser import HTTPContentParsingService
+from tests.conftest import FakeHTTPServer, FakeResponse, RecordedRequest
+from tests.fakes import InMemorySourceRepository
+
+pytestmark = pytest.mark.asyncio
+
+ETAG = '"v1"'
+
+
+def conditional_page(request: RecordedRequest) -> FakeResponse:
+    if request.headers.get("if-none-match") == ETAG:
+        return FakeResponse(status=304, headers={"ETag": ETAG})
+    return FakeResponse(
+        headers={"Content-Type": "text/html", "ETag": ETAG},
+        body=b"<html><head><title>Page</title></head>"
+        b"<body><p>Content</p></body></html>",
+    )
+
+
+async def test_not_modified_page_counts_as_unchanged(
+    http_server: FakeHTTPServer,
+    parsing_service: HTTPContentParsingService,
+) -> None:
+    http_server.route("/known", conditional_page)
+    http_server.route("/new", conditional_page)
+    known_url = http_server.url("/known")
+    new_url = http_server.url("/new")
+    repository = InMemorySourceRepository(
+        [
+            Source(
+                url=known_url,
+                title="Page",
+                content="Content",
+                created_at=datetime.now(UTC),
+                etag=ETAG,
+            )
+        ]
+    )
+    use_case = LoadSourcesUseCase(repository, parsing_service)
+
+    response = await use_case.execute([known_url, new_url])
+
+    assert response.unchanged_count == 1
+    assert response.created_count == 1
+    assert response.loaded_count == 2
+    assert response.parsed_count == 2
+    assert response.failed_count == 0
+    assert [source.url for source in response.sources] == [new_url]
+    # Неизмененная страница не передается на сохранение
+    assert repository.upserted == [new_url]
+    [request] = http_server.requests_to("/known")
+    assert request.headers["if-none-match"] == ETAG
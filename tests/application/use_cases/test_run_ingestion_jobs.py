@@ -0,0 +1,151 @@
+"""Leases of background ingestion jobs."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+import pytest
+
+from src.application.use_cases import IngestionJobRunner, LoadSourcesUseCase
+from src.domain.entities import IngestionJob, IngestionJobStatus, Source
+from src.infrastructure.services.parser import HTTPContentParsingService
+from tests.conftest import FakeHTTPServer, FakeResponse, RecordedRequest
+from tests.fakes import (
+    InMemoryIngestionJobRepository,
+    InMemorySourceRepository,
+)
+
+pytestmark = pytest.mark.asyncio
+
+ETAG = '"v1"'
+PAGE = b"<html><head><title>Page</title></head><body><p>Text</p></body></html>"
+
+
+def conditional_page(request: RecordedRequest) -> FakeResponse:
+    if request.headers.get("if-none-match") == ETAG:
+        return FakeResponse(status=304)
+    return FakeResponse(headers={"ETag": ETAG}, body=PAGE)
+
+
+def slow_page(_: RecordedRequest) -> FakeResponse:
+    return FakeResponse(body=PAGE, delay=0.2)
+
+
+def create_runner(
+    jobs: InMemoryIngestionJobRepository,
+    sources: InMemorySourceRepository,
+    parsing_service: HTTPContentParsingService,
+    lease_timeout: float = 60.0,
+) -> IngestionJobRunner:
+    @asynccontextmanager
+    async def job_repository() -> AsyncIterator[
+        InMemoryIngestionJobRepository
+    ]:
+        yield jobs
+
+    @asynccontextmanager
+    async def load_sources() -> AsyncIterator[LoadSourcesUseCase]:
+        yield LoadSourcesUseCase(sources, parsing_service)
+
+    return IngestionJobRunner(
+        job_repository, load_sources, batch_size=1, lease_timeout=lease_timeout
+    )
+
+
+async def wait_until_finished(
+    jobs: InMemoryIngestionJobRepository, *job_ids: UUID
+) -> None:
+    async with asyncio.timeout(5):
+        while not all(jobs.jobs[job_id].is_finished for job_id in job_ids):
+            await asyncio.sleep(0.01)
+
+
+async def test_resume_claims_only_jobs_with_expired_lease(
+    http_server: FakeHTTPServer,
+    parsing_service: HTTPContentParsingService,
+) -> None:
+    http_server.route("/known", conditional_page)
+    http_server.route("/new", conditional_page)
+    urls = [http_server.url("/known"), http_server.url("/new")]
+    now = datetime.now(UTC)
+    leased = IngestionJob(
+        urls=urls, created_at=now, owner="alive", heartbeat_at=now
+    )
+    expired = IngestionJob(
+        urls=urls,
+        created_at=now,
+        status=IngestionJobStatus.RUNNING,
+        owner="dead",
+        heartbeat_at=now - timedelta(minutes=5),
+    )
+    unleased = IngestionJob(urls=urls, created_at=now)
+    jobs = InMemoryIngestionJobRepository([leased, expired, unleased])
+    sources = InMemorySourceRepository(
+        [Source(url=urls[0], title="Page", content="Text", created_at=now)]
+    )
+    sources.sources[urls[0]] = replace(sources.sources[urls[0]], etag=ETAG)
+    runner = create_runner(jobs, sources, parsing_service)
+
+    resumed = await runner.resume_unfinished()
+    await wait_until_finished(jobs, expired.id, unleased.id)
+
+    assert resumed == 2
+    assert jobs.jobs[leased.id] == leased
+    for job_id in (expired.id, unleased.id):
+        job = jobs.jobs[job_id]
+        assert job.status is IngestionJobStatus.COMPLETED
+        assert job.owner == runner.owner
+        assert job.processed == 2
+        assert job.fetched == 2
+        # Неизмененная страница скачана, но не разобрана
+        assert job.parsed < job.fetched
+    await runner.close()
+
+
+async def test_lost_lease_stops_the_job(
+    http_server: FakeHTTPServer,
+    parsing_service: HTTPContentParsingService,
+) -> None:
+    http_server.route("/slow", slow_page)
+    jobs = InMemoryIngestionJobRepository()
+    runner = create_runner(
+        jobs, InMemorySourceRepository(), parsing_service, lease_timeout=0.3
+    )
+    job = await runner.submit([http_server.url("/slow")] * 20)
+
+    # Другой процесс забирает задачу, пока она выполняется
+    await asyncio.sleep(0.3)
+    jobs.jobs[job.id] = replace(jobs.jobs[job.id], owner="other")
+    await asyncio.sleep(0.5)
+    stolen = jobs.jobs[job.id]
+    requests = len(http_server.requests_to("/slow"))
+    await asyncio.sleep(0.5)
+
+    assert stolen.status is IngestionJobStatus.RUNNING
+    assert stolen.owner == "other"
+    assert len(http_server.requests_to("/slow")) == requests
+    assert jobs.jobs[job.id] == stolen
+    await runner.close()
+
+
+async def test_close_releases_unfinished_jobs(
+    http_server: FakeHTTPServer,
+    parsing_service: HTTPContentParsingService,
+) -> None:
+    http_server.route("/slow", slow_page)
+    jobs = InMemoryIngestionJobRepository()
+    runner = create_runner(jobs, InMemorySourceRepository(), parsing_service)
+    job = await runner.submit([http_server.url("/slow")] * 20)
+    await asyncio.sleep(0.1)
+
+    await runner.close()
+
+    released = jobs.jobs[job.id]
+    assert released.owner is None
+    assert released.heartbeat_at is None
+    # Освобожденную задачу сразу забирает следующий процесс
+    [claimed] = await jobs.claim_unfinished("next", 60.0)
+    assert claimed.id == job.id
@@ -0,0 +1,154 @@
+"""Shared fixtures."""
+
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import pytest_asyncio
+
+from src.infrastructure.services.parser import (
+    HTTPContentParsingService,
+    create_http_client,
+)
+
+
+@dataclass(frozen=True)
+class RecordedRequest:
+    """Request received by the fake server, header names lowercased."""
+
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: bytes
+    # Время получения по time.monotonic()
+    received_at: float
+
+
+@dataclass(frozen=True)
+class FakeResponse:
+    """Response the fake server sends, optionally after a delay."""
+
+    status: int = 200
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    delay: float = 0.0
+
+
+Handler = Callable[[RecordedRequest], FakeResponse]
+
+
+class FakeHTTPServer:
+    """Local HTTP server answering each path with a handler.
+
+    Requests are recorded in arrival order; unknown paths get 404.
+    """
+
+    def __init__(self) -> None:
+        self.requests: list[RecordedRequest] = []
+        self._handlers: dict[str, Handler] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), self._request_handler()
+        )
+        self._server.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    def route(self, path: str, handler: Handler) -> None:
+        self._handlers[path] = handler
+
+    def requests_to(self, path: str) -> list[RecordedRequest]:
+        with self._lock:
+            return [r for r in self.requests if r.path == path]
+
+    def start(self) -> None:
+        threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        ).start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handle(self, request: RecordedRequest) -> FakeResponse:
+        with self._lock:
+            self.requests.append(request)
+        handler = self._handlers.get(request.path)
+        if handler is None:
+            return FakeResponse(status=404)
+        return handler(request)
+
+    def _request_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                self._respond()
+
+            def do_POST(self) -> None:
+                self._respond()
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+            def _respond(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                response = server._handle(
+                    RecordedRequest(
+                        method=self.command,
+                        path=self.path,
+                        headers={
+                            name.lower(): value
+                            for name, value in self.headers.items()
+                        },
+                        body=self.rfile.read(length),
+                        received_at=time.monotonic(),
+                    )
+                )
+                if response.delay:
+                    time.sleep(response.delay)
+                try:
+                    self.send_response(response.status)
+                    for name, value in response.headers.items():
+                        self.send_header(name, value)
+                    if response.status != 304:
+                        self.send_header(
+                            "Content-Length", str(len(response.body))
+                        )
+                    self.end_headers()
+                    if response.status != 304:
+                        self.wfile.write(response.body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # Клиент отменил запрос, не дождавшись ответа
+                    pass
+
+        return RequestHandler
+
+
+@pytest.fixture
+def http_server() -> Iterator[FakeHTTPServer]:
+    server = FakeHTTPServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest_asyncio.fixture
+async def parsing_service() -> AsyncIterator[HTTPContentParsingService]:
+    client = create_http_client(
+        timeout=5.0,
+        max_connections=10,
+        max_keepalive_connections=5,
+        keepalive_expiry=5.0,
+    )
+    async with client:
+        yield HTTPContentParsingService(client, max_concurrency=4)
@@ -0,0 +1,18 @@
+"""Validation of search settings."""
+
+import pytest
+from pydantic import ValidationError
+
+from src.core.config.search import SearchSettings
+
+
+@pytest.mark.parametrize("overlap", [500, 600, 1000])
+def test_overlap_of_half_a_passage_is_rejected(overlap: int) -> None:
+    with pytest.raises(ValidationError, match="passage_overlap"):
+        SearchSettings(passage_size=1000, passage_overlap=overlap)
+
+
+def test_overlap_below_half_a_passage_is_accepted() -> None:
+    settings = SearchSettings(passage_size=1000, passage_overlap=499)
+
+    assert settings.passage_overlap == 499
@@ -0,0 +1,154 @@
+"""In-memory implementations of repositories."""
+
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from src.domain.entities import (
+    CacheValidators,
+    IngestionJob,
+    Source,
+    SourceUpsertResult,
+)
+from src.domain.exceptions import IngestionJobLeaseLostError
+from src.domain.repositories import (
+    IngestionJobRepositoryInterface,
+    SourceRepositoryInterface,
+)
+
+
+class InMemorySourceRepository(SourceRepositoryInterface):
+    """Source repository keeping sources in a dict by URL."""
+
+    def __init__(self, sources: list[Source] | None = None) -> None:
+        self.sources = {source.url: source for source in sources or []}
+        self.upserted: list[str] = []
+
+    async def get_by_id(self, source_id: UUID) -> Source | None:
+        return next(
+            (s for s in self.sources.values() if s.id == source_id), None
+        )
+
+    async def get_by_url(self, url: str) -> Source | None:
+        return self.sources.get(url)
+
+    async def get_all(self) -> list[Source]:
+        return list(self.sources.values())
+
+    async def search_passages(
+        self,
+        query: str,  # noqa: ARG002
+        limit: int,  # noqa: ARG002
+        passages_per_source: int,  # noqa: ARG002
+    ) -> list[Source]:
+        return []
+
+    async def get_fingerprint(self) -> tuple[int, datetime | None]:
+        return len(self.sources), None
+
+    async def get_cache_validators(
+        self, urls: list[str]
+    ) -> dict[str, CacheValidators]:
+        return {
+            url: CacheValidators(
+                etag=source.etag, last_modified=source.last_modified
+            )
+            for url in urls
+            if (source := self.sources.get(url)) is not None
+        }
+
+    async def create(self, source: Source) -> Source:
+        self.sources[source.url] = source
+        return source
+
+    async def create_or_update(self, source: Source) -> Source:
+        self.sources[source.url] = source
+        return source
+
+    async def bulk_upsert(
+        self,
+        sources: list[Source],
+        passages: dict[str, list[str]] | None = None,  # noqa: ARG002
+    ) -> SourceUpsertResult:
+        result = SourceUpsertResult()
+        for source in sources:
+            self.upserted.append(source.url)
+            stored = self.sources.get(source.url)
+            if stored is None:
+                result.created.append(source)
+            elif stored.content_hash == source.content_hash:
+                result.unchanged.append(source.url)
+                continue
+            else:
+                result.updated.append(source)
+            self.sources[source.url] = source
+        return result
+
+    async def update(self, source: Source) -> Source:
+        self.sources[source.url] = source
+        return source
+
+    async def delete(self, source_id: UUID) -> bool:
+        source = await self.get_by_id(source_id)
+        if source is None:
+            return False
+        del self.sources[source.url]
+        return True
+
+
+class InMemoryIngestionJobRepository(IngestionJobRepositoryInterface):
+    """Ingestion job repository with the lease rules of the real one."""
+
+    def __init__(self, jobs: list[IngestionJob] | None = None) -> None:
+        self.jobs = {job.id: job for job in jobs or []}
+
+    async def get_by_id(self, job_id: UUID) -> IngestionJob | None:
+        return self.jobs.get(job_id)
+
+    async def claim_unfinished(
+        self, owner: str, lease_timeout: float
+    ) -> list[IngestionJob]:
+        now = datetime.now(UTC)
+        expired_before = now - timedelta(seconds=lease_timeout)
+        claimed = []
+        for job in sorted(self.jobs.values(), key=lambda job: job.created_at):
+            if job.is_finished or (
+                job.heartbeat_at is not None
+                and job.heartbeat_at >= expired_before
+            ):
+                continue
+            job = self.jobs[job.id] = replace(
+                job, owner=owner, heartbeat_at=now
+            )
+            claimed.append(job)
+        return claimed
+
+    async def renew_lease(self, job_id: UUID, owner: str) -> bool:
+        job = self.jobs.get(job_id)
+        if job is None or job.owner != owner:
+            return False
+        self.jobs[job_id] = replace(job, heartbeat_at=datetime.now(UTC))
+        return True
+
+    async def release(self, owner: str) -> int:
+        released = [
+            job
+            for job in self.jobs.values()
+            if job.owner == owner and not job.is_finished
+        ]
+        for job in released:
+            self.jobs[job.id] = replace(job, owner=None, heartbeat_at=None)
+        return len(released)
+
+    async def create(self, job: IngestionJob) -> IngestionJob:
+        self.jobs[job.id] = job
+        return job
+
+    async def update(self, job: IngestionJob) -> IngestionJob:
+        stored = self.jobs.get(job.id)
+        if stored is None or stored.owner != job.owner:
+            raise IngestionJobLeaseLostError(
+                f"Ingestion job {job.id} is owned by another runner"
+            )
+        self.jobs[job.id] = replace(job, heartbeat_at=datetime.now(UTC))
+        return job
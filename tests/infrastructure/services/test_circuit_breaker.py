@@ -0,0 +1,97 @@
+"""Circuit breaker around the LLM."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+
+import pytest
+
+from src.domain.entities import LLMCompletion, Source
+from src.domain.exceptions import LLMServiceError
+from src.domain.services import LLMServiceInterface
+from src.infrastructure.services import (
+    CircuitBreaker,
+    CircuitBreakerLLMService,
+    is_provider_failure,
+)
+from src.infrastructure.services.circuit_breaker import CircuitState
+
+pytestmark = pytest.mark.asyncio
+
+SOURCES = [
+    Source(
+        url="https://eora.ru/cases/purina-master-bot",
+        title="Purina Master Bot",
+        content="Бот подбирает корм для питомца.",
+        created_at=datetime.now(UTC),
+    ),
+]
+
+
+class FailingLLMService(LLMServiceInterface):
+    """LLM service failing every call with the given error."""
+
+    def __init__(self, error: LLMServiceError) -> None:
+        self.error = error
+
+    async def generate_answer(self, question: str) -> LLMCompletion:  # noqa: ARG002
+        raise self.error
+
+    async def generate_answer_with_sources(
+        self,
+        question: str,  # noqa: ARG002
+        sources: list[Source],  # noqa: ARG002
+    ) -> LLMCompletion:
+        raise self.error
+
+    async def stream_answer(
+        self,
+        question: str,  # noqa: ARG002
+        sources: list[Source] | None = None,  # noqa: ARG002
+    ) -> AsyncIterator[str]:
+        # Генератор падает до первого фрагмента
+        chunks: tuple[str, ...] = ()
+        for chunk in chunks:
+            yield chunk
+        raise self.error
+
+
+def wrap(
+    error: LLMServiceError, circuit_breaker: CircuitBreaker
+) -> CircuitBreakerLLMService:
+    return CircuitBreakerLLMService(
+        FailingLLMService(error),
+        circuit_breaker,
+        is_failure=is_provider_failure,
+    )
+
+
+async def test_validation_errors_leave_circuit_closed() -> None:
+    circuit_breaker = CircuitBreaker(failure_threshold=2)
+    service = wrap(
+        LLMServiceError("Question cannot be empty"), circuit_breaker
+    )
+
+    for _ in range(5):
+        with pytest.raises(LLMServiceError, match="cannot be empty"):
+            await service.generate_answer_with_sources("", SOURCES)
+        with pytest.raises(LLMServiceError, match="cannot be empty"):
+            async for _chunk in service.stream_answer(""):
+                pass
+
+    assert circuit_breaker.state is CircuitState.CLOSED
+
+
+async def test_provider_failures_open_circuit() -> None:
+    circuit_breaker = CircuitBreaker(failure_threshold=2)
+    service = wrap(
+        LLMServiceError("Timed out", original_error=TimeoutError()),
+        circuit_breaker,
+    )
+
+    for _ in range(2):
+        completion = await service.generate_answer_with_sources(
+            "Что умеет бот?", SOURCES
+        )
+        assert SOURCES[0].url in completion.text
+
+    assert circuit_breaker.state is CircuitState.OPEN
@@ -0,0 +1,185 @@
+"""Extractive answers to navigational questions."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+
+import pytest
+
+from src.domain.entities import LLMCompletion, Source
+from src.domain.services import LLMServiceInterface
+from src.infrastructure.services.extractive_answer import (
+    ExtractiveLLMService,
+    is_navigational_query,
+)
+from src.infrastructure.services.source_matching import (
+    SimpleSourceMatchingService,
+)
+
+pytestmark = pytest.mark.asyncio
+
+LLM_ANSWER = "Ответ LLM"
+
+
+class RecordingLLMService(LLMServiceInterface):
+    """LLM service recording the questions it was asked."""
+
+    def __init__(self) -> None:
+        self.questions: list[str] = []
+
+    async def generate_answer(self, question: str) -> LLMCompletion:
+        self.questions.append(question)
+        return LLMCompletion(
+            text=LLM_ANSWER, prompt_tokens=1, response_tokens=1
+        )
+
+    async def generate_answer_with_sources(
+        self,
+        question: str,
+        sources: list[Source],  # noqa: ARG002
+    ) -> LLMCompletion:
+        return await self.generate_answer(question)
+
+    async def stream_answer(
+        self,
+        question: str,
+        sources: list[Source] | None = None,  # noqa: ARG002
+    ) -> AsyncIterator[str]:
+        self.questions.append(question)
+        yield LLM_ANSWER
+
+
+CORPUS = [
+    Source(
+        url="https://eora.ru/cases/chat-boty/hr-bot",
+        title="HR-бот для Магнита",
+        content="Чат-боты приглашают кандидатов на собеседование.",
+        created_at=datetime.now(UTC),
+    ),
+    Source(
+        url="https://eora.ru/cases/purina-master-bot",
+        title="Purina Master Bot",
+        content="Бот подбирает корм для питомца.",
+        created_at=datetime.now(UTC),
+    ),
+]
+
+
+@pytest.fixture
+def llm_service() -> RecordingLLMService:
+    return RecordingLLMService()
+
+
+@pytest.fixture
+def matching_service() -> SimpleSourceMatchingService:
+    return SimpleSourceMatchingService()
+
+
+async def ask(
+    question: str,
+    llm_service: RecordingLLMService,
+    matching_service: SimpleSourceMatchingService,
+) -> LLMCompletion:
+    sources = await matching_service.find_relevant_sources(question, CORPUS)
+    service = ExtractiveLLMService(llm_service, matching_service)
+    return await service.generate_answer_with_sources(question, sources)
+
+
+async def test_matched_lookup_is_answered_from_sources(
+    llm_service: RecordingLLMService,
+    matching_service: SimpleSourceMatchingService,
+) -> None:
+    completion = await ask(
+        "Есть ли у вас чат-боты?", llm_service, matching_service
+    )
+
+    assert completion.extractive
+    assert "https://eora.ru/cases/chat-boty/hr-bot" in completion.text
+    assert llm_service.questions == []
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "Покажите кейсы по квантовой криптографии",
+        "Есть ли у вас чат-боты на блокчейне?",
+    ],
+)
+async def test_off_topic_lookup_falls_through_to_llm(
+    question: str,
+    llm_service: RecordingLLMService,
+    matching_service: SimpleSourceMatchingService,
+) -> None:
+    completion = await ask(question, llm_service, matching_service)
+
+    assert not completion.extractive
+    assert completion.text == LLM_ANSWER
+    assert llm_service.questions == [question]
+
+
+async def test_navigational_verbs_do_not_lower_confidence(
+    matching_service: SimpleSourceMatchingService,
+) -> None:
+    question = "Покажите чат-боты"
+
+    confidence = matching_service.confidence(question, CORPUS)
+
+    assert confidence == 1.0
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "Покажите кейсы по ритейлу",
+        "Приведи примеры чат-ботов",
+        "Дайте ссылки на кейсы с LLM",
+        "Какие у вас есть кейсы с компьютерным зрением?",
+    ],
+)
+async def test_lookup_phrases_are_navigational(question: str) -> None:
+    assert is_navigational_query(question)
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "Какие технологии использовались в кейсе Purina?",
+        "Какой бюджет был у кейса с HR-ботом?",
+        "Что такое пример RAG?",
+    ],
+)
+async def test_factual_questions_about_case_fall_through_to_llm(
+    question: str,
+    llm_service: RecordingLLMService,
+    matching_service: SimpleSourceMatchingService,
+) -> None:
+    assert not is_navigational_query(question)
+
+    completion = await ask(question, llm_service, matching_service)
+
+    assert not completion.extractive
+    assert llm_service.questions == [question]
+
+
+async def test_navigational_words_still_drive_retrieval(
+    matching_service: SimpleSourceMatchingService,
+) -> None:
+    corpus = [
+        Source(
+            url="https://eora.ru/notes",
+            title="Заметки",
+            content="Заметки о проектах команды.",
+            created_at=datetime.now(UTC),
+        ),
+        Source(
+            url="https://eora.ru/todo",
+            title="Список дел",
+            content="Список задач на квартал.",
+            created_at=datetime.now(UTC),
+        ),
+    ]
+
+    sources = await matching_service.find_relevant_sources(
+        "Зачем нужен список?", corpus
+    )
+
+    assert [source.url for source in sources] == ["https://eora.ru/todo"]
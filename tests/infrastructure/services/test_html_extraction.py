@@ -0,0 +1,41 @@
+"""Parity of the HTML extraction backends."""
+
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.services.html_extraction import extract_page
+
+pytest.importorskip("lxml")
+
+CORPUS_DIR = Path(__file__).parents[2] / "fixtures" / "html_parity"
+CORPUS = sorted(CORPUS_DIR.glob("*.html"))
+URL = "https://eora.ru/cases/example"
+
+
+@pytest.mark.parametrize("page", CORPUS, ids=lambda page: page.stem)
+def test_lxml_backend_matches_html_parser(page: Path) -> None:
+    html = page.read_bytes()
+
+    assert extract_page(html, URL, "lxml") == extract_page(
+        html, URL, "html.parser"
+    )
+
+
+@pytest.mark.parametrize("backend", ["html.parser", "lxml"])
+@pytest.mark.parametrize(
+    ("page", "title"),
+    [
+        ("nested_title", "A B C"),
+        ("nested_title_deep", "Кейс для ритейла: рекомендации"),
+        ("entity_title", "Кейсы & решения «EORA» — AI!"),
+        ("escaped_markup_title", "Тег <b> в заголовке"),
+        ("commented_title", "Real"),
+        ("script_title_literal", "Real one & more"),
+        ("no_title", "/cases/example"),
+    ],
+)
+def test_title_is_text_content(backend: str, page: str, title: str) -> None:
+    html = (CORPUS_DIR / f"{page}.html").read_bytes()
+
+    assert extract_page(html, URL, backend).title == title
@@ -0,0 +1,87 @@
+"""Conditional requests of the HTTP parsing service."""
+
+import pytest
+
+from src.domain.entities import CacheValidators
+from src.infrastructure.services import parser
+from src.infrastructure.services.html_extraction import (
+    ExtractedPage,
+    extract_page,
+)
+from src.infrastructure.services.parser import HTTPContentParsingService
+from tests.conftest import FakeHTTPServer, FakeResponse, RecordedRequest
+
+pytestmark = pytest.mark.asyncio
+
+ETAG = '"v1"'
+LAST_MODIFIED = "Wed, 01 Oct 2025 10:00:00 GMT"
+PAGE = (
+    b"<html><head><title>Case</title></head>"
+    b"<body><p>Retail recommendations</p></body></html>"
+)
+
+
+def conditional_page(request: RecordedRequest) -> FakeResponse:
+    """Answer 304 when the client already has the current version."""
+    if request.headers.get("if-none-match") == ETAG:
+        return FakeResponse(status=304, headers={"ETag": ETAG})
+    return FakeResponse(
+        headers={
+            "Content-Type": "text/html; charset=utf-8",
+            "ETag": ETAG,
+            "Last-Modified": LAST_MODIFIED,
+        },
+        body=PAGE,
+    )
+
+
+@pytest.fixture
+def extracted_urls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """URLs whose HTML reached the extraction step."""
+    urls: list[str] = []
+
+    def spy(html: bytes, url: str, backend: str) -> ExtractedPage:
+        urls.append(url)
+        return extract_page(html, url, backend)
+
+    monkeypatch.setattr(parser, "extract_page", spy)
+    return urls
+
+
+async def test_first_download_stores_validators(
+    http_server: FakeHTTPServer,
+    parsing_service: HTTPContentParsingService,
+    extracted_urls: list[str],
+) -> None:
+    http_server.route("/case", conditional_page)
+    url = http_server.url("/case")
+
+    [result] = await parsing_service.parse_urls_detailed([url])
+
+    assert result.source is not None
+    assert result.source.etag == ETAG
+    assert result.source.last_modified == LAST_MODIFIED
+    assert extracted_urls == [url]
+    [request] = http_server.requests_to("/case")
+    assert "if-none-match" not in request.headers
+    assert "if-modified-since" not in request.headers
+
+
+async def test_not_modified_page_is_not_parsed(
+    http_server: FakeHTTPServer,
+    parsing_service: HTTPContentParsingService,
+    extracted_urls: list[str],
+) -> None:
+    http_server.route("/case", conditional_page)
+    url = http_server.url("/case")
+    validators = {url: CacheValidators(etag=ETAG, last_modified=LAST_MODIFIED)}
+
+    [result] = await parsing_service.parse_urls_detailed([url], validators)
+
+    assert result.not_modified
+    assert result.source is None
+    assert result.is_success
+    assert extracted_urls == []
+    [request] = http_server.requests_to("/case")
+    assert request.headers["if-none-match"] == ETAG
+    assert request.headers["if-modified-since"] == LAST_MODIFIED
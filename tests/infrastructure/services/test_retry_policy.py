@@ -0,0 +1,251 @@
+"""Retry policy of LLM calls against a fake Messages API."""
+
+import asyncio
+import itertools
+import json
+import threading
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from anthropic import (
+    AsyncAnthropic,
+    BadRequestError,
+    InternalServerError,
+    RateLimitError,
+)
+from anthropic.types import Message
+
+from src.core.deadline import reset_request_deadline, set_request_deadline
+from src.infrastructure.services.llm import (
+    is_retryable_error,
+    retry_after_seconds,
+)
+from src.infrastructure.services.retry_policy import RetryPolicy
+from tests.conftest import FakeHTTPServer, FakeResponse, Handler
+
+pytestmark = pytest.mark.asyncio
+
+MESSAGES_PATH = "/v1/messages"
+MESSAGE = {
+    "id": "msg_test",
+    "type": "message",
+    "role": "assistant",
+    "model": "claude-test",
+    "content": [{"type": "text", "text": "Ответ"}],
+    "stop_reason": "end_turn",
+    "stop_sequence": None,
+    "usage": {"input_tokens": 10, "output_tokens": 2},
+}
+OK = FakeResponse(
+    headers={"Content-Type": "application/json"},
+    body=json.dumps(MESSAGE).encode(),
+)
+
+
+def error(status: int, headers: dict[str, str] | None = None) -> FakeResponse:
+    body = {"type": "error", "error": {"type": "error", "message": "fail"}}
+    return FakeResponse(
+        status=status,
+        headers={"Content-Type": "application/json", **(headers or {})},
+        body=json.dumps(body).encode(),
+    )
+
+
+def slow(delay: float) -> FakeResponse:
+    return FakeResponse(headers=OK.headers, body=OK.body, delay=delay)
+
+
+def in_order(*responses: FakeResponse) -> Handler:
+    """Answer with the given responses, repeating the last one."""
+    pending = itertools.chain(responses, itertools.repeat(responses[-1]))
+    lock = threading.Lock()
+
+    def handler(_: object) -> FakeResponse:
+        with lock:
+            return next(pending)
+
+    return handler
+
+
+def create_policy(**overrides: Any) -> RetryPolicy:
+    options: dict[str, Any] = {
+        "max_attempts": 3,
+        "attempt_timeout": 5.0,
+        "total_timeout": 10.0,
+        "backoff_base": 0.01,
+        "backoff_max": 0.05,
+        "is_retryable": is_retryable_error,
+        "retry_after": retry_after_seconds,
+        **overrides,
+    }
+    return RetryPolicy(**options)
+
+
+@pytest_asyncio.fixture
+async def client(http_server: FakeHTTPServer) -> AsyncIterator[AsyncAnthropic]:
+    # Повторы делает только политика, как в приложении
+    client = AsyncAnthropic(
+        api_key="test", base_url=http_server.base_url, max_retries=0
+    )
+    async with client:
+        yield client
+
+
+async def create_message(client: AsyncAnthropic) -> Message:
+    return await client.messages.create(
+        model="claude-test",
+        max_tokens=16,
+        messages=[{"role": "user", "content": "Вопрос"}],
+    )
+
+
+def attempt_gaps(http_server: FakeHTTPServer) -> list[float]:
+    times = [r.received_at for r in http_server.requests_to(MESSAGES_PATH)]
+    return [later - earlier for earlier, later in itertools.pairwise(times)]
+
+
+@pytest.mark.parametrize(
+    ("headers", "delay"),
+    [({"retry-after-ms": "300"}, 0.3), ({"retry-after": "1"}, 1.0)],
+)
+async def test_rate_limit_waits_for_retry_after(
+    http_server: FakeHTTPServer,
+    client: AsyncAnthropic,
+    headers: dict[str, str],
+    delay: float,
+) -> None:
+    http_server.route(MESSAGES_PATH, in_order(error(429, headers), OK))
+
+    message = await create_policy().run(lambda: create_message(client))
+
+    assert message.id == "msg_test"
+    [gap] = attempt_gaps(http_server)
+    assert gap >= delay
+
+
+async def test_overloaded_api_is_retried(
+    http_server: FakeHTTPServer, client: AsyncAnthropic
+) -> None:
+    http_server.route(MESSAGES_PATH, in_order(error(529), error(529), OK))
+
+    message = await create_policy().run(lambda: create_message(client))
+
+    assert message.id == "msg_test"
+    assert len(http_server.requests_to(MESSAGES_PATH)) == 3
+
+
+async def test_server_errors_are_retried_up_to_max_attempts(
+    http_server: FakeHTTPServer, client: AsyncAnthropic
+) -> None:
+    http_server.route(MESSAGES_PATH, in_order(error(500)))
+
+    with pytest.raises(InternalServerError):
+        await create_policy(max_attempts=3).run(lambda: create_message(client))
+
+    assert len(http_server.requests_to(MESSAGES_PATH)) == 3
+
+
+async def test_bad_request_is_not_retried(
+    http_server: FakeHTTPServer, client: AsyncAnthropic
+) -> None:
+    http_server.route(MESSAGES_PATH, in_order(error(400), OK))
+
+    with pytest.raises(BadRequestError):
+        await create_policy().run(lambda: create_message(client))
+
+    assert len(http_server.requests_to(MESSAGES_PATH)) == 1
+
+
+async def test_retry_after_beyond_deadline_fails_at_once(
+    http_server: FakeHTTPServer, client: AsyncAnthropic
+) -> None:
+    http_server.route(
+        MESSAGES_PATH, in_order(error(429, {"retry-after": "30"}), OK)
+    )
+    policy = create_policy(total_timeout=2.0)
+
+    start = time.monotonic()
+    with pytest.raises(RateLimitError):
+        await policy.run(lambda: create_message(client))
+
+    assert time.monotonic() - start < 1.0
+    assert len(http_server.requests_to(MESSAGES_PATH)) == 1
+
+
+async def test_slow_attempt_times_out_and_is_retried(
+    http_server: FakeHTTPServer, client: AsyncAnthropic
+) -> None:
+    http_server.route(MESSAGES_PATH, in_order(slow(2.0), OK))
+    policy = create_policy(attempt_timeout=0.3)
+
+    start = time.monotonic()
+    message = await policy.run(lambda: create_message(client))
+
+    assert message.id == "msg_test"
+    assert 0.3 <= time.monotonic() - start < 1.5
+    assert len(http_server.requests_to(MESSAGES_PATH)) == 2
+
+
+async def test_total_timeout_stops_retries(
+    http_server: FakeHTTPServer, client: AsyncAnthropic
+) -> None:
+    http_server.route(MESSAGES_PATH, in_order(slow(2.0)))
+    policy = create_policy(attempt_timeout=0.3, total_timeout=0.5)
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        await policy.run(lambda: create_message(client))
+
+    assert time.monotonic() - start < 1.0
+    assert len(http_server.requests_to(MESSAGES_PATH)) == 2
+
+
+async def test_request_deadline_limits_all_attempts(
+    http_server: FakeHTTPServer, client: AsyncAnthropic
+) -> None:
+    http_server.route(MESSAGES_PATH, in_order(slow(2.0)))
+    policy = create_policy(attempt_timeout=5.0, total_timeout=10.0)
+
+    token = set_request_deadline(0.4)
+    start = time.monotonic()
+    try:
+        with pytest.raises(TimeoutError):
+            await policy.run(lambda: create_message(client))
+    finally:
+        reset_request_deadline(token)
+
+    assert time.monotonic() - start < 1.0
+    assert len(http_server.requests_to(MESSAGES_PATH)) == 1
+
+
+async def test_hedged_request_wins_and_slow_attempt_is_cancelled(
+    http_server: FakeHTTPServer, client: AsyncAnthropic
+) -> None:
+    # Первый вызов задает обычную задержку, второй зависает
+    http_server.route(MESSAGES_PATH, in_order(OK, slow(3.0), OK))
+    policy = create_policy(
+        hedging_enabled=True, hedge_quantile=1.0, hedge_min_samples=1
+    )
+    cancelled: list[int] = []
+    calls = itertools.count()
+
+    async def tracked_call() -> Message:
+        number = next(calls)
+        try:
+            return await create_message(client)
+        except asyncio.CancelledError:
+            cancelled.append(number)
+            raise
+
+    await policy.run(tracked_call)
+    start = time.monotonic()
+    message = await policy.run(tracked_call)
+
+    assert message.id == "msg_test"
+    assert time.monotonic() - start < 1.5
+    assert len(http_server.requests_to(MESSAGES_PATH)) == 3
+    # Проигравшая медленная попытка отменена, а не брошена
+    assert cancelled == [1]